@@ -16,14 +16,19 @@ from vlog_capture.infrastructure.observability import (
     systemd_notify,
 )
 from vlog_capture.infrastructure.repositories import FileRepository, SupabaseRepository
+from vlog_capture.infrastructure.session_queue import QueuedSession, SessionQueue
 from vlog_capture.infrastructure.settings import settings
 from vlog_capture.infrastructure.system import (
     AudioRecorder,
     ProcessMonitor,
-    Transcriber,
+    RecordingThreadError,
     TranscriptPreprocessor,
 )
-from vlog_capture.use_cases.process_recording import ProcessRecordingUseCase
+from vlog_capture.infrastructure.transcription_service import make_transcriber
+from vlog_capture.use_cases.process_recording import (
+    ProcessRecordingUseCase,
+    SegmentTranscriptionWorker,
+)
 
 logger = logging.getLogger(__name__)
 _AUDIO_RESOURCE = "audio-input:default"
@@ -32,11 +37,19 @@ _HEARTBEAT_LOG_INTERVAL_SECONDS = 300
 
 class Application:
     def __init__(self) -> None:
+        transcriber = make_transcriber()
         self._monitor = ProcessMonitor()
-        self._recorder = AudioRecorder()
+        self._rolling = (
+            SegmentTranscriptionWorker(transcriber)
+            if settings.rolling_transcription
+            else None
+        )
+        self._recorder = AudioRecorder(
+            on_segment=self._rolling.submit if self._rolling else None
+        )
         self._events = OperationalEventLog()
         self._use_case = ProcessRecordingUseCase(
-            transcriber=Transcriber(),
+            transcriber=transcriber,
             preprocessor=TranscriptPreprocessor(),
             summarizer=Summarizer(),
             storage=SupabaseRepository(),
@@ -45,7 +58,8 @@ class Application:
         self._active_file: str | None = None
         self._session_id: str | None = None
         self._session_started_at: datetime | None = None
-        self._processing_threads: set[threading.Thread] = set()
+        self._queue = SessionQueue()
+        self._workers: list[threading.Thread] = []
         self._next_recording_retry_at = 0.0
         self._last_heartbeat_at = 0.0
         self._last_heartbeat_log_at = 0.0
@@ -63,6 +77,7 @@ class Application:
             code="service_started",
             resource_id="vlog.service",
         )
+        self._start_workers()
         systemd_notify("READY=1", "WATCHDOG=1", "STATUS=VLog monitor loop ready")
         try:
             while True:
@@ -83,12 +98,11 @@ class Application:
                         error=exc,
                     )
                     # Repeated tick failures intentionally stop watchdog petting.
-                time.sleep(settings.check_interval)
+                time.sleep(self._monitor.next_interval())
         finally:
             systemd_notify("STOPPING=1", "STATUS=VLog monitor loop stopping")
 
     def _tick(self) -> None:
-        self._reap_processing_threads()
         try:
             running = self._monitor.is_running()
         except Exception as exc:
@@ -203,11 +217,15 @@ class Application:
         session_id = self._session_id
         path = self._active_file
         thread_error = self._recorder.last_error
+        started_at = self._session_started_at or datetime.now()
         cleanup_error: Exception | None = None
+        salvaged: tuple[str, ...] = ()
         try:
-            self._recorder.stop()
+            salvaged = self._recorder.stop() or ()
         except Exception as exc:
             cleanup_error = exc
+            if isinstance(exc, RecordingThreadError):
+                salvaged = exc.file_paths
             logger.exception("Recorder cleanup after thread death failed")
         self._events.emit(
             category="recording",
@@ -223,6 +241,7 @@ class Application:
             context={
                 "file": path,
                 "cleanup_error": str(cleanup_error) if cleanup_error else None,
+                "salvaged_files": list(salvaged),
             },
             error=thread_error,
         )
@@ -230,6 +249,15 @@ class Application:
         self._session_id = None
         self._session_started_at = None
         self._next_recording_retry_at = time.monotonic() + 30
+        if salvaged:
+            self._start_processing(
+                RecordingSession(
+                    file_paths=salvaged,
+                    start_time=started_at,
+                    end_time=datetime.now(),
+                ),
+                session_id,
+            )
 
     def _stop_recording(self) -> None:
         session_id = self._session_id
@@ -266,7 +294,10 @@ class Application:
                 error=exc,
                 context={"file": active_file},
             )
-            file_paths = None
+            # Segments closed before the failure are complete FLAC files.
+            file_paths = (
+                exc.file_paths if isinstance(exc, RecordingThreadError) else None
+            )
         finally:
             self._active_file = None
             self._session_id = None
@@ -319,19 +350,45 @@ class Application:
             session_id=session_id,
             context={"files": list(file_paths), "sizes": sizes},
         )
-        session = RecordingSession(
-            file_paths=file_paths,
-            start_time=start_time,
-            end_time=end_time,
+        self._start_processing(
+            RecordingSession(
+                file_paths=file_paths,
+                start_time=start_time,
+                end_time=end_time,
+            ),
+            session_id,
         )
-        worker = threading.Thread(
-            target=self._process_and_sync,
-            args=(session, session_id),
-            name=f"vlog-process-{session_id}",
-            daemon=False,
-        )
-        self._processing_threads.add(worker)
-        worker.start()
+
+    def _start_processing(
+        self, session: RecordingSession, session_id: str | None
+    ) -> None:
+        self._queue.put(session, session_id)
+
+    def _start_workers(self) -> None:
+        if self._queue.depth:
+            logger.info("Resuming %d queued session(s)", self._queue.depth)
+        # Daemon threads: an interrupted session stays queued and reruns on restart.
+        for index in range(max(1, settings.processing_workers)):
+            worker = threading.Thread(
+                target=self._process_queue,
+                name=f"vlog-process-{index}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _process_queue(self) -> None:
+        while True:
+            item = self._queue.claim()
+            if item is None:
+                continue
+            self._process_item(item)
+
+    def _process_item(self, item: QueuedSession) -> None:
+        try:
+            self._process_and_sync(item.session, item.session_id)
+        finally:
+            self._queue.done(item)
 
     def _process_and_sync(
         self, session: RecordingSession, session_id: str | None
@@ -350,6 +407,8 @@ class Application:
             context={"files": list(session.file_paths)},
         )
         try:
+            if self._rolling is not None:
+                self._rolling.wait_for(session.file_paths)
             processed = self._use_case.execute_session(session)
             if not processed:
                 self._events.emit(
@@ -453,11 +512,6 @@ class Application:
                 error=exc,
             )
 
-    def _reap_processing_threads(self) -> None:
-        self._processing_threads = {
-            thread for thread in self._processing_threads if thread.is_alive()
-        }
-
     def _heartbeat(self, status: str, *, vrchat_running: bool | None) -> None:
         now = time.monotonic()
         if now - self._last_heartbeat_at < 30:
@@ -467,7 +521,13 @@ class Application:
             "vrchat_running": vrchat_running,
             "recording": self._recorder.is_recording,
             "active_file": self._active_file,
-            "processing_threads": len(self._processing_threads),
+            "audio_buffer": self._recorder.stats(),
+            "processing_threads": self._queue.in_progress,
+            "processing_queue": {
+                "depth": self._queue.depth,
+                "oldest_age_seconds": self._queue.oldest_age_seconds(),
+            },
+            "rolling_segments_pending": self._rolling.pending if self._rolling else 0,
         }
         self._events.heartbeat(
             component="vlog-service",
@@ -13,6 +13,8 @@ from vlog_capture.cli_handlers import (
     cmd_record,
     cmd_summarize,
     cmd_transcribe,
+    cmd_transcribe_server,
+    cmd_transcript_cache,
 )
 from vlog_capture.secure_handlers import cmd_audit, cmd_notify, cmd_novel, cmd_sync
 
@@ -52,6 +54,9 @@ def main() -> None:
     )
     p_image_generate.add_argument("--novel-file", required=True)
     p_image_generate.add_argument("--output-file")
+    p_image_generate.add_argument(
+        "--seed", type=int, help="Override the stored seed for this image"
+    )
 
     p_manga = _command(subparsers, "manga", "Generate 4-koma manga", cmd_manga)
     p_manga.add_argument("--novel-file", required=True)
@@ -59,7 +64,32 @@ def main() -> None:
     p_transcribe = _command(
         subparsers, "transcribe", "Transcribe audio file", cmd_transcribe
     )
-    p_transcribe.add_argument("--file", required=True)
+    p_transcribe.add_argument(
+        "--file", action="append", default=[], help="Audio file; may be repeated"
+    )
+    p_transcribe.add_argument(
+        "--manifest", help="Text file with one audio path per line"
+    )
+    p_transcribe.add_argument("--date", help="Transcribe every recording of YYYYMMDD")
+
+    p_transcribe_server = _command(
+        subparsers,
+        "transcribe-server",
+        "Keep the Whisper model resident and serve transcription jobs",
+        cmd_transcribe_server,
+    )
+    p_transcribe_server.add_argument(
+        "--idle-seconds",
+        type=float,
+        help="Unload the model after this many idle seconds",
+    )
+
+    _command(
+        subparsers,
+        "transcript-cache",
+        "List transcripts made with another model or decoding setup",
+        cmd_transcript_cache,
+    )
 
     p_summarize = _command(
         subparsers, "summarize", "Summarize transcript", cmd_summarize
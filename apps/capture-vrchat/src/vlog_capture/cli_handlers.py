@@ -13,6 +13,8 @@ from vlog_capture.infrastructure.ai import (
     Novelizer,
     Summarizer,
 )
+from vlog_capture.infrastructure.ai_executor import AIExecutor
+from vlog_capture.infrastructure.artifact_index import settings_artifact_index
 from vlog_capture.infrastructure.daily_state import DailyStateStore
 from vlog_capture.infrastructure.error_log import ErrorLogRepository
 from vlog_capture.infrastructure.graph_storage import GraphStorage
@@ -28,10 +30,15 @@ from vlog_capture.infrastructure.system import (
     Transcriber,
     TranscriptPreprocessor,
 )
+from vlog_capture.infrastructure.transcript_cache import TranscriptCache
+from vlog_capture.infrastructure.transcription_service import (
+    TranscriptionServer,
+    make_transcriber,
+)
 from vlog_capture.portability import runtime_directories
 from vlog_capture.secure_handlers import cmd_sync as _cmd_strict_sync
 from vlog_capture.use_cases.build_novel import BuildNovelUseCase
-from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager
+from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager, SummaryJob
 from vlog_capture.use_cases.daily_workload import (
     collect_daily_workload,
     render_daily_workload,
@@ -76,7 +83,7 @@ def cmd_process(args: argparse.Namespace) -> None:
 
 def _cmd_process_logic(args: argparse.Namespace) -> None:
     use_case = ProcessRecordingUseCase(
-        transcriber=Transcriber(),
+        transcriber=make_transcriber(),
         preprocessor=TranscriptPreprocessor(),
         summarizer=Summarizer(),
         storage=SupabaseRepository(),
@@ -100,7 +107,7 @@ def _cmd_image_generate_logic(args: argparse.Namespace) -> None:
         else novel_path.parent / (novel_path.stem + ".png")
     )
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    ImageGenerator().generate_from_novel(novel_content, output_path)
+    ImageGenerator().generate_from_novel(novel_content, output_path, args.seed)
 
 
 def cmd_jules(args: argparse.Namespace) -> None:
@@ -118,9 +125,55 @@ def _cmd_jules_logic(args: argparse.Namespace) -> None:
 
 
 def cmd_transcribe(args: argparse.Namespace) -> None:
-    _harness_run(
-        "transcribe", TaskWeight.HEAVY, Transcriber().transcribe_and_save, args.file
-    )
+    files = _transcribe_targets(args)
+    if not files:
+        raise SystemExit("transcribe: no audio files given (--file/--manifest/--date)")
+    _harness_run("transcribe", TaskWeight.HEAVY, _cmd_transcribe_logic, files)
+
+
+def _transcribe_targets(args: argparse.Namespace) -> list[str]:
+    files = list(getattr(args, "file", None) or [])
+    if getattr(args, "manifest", None):
+        lines = Path(args.manifest).read_text(encoding="utf-8").splitlines()
+        files.extend(line.strip() for line in lines if line.strip())
+    if getattr(args, "date", None):
+        files.extend(
+            str(path)
+            for path in sorted(settings.recording_dir.glob(f"{args.date}*"))
+            if path.suffix.lower() in [".wav", ".flac", ".mp3"]
+        )
+    return list(dict.fromkeys(files))
+
+
+def _cmd_transcribe_logic(files: list[str]) -> None:
+    transcriber = make_transcriber()
+    failures: list[str] = []
+    try:
+        for audio_path in files:
+            try:
+                transcriber.transcribe_and_save(audio_path)
+            except Exception as exc:
+                # Keep going: every file has its own stage record downstream.
+                print(f"⚠️ transcribe failed for {audio_path} ({exc})")
+                failures.append(audio_path)
+    finally:
+        transcriber.unload()
+    if failures:
+        raise RuntimeError("Transcription failed for: " + ", ".join(failures))
+
+
+def cmd_transcribe_server(args: argparse.Namespace) -> None:
+    TranscriptionServer(idle_seconds=args.idle_seconds).serve_forever()
+
+
+def cmd_transcript_cache(args: argparse.Namespace) -> None:
+    del args
+    signature = Transcriber().signature
+    stale = TranscriptCache().stale(signature)
+    print(f"signature={signature}")
+    print(f"stale={len(stale)}")
+    for entry in stale:
+        print(f"  {entry.transcript} audio={entry.audio} signature={entry.signature}")
 
 
 def cmd_summarize(args: argparse.Namespace) -> None:
@@ -178,27 +231,10 @@ def _cmd_daily_logic(args: object) -> None:
 
 
 def _collect_pending_evaluation_dates(limit: int | None = None) -> list[str]:
-    summary_dir = settings.summary_dir
-    novel_dir = settings.novel_out_dir
-    evaluation_dir = runtime_directories().data / "evaluations"
-
-    summary_dates = {
-        match.group(1)
-        for path in summary_dir.glob("*_summary.txt")
-        if (match := re.search(r"(\d{8})", path.stem))
-    }
-    novel_dates = {
-        match.group(1)
-        for path in novel_dir.glob("*.md")
-        if (match := re.search(r"(\d{8})", path.stem))
-    }
-    evaluation_dates = {
-        match.group(1)
-        for path in evaluation_dir.glob("*.json")
-        if (match := re.search(r"(\d{8})", path.stem))
-    }
-
-    pending_dates = sorted((summary_dates & novel_dates) - evaluation_dates)
+    index = settings_artifact_index()
+    pending_dates = sorted(
+        (index.dates("summaries") & index.dates("novels")) - index.dates("evaluations")
+    )
     return pending_dates[:limit] if limit is not None else pending_dates
 
 
@@ -208,20 +244,18 @@ def cmd_pending(args: argparse.Namespace) -> None:
 
 
 def _cmd_pending_logic(args: argparse.Namespace, sync: bool = True) -> None:
-    transcript_dir = settings.transcript_dir
     summary_dir = settings.summary_dir
-    recording_dir = settings.recording_dir
     file_repo = FileRepository()
     manager = DailyArtifactManager(DailyStateStore())
 
+    index = settings_artifact_index()
     pending_transcription = [
         path
-        for path in recording_dir.glob("*")
-        if path.suffix.lower() in [".wav", ".flac", ".mp3"]
-        and not (transcript_dir / f"{path.stem}.txt").exists()
+        for path in index.paths("recordings")
+        if not index.has_stem("transcripts", path.stem)
     ]
     if pending_transcription:
-        transcriber = Transcriber()
+        transcriber = make_transcriber()
         preprocessor = TranscriptPreprocessor()
         for audio_path in pending_transcription:
             transcript, saved_path = transcriber.transcribe_and_save(str(audio_path))
@@ -232,37 +266,38 @@ def _cmd_pending_logic(args: argparse.Namespace, sync: bool = True) -> None:
             file_repo.save_text(cleaned_path, cleaned)
         transcriber.unload()
 
-    dates = sorted(
-        {
-            match.group(1)
-            for path in transcript_dir.glob("*.txt")
-            if (match := re.search(r"(\d{8})", path.stem))
-        }
-        | {
-            match.group(1)
-            for path in summary_dir.glob("*_summary.txt")
-            if (match := re.search(r"(\d{8})", path.stem))
-        }
-    )
+    dates = sorted(index.dates("transcripts") | index.dates("summaries"))
 
+    executor = AIExecutor()
     summarizer = Summarizer()
+    jobs = []
     for date_str in dates:
         files = manager.summary_sources_for_date(date_str)
-        manager.refresh_summary(date_str, summarizer, file_repo, source_paths=files)
-
-    import time
+        job = manager.plan_summary(date_str, source_paths=files)
+        if isinstance(job, SummaryJob):
+            jobs.append(job)
+    executor.run_ordered(
+        jobs,
+        lambda job: manager.generate_summary(job, summarizer),
+        lambda job, text: manager.commit_summary(job, text, file_repo),
+    )
 
     graph_storage = GraphStorage(runtime_directories().cache / "graph" / "graph.jsonl")
     extractor = ExtractGraphUseCase(graph_storage)
+    pending_graphs = []
     for date_str in dates:
         summary_path = summary_dir / f"{date_str}_summary.txt"
-        if summary_path.exists() and extractor.execute(summary_path) > 0:
-            time.sleep(4)
+        content = extractor.pending_text(summary_path)
+        if content is not None:
+            pending_graphs.append((summary_path, content))
+    executor.run_ordered(
+        pending_graphs,
+        lambda pending: extractor.extract(pending[1]),
+        lambda pending, triples: extractor.store(pending[0], triples),
+    )
 
     use_case = BuildNovelUseCase(Novelizer(), ImageGenerator(), graph_storage)
-    for date_str in dates:
-        if (summary_dir / f"{date_str}_summary.txt").exists():
-            use_case.execute(date_str)
+    use_case.execute_many(dates, executor)
 
     if sync:
         SupabaseRepository().sync()
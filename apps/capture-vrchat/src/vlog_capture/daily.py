@@ -3,11 +3,13 @@ from __future__ import annotations
 import json
 import os
 import subprocess
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Callable, Sequence
 from uuid import uuid4
 
+from vlog_capture.infrastructure.artifact_index import ArtifactIndex
 from vlog_capture.infrastructure.observability import (
     EventStatus,
     OperationalEventLog,
@@ -19,6 +21,13 @@ from vlog_capture.project import PROJECT_ROOT
 CommandRunner = Callable[[Sequence[str], dict[str, str], Path], None]
 
 
+@dataclass(frozen=True)
+class StageSpec:
+    task_name: str
+    components: list[str]
+    artifacts: list[Path]
+
+
 def _run_command(command: Sequence[str], env: dict[str, str], cwd: Path) -> None:
     subprocess.run(command, check=True, env=env, cwd=cwd)
 
@@ -51,6 +60,7 @@ class DailyPipeline:
             state_root
             or (self.project_root / "data" if explicit_project_root else runtime.state)
         ).resolve()
+        self.artifacts = ArtifactIndex.for_data_root(self.data_root)
         self.run_log = self.state_root / "daily_runs.jsonl"
         self.events = OperationalEventLog(self.state_root / "error_events.jsonl")
 
@@ -90,22 +100,33 @@ class DailyPipeline:
             env["VLOG_DAILY_VERIFIED"] = "0"
             dates = [date.today() - timedelta(days=1), date.today()]
 
-            for target in dates:
-                date_str = target.strftime("%Y%m%d")
-                for audio_path in self._recordings(date_str):
-                    transcript = (
-                        self.data_root / "transcripts" / f"{audio_path.stem}.txt"
-                    )
-                    self._stage(
-                        run_id,
-                        f"transcribe:{audio_path.stem}",
-                        ["transcriber"],
-                        [transcript],
-                        env,
-                        "transcribe",
-                        "--file",
-                        str(audio_path),
-                    )
+            recordings = [
+                audio_path
+                for target in dates
+                for audio_path in self._recordings(target.strftime("%Y%m%d"))
+            ]
+            if recordings:
+                # One CLI call keeps a single model session for every file while
+                # each recording still gets its own verified stage record.
+                self._stage_batch(
+                    run_id,
+                    "transcribe:batch",
+                    [
+                        StageSpec(
+                            f"transcribe:{audio_path.stem}",
+                            ["transcriber"],
+                            [self.data_root / "transcripts" / f"{audio_path.stem}.txt"],
+                        )
+                        for audio_path in recordings
+                    ],
+                    env,
+                    "transcribe",
+                    *(
+                        argument
+                        for audio_path in recordings
+                        for argument in ("--file", str(audio_path))
+                    ),
+                )
 
             for target in dates:
                 date_str = target.strftime("%Y%m%d")
@@ -237,93 +258,133 @@ class DailyPipeline:
     ) -> None:
         stage_env = dict(env)
         stage_env["VLOG_TASK_NAME"] = task_name
+        spec = StageSpec(task_name, components, artifacts)
+        self._stage_started(run_id, spec)
+        try:
+            self._cli(stage_env, *command_args)
+            self._stage_verified(run_id, spec)
+        except Exception as exc:
+            self._stage_failed(run_id, spec, exc)
+            raise
+
+    def _stage_batch(
+        self,
+        run_id: str,
+        batch_name: str,
+        specs: list[StageSpec],
+        env: dict[str, str],
+        *command_args: str,
+    ) -> None:
+        stage_env = dict(env)
+        stage_env["VLOG_TASK_NAME"] = batch_name
+        for spec in specs:
+            self._stage_started(run_id, spec)
+        command_error: Exception | None = None
+        try:
+            self._cli(stage_env, *command_args)
+        except Exception as exc:
+            command_error = exc
+        failures: list[Exception] = []
+        for spec in specs:
+            try:
+                self._stage_verified(run_id, spec)
+            except Exception as exc:
+                self._stage_failed(run_id, spec, command_error or exc)
+                failures.append(exc)
+        if command_error is not None:
+            raise command_error
+        if failures:
+            raise failures[0]
+
+    def _stage_started(self, run_id: str, spec: StageSpec) -> None:
+        self._log(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "run_id": run_id,
+                "task_name": spec.task_name,
+                "status": "try",
+                "expected_components": spec.components,
+            }
+        )
+        self.events.emit(
+            category=self._category_for(spec.task_name),
+            component="daily-pipeline",
+            operation=spec.task_name,
+            status=EventStatus.STARTED,
+            severity=Severity.INFO,
+            message=f"Daily stage started: {spec.task_name}",
+            code="daily_stage",
+            run_id=run_id,
+            resource_id=spec.task_name,
+            context={"expected_components": spec.components},
+        )
+
+    def _stage_verified(self, run_id: str, spec: StageSpec) -> None:
+        task_name = spec.task_name
         category = self._category_for(task_name)
+        artifact_states = {str(path): self._nonempty(path) for path in spec.artifacts}
+        if not all(artifact_states.values()):
+            missing = [path for path, ok in artifact_states.items() if not ok]
+            raise RuntimeError("Missing stage artifacts: " + ", ".join(missing))
         self._log(
             {
                 "timestamp": datetime.now().isoformat(),
                 "run_id": run_id,
                 "task_name": task_name,
-                "status": "try",
-                "expected_components": components,
+                "status": "success",
+                "expected_components": spec.components,
+                "completed_components": spec.components,
+                "verification": {"verified": True, "artifacts": artifact_states},
             }
         )
         self.events.emit(
             category=category,
             component="daily-pipeline",
             operation=task_name,
-            status=EventStatus.STARTED,
+            status=EventStatus.SUCCEEDED,
             severity=Severity.INFO,
-            message=f"Daily stage started: {task_name}",
+            message=f"Daily stage completed: {task_name}",
             code="daily_stage",
             run_id=run_id,
             resource_id=task_name,
-            context={"expected_components": components},
+            context={"artifacts": artifact_states},
+        )
+        self.events.recover_latest(
+            category=category,
+            component="daily-pipeline",
+            operation=task_name,
+            resource_id=task_name,
+            message=f"Daily stage recovered with verified artifacts: {task_name}",
+            code="daily_stage_recovered",
+            run_id=run_id,
+            context={"artifacts": artifact_states},
+        )
+
+    def _stage_failed(self, run_id: str, spec: StageSpec, exc: Exception) -> None:
+        self._log(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "run_id": run_id,
+                "task_name": spec.task_name,
+                "status": "failed",
+                "expected_components": spec.components,
+                "error": str(exc),
+            }
+        )
+        self.events.emit(
+            category=self._category_for(spec.task_name),
+            component="daily-pipeline",
+            operation=spec.task_name,
+            status=EventStatus.FAILED,
+            severity=Severity.ERROR,
+            message=f"Daily stage failed: {spec.task_name}",
+            code="daily_stage_failed",
+            run_id=run_id,
+            resource_id=spec.task_name,
+            retryable=True,
+            error=exc,
+            context={"expected_artifacts": [str(path) for path in spec.artifacts]},
         )
-        try:
-            self._cli(stage_env, *command_args)
-            artifact_states = {str(path): self._nonempty(path) for path in artifacts}
-            if not all(artifact_states.values()):
-                missing = [path for path, ok in artifact_states.items() if not ok]
-                raise RuntimeError("Missing stage artifacts: " + ", ".join(missing))
-            self._log(
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "run_id": run_id,
-                    "task_name": task_name,
-                    "status": "success",
-                    "expected_components": components,
-                    "completed_components": components,
-                    "verification": {"verified": True, "artifacts": artifact_states},
-                }
-            )
-            self.events.emit(
-                category=category,
-                component="daily-pipeline",
-                operation=task_name,
-                status=EventStatus.SUCCEEDED,
-                severity=Severity.INFO,
-                message=f"Daily stage completed: {task_name}",
-                code="daily_stage",
-                run_id=run_id,
-                resource_id=task_name,
-                context={"artifacts": artifact_states},
-            )
-            self.events.recover_latest(
-                category=category,
-                component="daily-pipeline",
-                operation=task_name,
-                resource_id=task_name,
-                message=f"Daily stage recovered with verified artifacts: {task_name}",
-                code="daily_stage_recovered",
-                run_id=run_id,
-                context={"artifacts": artifact_states},
-            )
-        except Exception as exc:
-            self._log(
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "run_id": run_id,
-                    "task_name": task_name,
-                    "status": "failed",
-                    "expected_components": components,
-                    "error": str(exc),
-                }
-            )
-            self.events.emit(
-                category=category,
-                component="daily-pipeline",
-                operation=task_name,
-                status=EventStatus.FAILED,
-                severity=Severity.ERROR,
-                message=f"Daily stage failed: {task_name}",
-                code="daily_stage_failed",
-                run_id=run_id,
-                resource_id=task_name,
-                retryable=True,
-                error=exc,
-                context={"expected_artifacts": [str(path) for path in artifacts]},
-            )
-            raise
 
     def _cli(self, env: dict[str, str], *args: str) -> None:
         runtime = runtime_directories()
@@ -340,17 +401,16 @@ class DailyPipeline:
         )
 
     def _recordings(self, date_str: str) -> list[Path]:
-        recording_dir = self.data_root / "recordings"
-        return sorted(
+        return [
             path
-            for suffix in ("wav", "flac", "mp3")
-            for path in recording_dir.glob(f"{date_str}*.{suffix}")
-        )
+            for path in self.artifacts.paths("recordings", date_str)
+            if path.name.startswith(date_str)
+        ]
 
     def _has_transcript(self, date_str: str) -> bool:
-        transcript_dir = self.data_root / "transcripts"
         return any(
-            self._nonempty(path) for path in transcript_dir.glob(f"*{date_str}*.txt")
+            self._nonempty(path)
+            for path in self.artifacts.paths("transcripts", date_str)
         )
 
     @staticmethod
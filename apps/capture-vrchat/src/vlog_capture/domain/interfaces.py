@@ -41,6 +41,9 @@ class StorageProtocol(Protocol):
 class FileRepositoryProtocol(Protocol):
     def exists(self, path: str) -> bool: ...
     def save_text(self, path: str, content: str) -> None: ...
+    def append_text(self, path: str, content: str) -> None: ...
+    def replace(self, source: str, target: str) -> None: ...
+    def delete(self, path: str) -> None: ...
     def archive(self, path: str) -> None: ...
 
 
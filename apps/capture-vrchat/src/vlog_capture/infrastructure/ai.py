@@ -1,25 +1,43 @@
 from __future__ import annotations
 
 import json
-import random
 import re
 import time
 from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Protocol, cast
 
+import psutil
 from vlog_capture.domain.entities import RecordingSession
+from vlog_capture.infrastructure.daily_state import fingerprint_text
+from vlog_capture.infrastructure.image_seeds import ImageSeedStore, derive_seed
+from vlog_capture.infrastructure.llm_cache import generate_text
+from vlog_capture.infrastructure.model_registry import model_registry
 from vlog_capture.infrastructure.observability import TraceLogger
 from vlog_capture.infrastructure.settings import settings
 
 
 def _genai() -> Any:
     """Load the provider SDK only when an AI operation actually runs."""
+    if settings.ai_provider == "fake":
+        from vlog_capture.infrastructure.fake_llm import FakeGenAI
+
+        return FakeGenAI()
+
     import google.generativeai as genai
 
     return genai
 
 
+def _parse_json_reply(text: str) -> Any:
+    if text.startswith("```json"):
+        text = text[7:-3]
+    elif text.startswith("```"):
+        text = text[3:-3]
+    return json.loads(text)
+
+
 class JulesClient:
     def __init__(self) -> None:
         j_key = settings.jules_api_key
@@ -40,21 +58,15 @@ class JulesClient:
 
     def parse_task(self, user_input: str) -> Dict[str, Any]:
         prompt = settings.prompts["jules"]["parse_task"].format(user_input=user_input)
-        start_time = time.time()
-        response = self._model.generate_content(prompt)
-        text = response.text.strip()
-        self._tracer.log(
+        text = generate_text(
+            self._model,
+            prompt,
+            model_name=settings.jules_model,
             component="jules_parse_task",
-            model=settings.jules_model,
-            start_time=start_time,
-            input_text=prompt,
-            output_text=text,
+            tracer=self._tracer,
+            validate=_parse_json_reply,
         )
-        if text.startswith("```json"):
-            text = text[7:-3]
-        elif text.startswith("```"):
-            text = text[3:-3]
-        return json.loads(text)
+        return _parse_json_reply(text)
 
     def chat(self, history: Iterable[Any], message: str) -> str:
         chat = self._model.start_chat(history=history)
@@ -73,17 +85,14 @@ class JulesClient:
     def generate_image_prompt(self, chapter_text: str) -> str:
         template = settings.prompts["jules"]["image_prompt"]
         prompt = template.format(chapter_text=chapter_text[:2000])
-        start_time = time.time()
-        response = self._model.generate_content(prompt)
-        text = response.text.strip() if response.parts else ""
-        self._tracer.log(
+        return generate_text(
+            self._model,
+            prompt,
+            model_name=settings.jules_model,
             component="jules_image_prompt",
-            model=settings.jules_model,
-            start_time=start_time,
-            input_text=prompt,
-            output_text=text,
+            tracer=self._tracer,
+            allow_empty=True,
         )
-        return text
 
 
 class ImagePipelineOutput(Protocol):
@@ -93,14 +102,31 @@ class ImagePipelineOutput(Protocol):
 ImagePipeline = Callable[..., ImagePipelineOutput]
 
 
+@dataclass(frozen=True)
+class ImageJob:
+    prompt: str
+    negative_prompt: str
+    output_path: Path
+    seed: int | None = None
+
+
 class ImageGenerator:
-    def __init__(self) -> None:
-        self._pipe: Any = None
+    def __init__(self, seeds: ImageSeedStore | None = None) -> None:
         self._tracer = TraceLogger()
+        self._seeds = seeds or ImageSeedStore()
 
-    def generate_from_novel(self, chapter_text: str, output_path: Path) -> None:
+    def generate_from_novel(
+        self, chapter_text: str, output_path: Path, seed: int | None = None
+    ) -> None:
         prompt, negative_prompt = self._extract_prompt(chapter_text)
-        self.generate(prompt, negative_prompt, output_path)
+        self.generate(prompt, negative_prompt, output_path, seed)
+
+    def generate_from_novels(self, chapters: Sequence[tuple[str, Path]]) -> None:
+        jobs = []
+        for chapter_text, output_path in chapters:
+            prompt, negative_prompt = self._extract_prompt(chapter_text)
+            jobs.append(ImageJob(prompt, negative_prompt, output_path))
+        self.generate_batch(jobs)
 
     def _extract_prompt(self, chapter_text: str) -> tuple[str, str]:
         match = re.search(r"\[IMAGE_PROMPT:\s*(.*?)\]", chapter_text, re.DOTALL)
@@ -122,6 +148,18 @@ class ImageGenerator:
         output_path: Path,
         seed: int | None = None,
     ) -> None:
+        self.generate_batch([ImageJob(prompt, negative_prompt, output_path, seed)])
+
+    def generate_batch(self, jobs: Sequence[ImageJob]) -> list[int]:
+        """Render ``jobs`` several per pipeline call and return their seeds.
+
+        Each image gets its own generator, so an image comes out the same
+        whether it is rendered alone or in a batch. Without an explicit seed,
+        a previously stored seed for the output stem is reused, or a stable one
+        is derived from ``image_seed``.
+        """
+        if not jobs:
+            return []
         import torch
         from diffusers import DiffusionPipeline
 
@@ -129,91 +167,179 @@ class ImageGenerator:
         if device.startswith("cuda") and not torch.cuda.is_available():
             device = "cpu"
 
-        if not self._pipe:
+        def load() -> Any:
             pipeline_kwargs: dict[str, Any] = {
                 "torch_dtype": torch.bfloat16 if device != "cpu" else torch.float32,
                 "use_safetensors": True,
             }
             if device != "cpu":
                 pipeline_kwargs["device_map"] = "balanced"
-            self._pipe = DiffusionPipeline.from_pretrained(
+            pipe = DiffusionPipeline.from_pretrained(
                 settings.image_model, **pipeline_kwargs
             )
             if device == "cpu":
-                self._pipe.to(device)
-        if seed is None:
-            seed = random.randint(0, 2**32 - 1)
-        generator = torch.Generator(device).manual_seed(seed)
-        prompt_path = settings.photo_prompt_dir / f"{output_path.stem}.txt"
-        prompt_path.parent.mkdir(parents=True, exist_ok=True)
-        prompt_path.write_text(
-            f"Prompt:\n{prompt}\n\nNegative Prompt:\n{negative_prompt}",
-            encoding="utf-8",
-        )
-        start_time = time.time()
-        image = cast(ImagePipeline, self._pipe)(
-            prompt=prompt,
-            negative_prompt=negative_prompt,
-            height=settings.image_height,
-            width=settings.image_width,
-            num_inference_steps=settings.image_num_inference_steps,
-            guidance_scale=settings.image_guidance_scale,
-            generator=generator,
-        ).images[0]
-        self._tracer.log(
-            component="image_generator",
-            model=settings.image_model,
-            start_time=start_time,
-            input_text=prompt,
-            output_text=f"Saved to {output_path}",
-            metadata={"seed": seed, "negative_prompt": negative_prompt},
+                pipe.to(device)
+            return pipe
+
+        pipe = model_registry.get(
+            f"diffusion:{settings.image_model}:{device}",
+            load,
+            nbytes=settings.image_model_memory_mb * 1024 * 1024,
+            device=device,
         )
-        image.save(output_path)
+        seeds = [self._seed_for(job) for job in jobs]
+        size = _image_batch_size(torch, device)
+        for first in range(0, len(jobs), size):
+            batch = jobs[first : first + size]
+            batch_seeds = seeds[first : first + size]
+            for job in batch:
+                prompt_path = settings.photo_prompt_dir / f"{job.output_path.stem}.txt"
+                prompt_path.parent.mkdir(parents=True, exist_ok=True)
+                prompt_path.write_text(
+                    f"Prompt:\n{job.prompt}\n\nNegative Prompt:\n{job.negative_prompt}",
+                    encoding="utf-8",
+                )
+            start_time = time.time()
+            images = cast(ImagePipeline, pipe)(
+                prompt=[job.prompt for job in batch],
+                negative_prompt=[job.negative_prompt for job in batch],
+                height=settings.image_height,
+                width=settings.image_width,
+                num_inference_steps=settings.image_num_inference_steps,
+                guidance_scale=settings.image_guidance_scale,
+                generator=[
+                    torch.Generator(device).manual_seed(seed) for seed in batch_seeds
+                ],
+            ).images
+            for job, seed, image in zip(batch, batch_seeds, images):
+                self._tracer.log(
+                    component="image_generator",
+                    model=settings.image_model,
+                    start_time=start_time,
+                    input_text=job.prompt,
+                    output_text=f"Saved to {job.output_path}",
+                    metadata={
+                        "seed": seed,
+                        "negative_prompt": job.negative_prompt,
+                        "batch_size": len(batch),
+                    },
+                )
+                image.save(job.output_path)
+            self._seeds.put_many(
+                {job.output_path.stem: seed for job, seed in zip(batch, batch_seeds)}
+            )
+        return seeds
+
+    def _seed_for(self, job: ImageJob) -> int:
+        if job.seed is not None:
+            return job.seed
+        stored = self._seeds.get(job.output_path.stem)
+        if stored is not None:
+            return stored
+        return derive_seed(settings.image_seed, job.output_path.stem)
+
+
+def _image_batch_size(torch: Any, device: str) -> int:
+    if settings.image_batch_size > 0:
+        return settings.image_batch_size
+    per_image = settings.image_batch_memory_mb * 1024 * 1024
+    if device != "cpu":
+        free, _ = torch.cuda.mem_get_info()
+    else:
+        free = psutil.virtual_memory().available
+    return max(1, min(settings.image_max_batch_size, free // per_image))
 
 
 class Novelizer:
     def __init__(self) -> None:
         self._model = None
         self._prompt_template = settings.prompts["novelizer"]["template"]
+        self._synopsis_template = settings.prompts["novelizer"]["synopsis_template"]
         self._tracer = TraceLogger()
 
+    @property
+    def synopsis_signature(self) -> str:
+        """Identifies the model and prompt that produced a cached synopsis."""
+        return f"{settings.novel_model}:{fingerprint_text(self._synopsis_template)}"
+
+    def update_synopsis(self, synopsis: str, chapter: str) -> str:
+        """Fold one more chapter into the running synopsis of the novel."""
+        self._ensure_model()
+        prompt = self._synopsis_template.format(
+            synopsis=synopsis or "（まだありません）",
+            chapter=chapter,
+            max_chars=settings.novel_synopsis_chars,
+        )
+        return generate_text(
+            self._model,
+            prompt,
+            model_name=settings.novel_model,
+            component="novelizer_synopsis",
+            tracer=self._tracer,
+        )
+
+    def _ensure_model(self) -> None:
+        if not self._model:
+            sdk = _genai()
+            sdk.configure(api_key=settings.gemini_api_key)
+            self._model = sdk.GenerativeModel(settings.novel_model)
+
     def generate_chapter(
         self,
         today_summary: str,
         novel_so_far: str = "",
         context: str = "",
     ) -> str:
-        if not self._model:
-            sdk = _genai()
-            sdk.configure(api_key=settings.gemini_api_key)
-            self._model = sdk.GenerativeModel(settings.novel_model)
+        self._ensure_model()
         prompt = self._prompt_template.format(
             novel_so_far=novel_so_far,
             today_summary=today_summary,
             context=context,
         )
-        start_time = time.time()
-        response = self._model.generate_content(
+        return generate_text(
+            self._model,
             prompt,
-            generation_config={"max_output_tokens": settings.novel_max_output_tokens},
-        )
-        text = response.text.strip()
-        self._tracer.log(
+            model_name=settings.novel_model,
             component="novelizer",
-            model=settings.novel_model,
-            start_time=start_time,
-            input_text=prompt,
-            output_text=text,
+            tracer=self._tracer,
+            generation_config={"max_output_tokens": settings.novel_max_output_tokens},
+            metadata={
+                "novel_so_far_chars": len(novel_so_far),
+                "context_chars": len(context),
+            },
         )
-        return text
 
 
 class Summarizer:
     def __init__(self) -> None:
         self._model = None
         self._prompt_template = settings.prompts["summarizer"]["template"]
+        self._session_template = settings.prompts["summarizer"]["session_template"]
         self._tracer = TraceLogger()
 
+    @property
+    def chunk_signature(self) -> str:
+        """Identifies the model and prompt that produced cached session notes."""
+        return f"{settings.gemini_model}:{fingerprint_text(self._session_template)}"
+
+    def summarize_chunk(self, transcript: str) -> str:
+        """Condense one session transcript (or chunk of it) into notes."""
+        self._ensure_model()
+        prompt = self._session_template.format(transcript=transcript.strip())
+        return generate_text(
+            self._model,
+            prompt,
+            model_name=settings.gemini_model,
+            component="summarizer_chunk",
+            tracer=self._tracer,
+        )
+
+    def _ensure_model(self) -> None:
+        if not self._model:
+            sdk = _genai()
+            sdk.configure(api_key=settings.gemini_api_key)
+            self._model = sdk.GenerativeModel(settings.gemini_model)
+
     def summarize(
         self,
         transcript: str,
@@ -222,10 +348,7 @@ class Summarizer:
         start_time_str: str | None = None,
         end_time_str: str | None = None,
     ) -> str:
-        if not self._model:
-            sdk = _genai()
-            sdk.configure(api_key=settings.gemini_api_key)
-            self._model = sdk.GenerativeModel(settings.gemini_model)
+        self._ensure_model()
         if session:
             d = session.start_time.strftime("%Y-%m-%d")
             s = session.start_time.strftime("%H:%M")
@@ -240,17 +363,13 @@ class Summarizer:
             end_time=e,
             transcript=transcript.strip(),
         )
-        start_time = time.time()
-        response = self._model.generate_content(prompt)
-        text = response.text.strip()
-        self._tracer.log(
+        return generate_text(
+            self._model,
+            prompt,
+            model_name=settings.gemini_model,
             component="summarizer",
-            model=settings.gemini_model,
-            start_time=start_time,
-            input_text=prompt,
-            output_text=text,
+            tracer=self._tracer,
         )
-        return text
 
 
 class Curator:
@@ -265,21 +384,15 @@ class Curator:
             sdk.configure(api_key=settings.gemini_api_key)
             self._model = sdk.GenerativeModel(settings.jules_model)
         prompt = self._prompt_template.format(summary=summary, novel=novel)
-        start_time = time.time()
-        response = self._model.generate_content(prompt)
-        text = response.text.strip()
-        self._tracer.log(
+        text = generate_text(
+            self._model,
+            prompt,
+            model_name=settings.jules_model,
             component="curator_evaluate",
-            model=settings.jules_model,
-            start_time=start_time,
-            input_text=prompt,
-            output_text=text,
+            tracer=self._tracer,
+            validate=_parse_json_reply,
         )
-        if text.startswith("```json"):
-            text = text[7:-3]
-        elif text.startswith("```"):
-            text = text[3:-3]
-        return json.loads(text)
+        return _parse_json_reply(text)
 
 
 class MangaScriptGenerator:
@@ -295,18 +408,12 @@ class MangaScriptGenerator:
             sdk.configure(api_key=settings.gemini_api_key)
             self._model = sdk.GenerativeModel(target_model)
         prompt = self._prompt_template.format(novel_text=novel_text)
-        start_time = time.time()
-        response = self._model.generate_content(prompt)
-        text = response.text.strip()
-        self._tracer.log(
+        text = generate_text(
+            self._model,
+            prompt,
+            model_name=target_model,
             component="manga_script",
-            model=target_model,
-            start_time=start_time,
-            input_text=prompt,
-            output_text=text,
+            tracer=self._tracer,
+            validate=_parse_json_reply,
         )
-        if text.startswith("```json"):
-            text = text[7:-3]
-        elif text.startswith("```"):
-            text = text[3:-3]
-        return json.loads(text)
+        return _parse_json_reply(text)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from vlog_capture.infrastructure.settings import settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """Allow ``rate`` acquisitions per second, in bursts of up to ``capacity``.
+
+    A non-positive rate disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock: asyncio.Lock | None = None
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = self._clock()
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AIExecutor:
+    """Fan blocking AI calls out over threads from an asyncio loop.
+
+    At most ``concurrency`` calls run at once, starts are paced by a token
+    bucket of ``requests_per_minute``, and each call fails with
+    ``TimeoutError`` after ``deadline_seconds``. The provider SDK cannot be
+    interrupted, so a timed-out call finishes in the background and its
+    result is discarded.
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        requests_per_minute: float | None = None,
+        deadline_seconds: float | None = None,
+        burst: int | None = None,
+    ) -> None:
+        self.concurrency = max(1, concurrency or settings.ai_concurrency)
+        self.requests_per_minute = (
+            settings.ai_requests_per_minute
+            if requests_per_minute is None
+            else requests_per_minute
+        )
+        deadline = (
+            settings.ai_deadline_seconds
+            if deadline_seconds is None
+            else deadline_seconds
+        )
+        self.deadline_seconds = deadline if deadline and deadline > 0 else None
+        self.burst = burst or self.concurrency
+
+    def run_one(self, item: T, work: Callable[[T], R]) -> R:
+        """Run a single call under the deadline, without the loop and pools.
+
+        For callers whose calls depend on each other and so run one at a time;
+        concurrency and pacing do not apply.
+        """
+        if self.deadline_seconds is None:
+            return work(item)
+        pool = ThreadPoolExecutor(1, thread_name_prefix="ai-executor")
+        try:
+            return pool.submit(work, item).result(timeout=self.deadline_seconds)
+        finally:
+            pool.shutdown(wait=False)
+
+    def run_ordered(
+        self,
+        items: Sequence[T],
+        work: Callable[[T], R],
+        commit: Callable[[T, R], object] | None = None,
+    ) -> list[R]:
+        """Run ``work`` over ``items`` concurrently; ``commit`` results in order.
+
+        ``commit`` runs on one committer thread for each item as soon as it and
+        every earlier item are done, so state writes keep the input order
+        without stalling the loop that starts and times the other calls. The
+        first failure is raised at its position and outstanding work is
+        cancelled.
+        """
+        return asyncio.run(self._run_ordered(items, work, commit))
+
+    async def _run_ordered(
+        self,
+        items: Sequence[T],
+        work: Callable[[T], R],
+        commit: Callable[[T, R], object] | None,
+    ) -> list[R]:
+        loop = asyncio.get_running_loop()
+        # The loop's default pool may be smaller than the concurrency limit.
+        pool = ThreadPoolExecutor(self.concurrency, thread_name_prefix="ai-executor")
+        committer = ThreadPoolExecutor(1, thread_name_prefix="ai-commit")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        bucket = TokenBucket(self.requests_per_minute / 60, self.burst)
+
+        async def run(item: T) -> R:
+            async with semaphore:
+                await bucket.acquire()
+                return await asyncio.wait_for(
+                    loop.run_in_executor(pool, work, item), self.deadline_seconds
+                )
+
+        tasks = [asyncio.create_task(run(item)) for item in items]
+        results = []
+        try:
+            for item, task in zip(items, tasks):
+                result = await task
+                if commit is not None:
+                    await loop.run_in_executor(committer, commit, item, result)
+                results.append(result)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            pool.shutdown(wait=False, cancel_futures=True)
+            committer.shutdown()
+        return results
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, ClassVar, Mapping
+
+_DATE = re.compile(r"(\d{8})")
+AUDIO_SUFFIXES = frozenset({".wav", ".flac", ".mp3"})
+# A directory changed this recently may change again within the same mtime tick.
+_SETTLE_NS = 2_000_000_000
+
+_KIND_FILTERS: dict[str, Callable[[str], bool]] = {
+    "recordings": lambda name: os.path.splitext(name)[1].lower() in AUDIO_SUFFIXES,
+    "transcripts": lambda name: name.endswith(".txt"),
+    "summaries": lambda name: name.endswith("_summary.txt"),
+    "novels": lambda name: name.endswith(".md"),
+    "photos": lambda name: name.endswith(".png"),
+    "evaluations": lambda name: name.endswith(".json"),
+}
+KINDS = tuple(_KIND_FILTERS)
+
+
+@dataclass(frozen=True)
+class _Listing:
+    signature: tuple[int, int] | None
+    names: frozenset[str]
+    stems: frozenset[str]
+    by_date: Mapping[str, tuple[str, ...]]
+
+
+class ArtifactIndex:
+    """Date-keyed listing of the recording and generated-artifact directories.
+
+    Each directory is listed once and relisted only when its mtime or inode
+    changes, so repeated questions cost one ``stat`` per directory. Files are
+    dated by the first eight-digit run in their stem.
+    """
+
+    _shared: ClassVar[dict[tuple[tuple[str, Path], ...], ArtifactIndex]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, directories: Mapping[str, Path]) -> None:
+        unknown = set(directories) - set(_KIND_FILTERS)
+        if unknown:
+            raise ValueError(f"unknown artifact kinds: {sorted(unknown)}")
+        self._directories = dict(directories)
+        self._listings: dict[str, _Listing] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, directories: Mapping[str, Path]) -> ArtifactIndex:
+        key = tuple(sorted((kind, Path(path)) for kind, path in directories.items()))
+        with cls._shared_lock:
+            index = cls._shared.get(key)
+            if index is None:
+                index = cls._shared[key] = cls(dict(key))
+        return index
+
+    @classmethod
+    def for_data_root(cls, data_root: Path) -> ArtifactIndex:
+        return cls.shared({kind: data_root / kind for kind in KINDS})
+
+    def directory(self, kind: str) -> Path:
+        return self._directories[kind]
+
+    def dates(self, kind: str) -> set[str]:
+        return set(self._listing(kind).by_date)
+
+    def dates_without(self, kind: str, missing: str) -> list[str]:
+        """Dates that have ``kind`` artifacts but no ``missing`` ones, in order."""
+        return sorted(self.dates(kind) - self.dates(missing))
+
+    def paths(self, kind: str, date_str: str | None = None) -> list[Path]:
+        listing = self._listing(kind)
+        names = (
+            sorted(listing.names)
+            if date_str is None
+            else listing.by_date.get(date_str, ())
+        )
+        directory = self._directories[kind]
+        return [directory / name for name in names]
+
+    def has_stem(self, kind: str, stem: str) -> bool:
+        return stem in self._listing(kind).stems
+
+    def _listing(self, kind: str) -> _Listing:
+        directory = self._directories[kind]
+        signature = _signature(directory)
+        with self._lock:
+            listing = self._listings.get(kind)
+            if (
+                listing is not None
+                and signature is not None
+                and listing.signature == signature
+            ):
+                return listing
+        listing = _scan(directory, _KIND_FILTERS[kind], signature)
+        with self._lock:
+            self._listings[kind] = listing
+        return listing
+
+
+def settings_artifact_index() -> ArtifactIndex:
+    # Imported here so the daily scheduler can use the index without settings.
+    from vlog_capture.infrastructure.settings import settings
+
+    return ArtifactIndex.shared(
+        {
+            "recordings": settings.recording_dir,
+            "transcripts": settings.transcript_dir,
+            "summaries": settings.summary_dir,
+            "novels": settings.novel_out_dir,
+            "photos": settings.photo_dir,
+            "evaluations": settings.summary_dir.parent / "evaluations",
+        }
+    )
+
+
+def _signature(directory: Path) -> tuple[int, int] | None:
+    try:
+        stat = directory.stat()
+    except OSError:
+        return None
+    if time.time_ns() - stat.st_mtime_ns < _SETTLE_NS:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def _scan(
+    directory: Path, accept: Callable[[str], bool], signature: tuple[int, int] | None
+) -> _Listing:
+    try:
+        with os.scandir(directory) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if accept(entry.name) and entry.is_file()
+            )
+    except OSError:
+        names = []
+    stems = []
+    by_date: dict[str, list[str]] = {}
+    for name in names:
+        stem = os.path.splitext(name)[0]
+        stems.append(stem)
+        match = _DATE.search(stem)
+        if match:
+            by_date.setdefault(match.group(1), []).append(name)
+    return _Listing(
+        signature=signature,
+        names=frozenset(names),
+        stems=frozenset(stems),
+        by_date={date: tuple(items) for date, items in by_date.items()},
+    )
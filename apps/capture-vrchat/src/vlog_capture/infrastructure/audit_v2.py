@@ -222,7 +222,8 @@ class StrictRunAuditor:
                 details="sync report is not verified for this run",
                 source=str(path),
             )
-        if int(report.get("total", 0)) <= 0:
+        # Unchanged rows were verified by the run that pushed them.
+        if int(report.get("total", 0)) + int(report.get("unchanged", 0)) <= 0:
             return AuditFinding(
                 "sync-report",
                 AuditState.FAIL,
@@ -234,7 +235,10 @@ class StrictRunAuditor:
             "sync-report",
             AuditState.PASS,
             str(path),
-            details=f"verified rows={report['total']}",
+            details=(
+                f"verified rows={report['total']}; "
+                f"unchanged={report.get('unchanged', 0)}"
+            ),
             source=str(path),
         )
 
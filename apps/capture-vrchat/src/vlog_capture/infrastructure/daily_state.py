@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import copy
 import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cached_property
 from hashlib import sha256
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, ClassVar, Iterable, Iterator
 
+from vlog_capture.infrastructure.artifact_index import settings_artifact_index
 from vlog_capture.infrastructure.settings import settings
 from vlog_capture.project import PROJECT_ROOT
 
 _PROJECT_ROOT = PROJECT_ROOT
 DEFAULT_STATE_PATH = _PROJECT_ROOT / "data" / "daily_state.json"
+DEFAULT_STATE_DB = _PROJECT_ROOT / "data" / "daily_state.sqlite3"
+SQLITE_SUFFIXES = frozenset({".sqlite3", ".sqlite", ".db"})
 
 
 def fingerprint_text(text: str) -> str:
@@ -33,45 +42,176 @@ def fingerprint_paths(paths: Iterable[Path]) -> str:
 class DailySourceBundle:
     paths: tuple[Path, ...]
     source_hash: str
-    combined_text: str
+    has_text: bool
+    inline_text: str | None = None
 
+    @classmethod
+    def from_paths(
+        cls,
+        paths: Iterable[Path],
+        fingerprints: SourceFingerprintCache | None = None,
+    ) -> DailySourceBundle:
+        paths = tuple(Path(path) for path in paths)
+        if fingerprints is not None:
+            source_hash, has_text = fingerprints.fingerprint(paths)
+            return cls(paths=paths, source_hash=source_hash, has_text=has_text)
+        combined_text = "\n\n".join(path.read_text(encoding="utf-8") for path in paths)
+        return cls(
+            paths=paths,
+            source_hash=fingerprint_paths(paths),
+            has_text=bool(combined_text.strip()),
+            inline_text=combined_text,
+        )
 
-class DailyStateStore:
-    def __init__(self, path: Path | None = None):
-        self._path = path or DEFAULT_STATE_PATH
+    @cached_property
+    def combined_text(self) -> str:
+        # Read on demand: an unchanged day never needs the transcript text.
+        if self.inline_text is not None:
+            return self.inline_text
+        return "\n\n".join(path.read_text(encoding="utf-8") for path in self.paths)
 
-    def load(self) -> dict:
-        if not self._path.exists():
-            return {"version": 1, "dates": {}}
 
-        try:
-            payload = json.loads(self._path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            return {"version": 1, "dates": {}}
+class SourceFingerprintCache:
+    """``fingerprint_paths`` results keyed by each file's path, size, mtime and inode.
 
-        if not isinstance(payload, dict):
-            return {"version": 1, "dates": {}}
+    The combined digest covers every byte of every file, so it is cached per
+    source set; a hit costs one stat per file and reads nothing.
+    """
 
-        payload.setdefault("version", 1)
-        payload.setdefault("dates", {})
+    MAX_ENTRIES = 4096
+
+    _shared: ClassVar[dict[Path, SourceFingerprintCache]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._payload: dict | None = None
+
+    @classmethod
+    def shared(cls, path: Path) -> SourceFingerprintCache:
+        """One cache per file, so every caller in the process shares its lock."""
+        key = path.absolute()
+        with cls._shared_lock:
+            cache = cls._shared.get(key)
+            if cache is None:
+                cache = cls._shared[key] = cls(path)
+        return cache
+
+    def fingerprint(self, paths: Iterable[Path]) -> tuple[str, bool]:
+        """Return the ``fingerprint_paths`` digest and whether any file has text."""
+        ordered = sorted((Path(p) for p in paths), key=lambda p: p.as_posix())
+        key = "\n".join(path.as_posix() for path in ordered)
+        # Stat before reading, so a write during the read is caught next time.
+        stats = [_stat_key(path) for path in ordered]
+        with self._lock:
+            known = self._load()["entries"].get(key)
+        if known and known.get("stats") == stats:
+            return known["source_hash"], known["has_text"]
+
+        digest = sha256()
+        has_text = False
+        for path in ordered:
+            data = path.read_bytes()
+            digest.update(path.name.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(data)
+            digest.update(b"\0")
+            has_text = has_text or bool(data.decode("utf-8").strip())
+        source_hash = digest.hexdigest()
+
+        with self._lock:
+            # Merge into the file as it is now, keeping other processes' entries.
+            payload = self._read()
+            entries = payload["entries"]
+            entries.pop(key, None)
+            entries[key] = {
+                "stats": stats,
+                "source_hash": source_hash,
+                "has_text": has_text,
+            }
+            while len(entries) > self.MAX_ENTRIES:
+                del entries[next(iter(entries))]
+            self._save(payload)
+            self._payload = payload
+        return source_hash, has_text
+
+    def _load(self) -> dict:
+        # Hits are answered from memory; a miss re-reads the file before saving.
+        if self._payload is None:
+            self._payload = self._read()
+        return self._payload
+
+    def _read(self) -> dict:
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"version": 1, "entries": {}}
+        if not isinstance(payload, dict) or not isinstance(
+            payload.get("entries"), dict
+        ):
+            return {"version": 1, "entries": {}}
         return payload
 
-    def save(self, payload: dict) -> None:
+    def _save(self, payload: dict) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = self._path.with_suffix(f"{self._path.suffix}.tmp")
-        tmp_path.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=False, sort_keys=True),
-            encoding="utf-8",
+        tmp_path = self._path.with_suffix(
+            f"{self._path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp"
         )
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
         tmp_path.replace(self._path)
 
+
+def _stat_key(path: Path) -> list[int]:
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+
+class DailyStateStore:
+    """Per-date pipeline state, kept in JSON or in a WAL-mode SQLite database.
+
+    The backend follows the file suffix. Instances for the same path share one
+    backend, so constructing a store per lookup stays cheap. Record calls made
+    inside ``transaction()`` are committed together.
+    """
+
+    _backends: ClassVar[dict[Path, _JsonBackend | _SqliteBackend]] = {}
+    _backends_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: Path | None = None):
+        self._path = path or default_state_path()
+        key = self._path.absolute()
+        with self._backends_lock:
+            backend = self._backends.get(key)
+            if backend is None:
+                backend = (
+                    _SqliteBackend(self._path)
+                    if self._path.suffix in SQLITE_SUFFIXES
+                    else _JsonBackend(self._path)
+                )
+                self._backends[key] = backend
+        self._backend = backend
+
+    @property
+    def fingerprints(self) -> SourceFingerprintCache:
+        """Source fingerprint cache kept next to this state file."""
+        return SourceFingerprintCache.shared(
+            self._path.with_name("source_fingerprints.json")
+        )
+
+    def load(self) -> dict:
+        return self._backend.load()
+
+    def save(self, payload: dict) -> None:
+        self._backend.save(payload)
+
     def get(self, date_str: str) -> dict:
-        data = self.load()
-        dates = data.get("dates", {})
-        if not isinstance(dates, dict):
-            return {}
-        entry = dates.get(date_str, {})
-        return entry if isinstance(entry, dict) else {}
+        return self._backend.get(date_str)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._backend.transaction():
+            yield
 
     def record_summary(
         self,
@@ -82,25 +222,25 @@ class DailyStateStore:
         summary_text: str,
         summary_path: Path,
     ) -> dict:
-        payload = self.load()
-        dates = payload.setdefault("dates", {})
-        entry = dates.setdefault(date_str, {})
-        entry.update(
-            {
-                "status": "summary_ready",
-                "summary_path": str(summary_path),
-                "summary_hash": fingerprint_text(summary_text),
-                "summary_source_hash": source_hash,
-                "summary_source_files": [
-                    Path(path).name
-                    for path in sorted(source_paths, key=lambda p: Path(p).as_posix())
-                ],
-                "summary_updated_at": _utc_now(),
-            }
-        )
-        entry.pop("empty_reason", None)
-        payload["dates"] = dates
-        self.save(payload)
+        with self._backend.transaction() as dates:
+            entry = dates.get(date_str)
+            entry.update(
+                {
+                    "status": "summary_ready",
+                    "summary_path": str(summary_path),
+                    "summary_hash": fingerprint_text(summary_text),
+                    "summary_source_hash": source_hash,
+                    "summary_source_files": [
+                        Path(path).name
+                        for path in sorted(
+                            source_paths, key=lambda p: Path(p).as_posix()
+                        )
+                    ],
+                    "summary_updated_at": _utc_now(),
+                }
+            )
+            entry.pop("empty_reason", None)
+            dates.put(date_str, entry)
         return entry
 
     def record_novel(
@@ -113,55 +253,253 @@ class DailyStateStore:
         novel_path: Path,
         photo_path: Path,
     ) -> dict:
-        payload = self.load()
-        dates = payload.setdefault("dates", {})
-        entry = dates.setdefault(date_str, {})
-        entry.update(
-            {
-                "status": "novel_ready",
-                "novel_path": str(novel_path),
-                "photo_path": str(photo_path),
-                "novel_hash": fingerprint_text(chapter_text),
-                "novel_summary_hash": summary_hash,
-                "novel_context_hash": context_hash,
-                "novel_updated_at": _utc_now(),
-            }
-        )
-        payload["dates"] = dates
-        self.save(payload)
+        with self._backend.transaction() as dates:
+            entry = dates.get(date_str)
+            entry.update(
+                {
+                    "status": "novel_ready",
+                    "novel_path": str(novel_path),
+                    "photo_path": str(photo_path),
+                    "novel_hash": fingerprint_text(chapter_text),
+                    "novel_summary_hash": summary_hash,
+                    "novel_context_hash": context_hash,
+                    "novel_updated_at": _utc_now(),
+                }
+            )
+            dates.put(date_str, entry)
         return entry
 
     def record_empty(self, date_str: str, reason: str) -> dict:
-        payload = self.load()
-        dates = payload.setdefault("dates", {})
-        entry = dates.setdefault(date_str, {})
-        entry.update(
-            {
-                "status": "empty",
-                "empty_reason": reason,
-                "updated_at": _utc_now(),
-            }
-        )
-        payload["dates"] = dates
-        self.save(payload)
+        with self._backend.transaction() as dates:
+            entry = dates.get(date_str)
+            entry.update(
+                {
+                    "status": "empty",
+                    "empty_reason": reason,
+                    "updated_at": _utc_now(),
+                }
+            )
+            dates.put(date_str, entry)
         return entry
 
 
+def default_state_path() -> Path:
+    if settings.daily_state_backend == "sqlite":
+        return DEFAULT_STATE_DB
+    return DEFAULT_STATE_PATH
+
+
+class _Dates:
+    """Entries visible inside one backend transaction."""
+
+    def __init__(
+        self,
+        read: Callable[[str], dict],
+        write: Callable[[str, dict], None],
+    ) -> None:
+        self._read = read
+        self._write = write
+
+    def get(self, date_str: str) -> dict:
+        return self._read(date_str)
+
+    def put(self, date_str: str, entry: dict) -> None:
+        self._write(date_str, entry)
+
+
+class _JsonBackend:
+    # The parsed file is reused until its inode, size or mtime changes.
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.RLock()
+        self._parsed: tuple[tuple[int, int, int], dict] | None = None
+        self._open: _Dates | None = None
+
+    def load(self) -> dict:
+        with self._lock:
+            return copy.deepcopy(self._read())
+
+    def save(self, payload: dict) -> None:
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(f"{self._path.suffix}.tmp")
+            tmp_path.write_text(
+                json.dumps(payload, indent=2, ensure_ascii=False, sort_keys=True),
+                encoding="utf-8",
+            )
+            tmp_path.replace(self._path)
+            self._parsed = None
+
+    def get(self, date_str: str) -> dict:
+        with self._lock:
+            if self._open is not None:
+                return copy.deepcopy(self._open.get(date_str))
+            dates = self._read().get("dates", {})
+            if not isinstance(dates, dict):
+                return {}
+            entry = dates.get(date_str, {})
+            return copy.deepcopy(entry) if isinstance(entry, dict) else {}
+
+    @contextmanager
+    def transaction(self) -> Iterator[_Dates]:
+        with self._lock:
+            if self._open is not None:
+                yield self._open
+                return
+            payload = self.load()
+            dates = payload.get("dates")
+            if not isinstance(dates, dict):
+                dates = payload["dates"] = {}
+
+            def read(date_str: str) -> dict:
+                entry = dates.get(date_str)
+                return dict(entry) if isinstance(entry, dict) else {}
+
+            self._open = _Dates(read, dates.__setitem__)
+            try:
+                yield self._open
+            finally:
+                self._open = None
+            self.save(payload)
+
+    def _read(self) -> dict:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return {"version": 1, "dates": {}}
+        key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if self._parsed is None or self._parsed[0] != key:
+            self._parsed = (key, self._parse())
+        return self._parsed[1]
+
+    def _parse(self) -> dict:
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return {"version": 1, "dates": {}}
+
+        if not isinstance(payload, dict):
+            return {"version": 1, "dates": {}}
+
+        payload.setdefault("version", 1)
+        payload.setdefault("dates", {})
+        return payload
+
+
+class _SqliteBackend:
+    """One row per date in a WAL-mode database.
+
+    On first open the sibling ``.json`` state, if any, is imported once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS daily_state (
+                date TEXT PRIMARY KEY,
+                entry TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self._dates = _Dates(self.get, self._put)
+        self._migrate(path.with_suffix(".json"))
+
+    def load(self) -> dict:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT date, entry FROM daily_state ORDER BY date"
+            ).fetchall()
+        return {
+            "version": 1,
+            "dates": {date: json.loads(entry) for date, entry in rows},
+        }
+
+    def save(self, payload: dict) -> None:
+        dates = payload.get("dates", {})
+        with self.transaction():
+            self._connection.execute("DELETE FROM daily_state")
+            for date_str, entry in dates.items():
+                if isinstance(entry, dict):
+                    self._put(date_str, entry)
+
+    def get(self, date_str: str) -> dict:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT entry FROM daily_state WHERE date = ?", (date_str,)
+            ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    @contextmanager
+    def transaction(self) -> Iterator[_Dates]:
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self._dates
+                finally:
+                    self._depth -= 1
+                return
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            try:
+                yield self._dates
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            else:
+                self._connection.execute("COMMIT")
+            finally:
+                self._depth = 0
+
+    def _put(self, date_str: str, entry: dict) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO daily_state (date, entry) VALUES (?, ?)",
+            (date_str, json.dumps(entry, ensure_ascii=False, sort_keys=True)),
+        )
+
+    def _migrate(self, json_path: Path) -> None:
+        with self.transaction():
+            done = self._connection.execute(
+                "SELECT 1 FROM meta WHERE key = 'json_migrated'"
+            ).fetchone()
+            if done:
+                return
+            if json_path.exists():
+                dates = _JsonBackend(json_path).load()["dates"]
+                for date_str, entry in dates.items():
+                    if isinstance(entry, dict):
+                        self._put(date_str, entry)
+            self._connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('json_migrated', ?)",
+                (str(json_path) if json_path.exists() else "",),
+            )
+
+
 def _utc_now() -> str:
     from datetime import datetime, timezone
 
     return datetime.now(timezone.utc).isoformat()
 
 
-def collect_daily_sources(date_str: str) -> DailySourceBundle:
-    cleaned = sorted(settings.transcript_dir.glob(f"cleaned_{date_str}_*.txt"))
-    sources = cleaned or sorted(settings.transcript_dir.glob(f"{date_str}_*.txt"))
+def collect_daily_sources(
+    date_str: str, fingerprints: SourceFingerprintCache | None = None
+) -> DailySourceBundle:
+    transcripts = settings_artifact_index().paths("transcripts", date_str)
+    cleaned = [p for p in transcripts if p.name.startswith(f"cleaned_{date_str}_")]
+    sources = cleaned or [p for p in transcripts if p.name.startswith(f"{date_str}_")]
     if not sources:
-        return DailySourceBundle(paths=tuple(), source_hash="", combined_text="")
-
-    combined_text = "\n\n".join(path.read_text(encoding="utf-8") for path in sources)
-    return DailySourceBundle(
-        paths=tuple(sources),
-        source_hash=fingerprint_paths(sources),
-        combined_text=combined_text,
-    )
+        return DailySourceBundle(paths=tuple(), source_hash="", has_text=False)
+    return DailySourceBundle.from_paths(sources, fingerprints)
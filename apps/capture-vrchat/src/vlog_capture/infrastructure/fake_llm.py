@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class FakeResponse:
+    text: str
+
+    @property
+    def parts(self) -> list[str]:
+        return [self.text] if self.text else []
+
+
+@dataclass
+class FakeGenerativeModel:
+    """Offline stand-in for ``GenerativeModel`` with a fixed per-call latency.
+
+    Replies echo the model name and prompt size, so distinct prompts get
+    distinct responses. JSON-expecting callers are not supported.
+    """
+
+    model_name: str = "fake"
+    latency_seconds: float = 0.0
+    calls: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def generate_content(self, prompt: str, **kwargs: Any) -> FakeResponse:
+        time.sleep(self.latency_seconds)
+        with self._lock:
+            self.calls += 1
+        return FakeResponse(f"[{self.model_name}] {len(prompt)} chars")
+
+
+class FakeGenAI:
+    """Module-shaped replacement for the provider SDK (``VLOG_AI_PROVIDER=fake``)."""
+
+    def __init__(self, latency_seconds: float = 0.0) -> None:
+        self.latency_seconds = latency_seconds
+
+    def configure(self, **kwargs: Any) -> None:
+        return None
+
+    def GenerativeModel(self, model_name: str) -> FakeGenerativeModel:  # noqa: N802
+        return FakeGenerativeModel(model_name, self.latency_seconds)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from hashlib import sha256
+from pathlib import Path
+
+from vlog_capture.infrastructure.settings import settings
+
+
+def derive_seed(base_seed: int, stem: str) -> int:
+    """Stable per-image seed, so a date renders the same way on every machine."""
+    digest = sha256(f"{base_seed}:{stem}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big")
+
+
+class ImageSeedStore:
+    """Seed used for each rendered image, keyed by the output file's stem."""
+
+    _lock = threading.Lock()
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = Path(path or settings.image_seed_file)
+
+    def get(self, stem: str) -> int | None:
+        with self._lock:
+            return self._load().get(stem)
+
+    def put_many(self, seeds: dict[str, int]) -> None:
+        with self._lock:
+            payload = self._load()
+            payload.update(seeds)
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8"
+            )
+            tmp_path.replace(self._path)
+
+    def _load(self) -> dict[str, int]:
+        try:
+            return json.loads(self._path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import threading
+import time
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+from vlog_capture.infrastructure.observability import TraceLogger
+from vlog_capture.infrastructure.settings import settings
+
+# Pruning walks every entry, so it runs on the first write and then every Nth.
+_PRUNE_EVERY = 64
+_writes = itertools.count()
+
+
+class LLMResponseCache:
+    """Model responses on disk, addressed by model, generation config and prompt.
+
+    Entries not read for ``max_age_days`` are dropped, and past ``max_bytes``
+    the least recently used ones go first.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        max_bytes: int | None = None,
+        max_age_days: float | None = None,
+        enabled: bool | None = None,
+    ) -> None:
+        self.directory = Path(directory or settings.llm_cache_dir)
+        self.max_bytes = (
+            settings.llm_cache_max_bytes if max_bytes is None else max_bytes
+        )
+        days = settings.llm_cache_max_age_days if max_age_days is None else max_age_days
+        self.max_age_seconds = days * 86400
+        self.enabled = settings.llm_cache if enabled is None else enabled
+
+    @staticmethod
+    def key(
+        model: str, prompt: str, generation_config: Mapping[str, Any] | None = None
+    ) -> str:
+        header = json.dumps(
+            {"model": model, "config": dict(generation_config or {})},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        digest = sha256(header.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        tmp_path.replace(path)
+        if next(_writes) % _PRUNE_EVERY == 0:
+            self.prune()
+
+    def invalidate(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """Apply the age and size limits; returns the number of entries removed."""
+        return prune_entries(
+            self.directory.glob("*/*.txt"), self.max_age_seconds, self.max_bytes
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.txt"
+
+
+def prune_entries(paths: Iterable[Path], max_age_seconds: float, max_bytes: int) -> int:
+    """Drop cache files older than ``max_age_seconds``, then the least recently
+    used ones until the rest fit ``max_bytes``; returns the number removed.
+
+    Readers touch an entry's mtime on every hit, so mtime is its last use.
+    """
+    cutoff = time.time() - max_age_seconds
+    entries = []
+    removed = 0
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        if stat.st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+            removed += 1
+        else:
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def generate_text(
+    model: Any,
+    prompt: str,
+    *,
+    model_name: str,
+    component: str,
+    tracer: TraceLogger,
+    generation_config: Mapping[str, Any] | None = None,
+    cache: LLMResponseCache | None = None,
+    allow_empty: bool = False,
+    metadata: Mapping[str, Any] | None = None,
+    validate: Callable[[str], object] | None = None,
+) -> str:
+    """Run ``generate_content`` through the response cache and trace the call.
+
+    The trace records ``cache`` as ``hit``, ``miss`` or ``bypass``. With
+    ``allow_empty`` a response without parts yields ``""`` instead of raising;
+    empty responses are never cached. ``validate`` is called on each response
+    before it is cached and on each hit; a response it rejects is not kept, so
+    a retry asks the model again.
+    """
+    cache = cache or LLMResponseCache()
+    start_time = time.time()
+    key = cache.key(model_name, prompt, generation_config) if cache.enabled else None
+    text = cache.get(key) if key else None
+    if text is not None and validate is not None:
+        try:
+            validate(text)
+        except Exception:
+            cache.invalidate(key)  # type: ignore[arg-type]
+            text = None
+    status = "hit" if text is not None else "miss" if key else "bypass"
+    fresh = text is None
+    if text is None:
+        kwargs = (
+            {"generation_config": dict(generation_config)} if generation_config else {}
+        )
+        response = model.generate_content(prompt, **kwargs)
+        text = "" if allow_empty and not response.parts else response.text.strip()
+    tracer.log(
+        component=component,
+        model=model_name,
+        start_time=start_time,
+        input_text=prompt,
+        output_text=text,
+        metadata={**(metadata or {}), "cache": status},
+    )
+    if fresh:
+        if validate is not None:
+            validate(text)
+        if key and text:
+            cache.put(key, text)
+    return text
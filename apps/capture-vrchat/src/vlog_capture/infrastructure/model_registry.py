@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import functools
+import gc
+import logging
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Any, TypeVar
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M")
+_MIB = 1024 * 1024
+
+
+@dataclass
+class ModelStats:
+    loads: int = 0
+    hits: int = 0
+    evictions: int = 0
+    load_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.loads + self.hits
+        return self.hits / requests if requests else 0.0
+
+
+@dataclass
+class _Resident:
+    model: Any
+    nbytes: int
+    pool: str
+    release: Callable[[Any], None] | None
+
+
+class ModelRegistry:
+    """Process-wide home for heavy models, kept within RAM and VRAM budgets.
+
+    Models are requested by key with a loader and an approximate footprint.
+    When a load would push its pool ("cpu" or "cuda") past the budget, the
+    least recently used models in that pool are dropped first. Eviction only
+    drops the registry's reference; a caller still holding the model keeps it
+    alive until it lets go.
+    """
+
+    def __init__(self, budgets: Mapping[str, int | None] | None = None) -> None:
+        self._budgets = dict(budgets) if budgets is not None else None
+        self._resident: OrderedDict[str, _Resident] = OrderedDict()
+        # Loads in flight: their space is reserved and concurrent misses wait
+        # on the same future instead of loading the model twice.
+        self._loading: dict[str, tuple[Future[Any], str, int]] = {}
+        self._stats: dict[str, ModelStats] = {}
+        self._lock = threading.RLock()
+
+    def get(
+        self,
+        key: str,
+        loader: Callable[[], M],
+        *,
+        nbytes: int,
+        device: str = "cpu",
+        release: Callable[[M], None] | None = None,
+    ) -> M:
+        """Return the resident model for ``key``, loading it if needed.
+
+        The loader runs outside the registry lock, so a slow load never blocks
+        hits on other models.
+        """
+        pool = "cuda" if device.startswith("cuda") else "cpu"
+        with self._lock:
+            stats = self._stats.setdefault(key, ModelStats())
+            resident = self._resident.get(key)
+            if resident is not None:
+                self._resident.move_to_end(key)
+                stats.hits += 1
+                return resident.model
+            loading = self._loading.get(key)
+            if loading is not None:
+                stats.hits += 1
+                pending: Future[Any] = loading[0]
+            else:
+                self._make_room(pool, nbytes)
+                pending = Future()
+                self._loading[key] = (pending, pool, nbytes)
+        if loading is not None:
+            return pending.result()
+
+        started = time.perf_counter()
+        try:
+            model = loader()
+        except BaseException as exc:
+            with self._lock:
+                del self._loading[key]
+            pending.set_exception(exc)
+            raise
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            del self._loading[key]
+            stats.loads += 1
+            stats.load_seconds += elapsed
+            self._resident[key] = _Resident(model, nbytes, pool, release)
+            resident_mib = self.resident_bytes(pool) // _MIB
+        pending.set_result(model)
+        logger.info(
+            "Loaded %s in %.1fs (~%d MiB on %s, %d MiB resident)",
+            key,
+            elapsed,
+            nbytes // _MIB,
+            pool,
+            resident_mib,
+        )
+        return model
+
+    def release(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._resident:
+                return False
+            self._drop(key)
+            return True
+
+    def is_resident(self, key: str) -> bool:
+        with self._lock:
+            return key in self._resident
+
+    def resident_bytes(self, pool: str) -> int:
+        """Bytes held in ``pool``, counting space reserved by loads in flight."""
+        with self._lock:
+            resident = sum(
+                item.nbytes for item in self._resident.values() if item.pool == pool
+            )
+            reserved = sum(
+                size for _, where, size in self._loading.values() if where == pool
+            )
+            return resident + reserved
+
+    def stats(self) -> dict[str, ModelStats]:
+        with self._lock:
+            return {key: replace(stats) for key, stats in self._stats.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._resident):
+                self._drop(key)
+
+    def _make_room(self, pool: str, nbytes: int) -> None:
+        budget = self._budget(pool)
+        if budget is None:
+            return
+        for key in [k for k, item in self._resident.items() if item.pool == pool]:
+            if self.resident_bytes(pool) + nbytes <= budget:
+                return
+            logger.info("Evicting %s to fit the %s memory budget", key, pool)
+            self._stats[key].evictions += 1
+            self._drop(key)
+        if nbytes > budget:
+            logger.warning(
+                "Model needs ~%d MiB, over the %d MiB %s budget; loading anyway",
+                nbytes // _MIB,
+                budget // _MIB,
+                pool,
+            )
+
+    def _drop(self, key: str) -> None:
+        resident = self._resident.pop(key)
+        if resident.release is not None:
+            resident.release(resident.model)
+        del resident
+        gc.collect()
+        _empty_cuda_cache()
+
+    def _budget(self, pool: str) -> int | None:
+        if self._budgets is not None:
+            return self._budgets.get(pool)
+        from vlog_capture.infrastructure.settings import settings
+
+        configured = (
+            settings.model_vram_budget_mb
+            if pool == "cuda"
+            else settings.model_ram_budget_mb
+        )
+        if configured > 0:
+            return configured * _MIB
+        if pool == "cpu":
+            # Leave half of physical memory to VRChat and the desktop.
+            return psutil.virtual_memory().total // 2
+        total = _cuda_total_bytes()
+        if total is None:
+            _warn_unbounded_vram()
+        return total
+
+
+def _torch() -> Any:
+    # Only consult torch if a model loader already imported it.
+    return sys.modules.get("torch")
+
+
+def _cuda_total_bytes() -> int | None:
+    torch = _torch()
+    if torch is not None and torch.cuda.is_available():
+        return int(torch.cuda.get_device_properties(0).total_memory * 0.9)
+    # A Whisper-only process never imports torch; ask the driver instead.
+    total_mib = _nvidia_smi_total_mib()
+    return int(total_mib * _MIB * 0.9) if total_mib is not None else None
+
+
+@functools.cache
+def _nvidia_smi_total_mib() -> int | None:
+    try:
+        output = subprocess.check_output(
+            ["nvidia-smi", "--query-gpu=memory.total", "--format=csv,noheader,nounits"],
+            encoding="utf-8",
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    try:
+        values = [int(line.strip()) for line in output.splitlines() if line.strip()]
+    except ValueError:
+        return None
+    return min(values) if values else None
+
+
+@functools.cache
+def _warn_unbounded_vram() -> None:
+    logger.warning(
+        "GPU memory could not be probed; set models.vram_budget_mb "
+        "(VLOG_MODEL_VRAM_BUDGET_MB) to enforce a VRAM budget"
+    )
+
+
+def _empty_cuda_cache() -> None:
+    torch = _torch()
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+model_registry = ModelRegistry()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from vlog_capture.infrastructure.artifact_index import ArtifactIndex
+from vlog_capture.infrastructure.daily_state import fingerprint_text
+from vlog_capture.infrastructure.settings import settings
+
+_SYNOPSIS_HEADING = "【これまでのあらすじ】"
+# Synopses kept for rewinding when an earlier chapter is rewritten; older
+# steps keep only their chapter key.
+_KEPT_SNAPSHOTS = 32
+
+
+class NovelContextBuilder:
+    """Bounded ``novel_so_far`` for a date: a synopsis plus the latest chapters.
+
+    The last ``novel_context_chapters`` chapters before the date are quoted
+    verbatim; older ones are folded, one at a time, into a synopsis through the
+    novelizer's ``update_synopsis``. Each fold is cached with a content
+    fingerprint of the chapter it covers, so adding a chapter costs at most one
+    call and touching or restoring an unchanged file costs none. A fold that
+    would take more than ``novel_synopsis_seed_chapters`` calls, such as the
+    first build against an existing archive, starts over from only that many
+    of the latest older chapters. The whole context stays within
+    ``novel_context_chars``.
+    """
+
+    def __init__(
+        self,
+        novel_dir: Path | None = None,
+        synopsis_path: Path | None = None,
+    ) -> None:
+        self._novel_dir = novel_dir
+        self._synopsis_path = synopsis_path
+        self._lock = threading.Lock()
+
+    def build(self, date_str: str, novelizer: Any = None) -> str:
+        novel_dir = Path(self._novel_dir or settings.novel_out_dir)
+        chapters = [
+            path
+            for path in ArtifactIndex.shared({"novels": novel_dir}).paths("novels")
+            if path.stem.isdigit() and len(path.stem) == 8 and path.stem < date_str
+        ]
+        keep = max(0, settings.novel_context_chapters)
+        recent = chapters[len(chapters) - keep :] if keep else []
+        older = chapters[: len(chapters) - len(recent)]
+        synopsis = self._synopsis(older, novelizer)[: settings.novel_synopsis_chars]
+
+        budget = settings.novel_context_chars
+        blocks: list[str] = []
+        if synopsis:
+            blocks.append(f"{_SYNOPSIS_HEADING}\n{synopsis}"[:budget])
+            budget -= len(blocks[0])
+        latest: list[str] = []
+        for path in reversed(recent):
+            heading = f"【{path.stem}】\n"
+            separator = 2 if blocks or latest else 0
+            room = budget - separator - len(heading)
+            if room <= 0:
+                break
+            story = _story_text(path.read_text(encoding="utf-8"))
+            # The end of the latest chapter matters most, so trim from the front.
+            latest.insert(0, heading + story[-room:])
+            budget -= separator + len(latest[0])
+        return "\n\n".join(blocks + latest)
+
+    def _synopsis(self, chapters: list[Path], novelizer: Any) -> str:
+        update = getattr(novelizer, "update_synopsis", None)
+        if update is None or not chapters:
+            return ""
+        signature = getattr(novelizer, "synopsis_signature", "")
+        with self._lock:
+            steps = self._load_steps(signature)
+            stamps = [step.get("stat") for step in steps]
+            matched = 0
+            while matched < min(len(steps), len(chapters)) and _same_chapter(
+                steps[matched], chapters[matched]
+            ):
+                matched += 1
+            while matched and steps[matched - 1]["synopsis"] is None:
+                matched -= 1
+            if [step.get("stat") for step in steps] != stamps:
+                # Touched but unchanged chapters: remember their new stat.
+                self._save_steps(signature, steps)
+            steps = steps[:matched]
+            synopsis = steps[-1]["synopsis"] if steps else ""
+            seed = max(1, settings.novel_synopsis_seed_chapters)
+            if len(chapters) - matched > seed:
+                # Too many folds to catch up on; restart from the latest ones.
+                steps = [
+                    _chapter_step(path, None)
+                    for path in chapters[: len(chapters) - seed]
+                ]
+                matched, synopsis = len(steps), ""
+            for path in chapters[matched:]:
+                chapter = _story_text(path.read_text(encoding="utf-8"))
+                synopsis = update(synopsis, chapter)
+                steps.append(_chapter_step(path, synopsis))
+                self._save_steps(signature, steps)
+            return synopsis
+
+    def _path(self) -> Path:
+        return Path(self._synopsis_path or settings.novel_synopsis_file)
+
+    def _load_steps(self, signature: str) -> list[dict[str, Any]]:
+        try:
+            payload = json.loads(self._path().read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+        if payload.get("signature") != signature:
+            return []
+        return payload.get("steps", [])
+
+    def _save_steps(self, signature: str, steps: list[dict[str, Any]]) -> None:
+        for step in steps[:-_KEPT_SNAPSHOTS]:
+            step["synopsis"] = None
+        path = self._path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"signature": signature, "steps": steps},
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+
+
+def _chapter_step(path: Path, synopsis: str | None) -> dict[str, Any]:
+    stat = path.stat()
+    return {
+        "chapter": path.stem,
+        "stat": [stat.st_size, stat.st_mtime_ns],
+        "digest": fingerprint_text(path.read_text(encoding="utf-8")),
+        "synopsis": synopsis,
+    }
+
+
+def _same_chapter(step: dict[str, Any], path: Path) -> bool:
+    """Whether ``step`` folded this chapter; the stat only saves re-reading it."""
+    if step.get("chapter") != path.stem or "digest" not in step:
+        return False
+    stat = path.stat()
+    if step.get("stat") == [stat.st_size, stat.st_mtime_ns]:
+        return True
+    if fingerprint_text(path.read_text(encoding="utf-8")) != step["digest"]:
+        return False
+    step["stat"] = [stat.st_size, stat.st_mtime_ns]
+    return True
+
+
+def _story_text(chapter: str) -> str:
+    """Chapter prose without the trailing image prompt."""
+    story = chapter.split("[IMAGE_PROMPT:", 1)[0].rstrip()
+    return story.removesuffix("---").rstrip()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import psutil
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.system import Transcriber, whisper_signature
+
+logger = logging.getLogger(__name__)
+
+ExecutorFactory = Callable[[int, Callable[..., None], tuple[object, ...]], Executor]
+
+_worker_transcriber: Transcriber | None = None
+
+
+def resolve_worker_count(
+    cpu_count: int,
+    budget_mb: int,
+    worker_memory_mb: int,
+    configured: int = 0,
+) -> int:
+    """Size the pool by cores, then cap it so every int8 model fits the budget."""
+    workers = configured if configured > 0 else max(1, cpu_count // 2)
+    if worker_memory_mb > 0:
+        workers = min(workers, budget_mb // worker_memory_mb)
+    return max(1, min(workers, cpu_count))
+
+
+def _memory_budget_mb() -> int:
+    if settings.whisper_memory_budget_mb > 0:
+        return settings.whisper_memory_budget_mb
+    # Leave half of the free memory to VRChat and the rest of the desktop.
+    return int(psutil.virtual_memory().available / (1024 * 1024) / 2)
+
+
+def _process_pool(
+    workers: int, initializer: Callable[..., None], initargs: tuple[object, ...]
+) -> Executor:
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+def _init_worker(cpu_threads: int) -> None:
+    global _worker_transcriber
+    _worker_transcriber = Transcriber(
+        device="cpu", compute_type="int8", cpu_threads=cpu_threads
+    )
+
+
+def _transcribe_in_worker(audio_path: str) -> tuple[str, str]:
+    if _worker_transcriber is None:
+        raise RuntimeError("transcription worker was not initialised")
+    return _worker_transcriber.transcribe_and_save(audio_path)
+
+
+class ParallelTranscriber:
+    """Transcribe session segments on a CPU process pool, one int8 model per worker.
+
+    Results keep the order of the input paths. ``unload`` only arms an idle
+    timer: the pool, and the model each worker loaded, is shut down after
+    ``transcription_idle_seconds`` without jobs, so consecutive sessions reuse
+    it. A job started meanwhile cancels the timer, and the pool is never shut
+    down under a running ``transcribe_many``. ``close`` shuts it down now.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        executor_factory: ExecutorFactory = _process_pool,
+    ) -> None:
+        cpu_count = os.cpu_count() or 1
+        self.workers = workers or resolve_worker_count(
+            cpu_count,
+            _memory_budget_mb(),
+            settings.whisper_worker_memory_mb,
+            settings.whisper_cpu_workers,
+        )
+        self._cpu_threads = max(1, cpu_count // self.workers)
+        self._executor_factory = executor_factory
+        self._executor: Executor | None = None
+        self._condition = threading.Condition()
+        self._active = 0
+        self._idle_timer: threading.Timer | None = None
+        # Never loads a model; only answers cache lookups. Transcripts from the
+        # configured (e.g. float16 GPU) setup count as hits alongside int8 ones.
+        self._cache_reader = Transcriber(
+            device="cpu",
+            compute_type="int8",
+            also_current=(whisper_signature(),),
+        )
+
+    def transcribe_and_save(self, audio_path: str) -> tuple[str, str]:
+        return self.transcribe_many([audio_path])[0]
+
+    def transcribe_many(self, audio_paths: Sequence[str]) -> list[tuple[str, str]]:
+        results: dict[str, tuple[str, str]] = {}
+        missing: list[str] = []
+        for audio_path in audio_paths:
+            cached = self._cache_reader.cached(audio_path)
+            if cached is None:
+                missing.append(audio_path)
+            else:
+                results[audio_path] = cached
+        if missing:
+            executor = self._acquire_executor()
+            try:
+                for audio_path, result in zip(
+                    missing, executor.map(_transcribe_in_worker, missing), strict=True
+                ):
+                    results[audio_path] = result
+            finally:
+                with self._condition:
+                    self._active -= 1
+                    self._condition.notify_all()
+        return [results[audio_path] for audio_path in audio_paths]
+
+    def unload(self) -> None:
+        idle_seconds = settings.transcription_idle_seconds
+        if idle_seconds <= 0:
+            self.close()
+            return
+        with self._condition:
+            self._cancel_idle_timer()
+            if self._executor is None:
+                return
+            self._idle_timer = threading.Timer(idle_seconds, self._shutdown_if_idle)
+            self._idle_timer.daemon = True
+            self._idle_timer.start()
+
+    def close(self) -> None:
+        """Wait for running jobs, then shut the pool down."""
+        with self._condition:
+            self._cancel_idle_timer()
+            self._condition.wait_for(lambda: self._active == 0)
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _shutdown_if_idle(self) -> None:
+        with self._condition:
+            # A job or a later ``unload`` replaced this timer in the meantime.
+            if self._idle_timer is not threading.current_thread():
+                return
+            if self._active or self._executor is None:
+                return
+            executor, self._executor = self._executor, None
+            self._idle_timer = None
+        logger.info("Stopping idle CPU transcription workers")
+        executor.shutdown(wait=True)
+
+    def _cancel_idle_timer(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _acquire_executor(self) -> Executor:
+        with self._condition:
+            self._cancel_idle_timer()
+            executor = self._ensure_executor()
+            self._active += 1
+            return executor
+
+    def _ensure_executor(self) -> Executor:
+        if self._executor is None:
+            logger.info(
+                "Starting %d CPU transcription workers (%d threads each)",
+                self.workers,
+                self._cpu_threads,
+            )
+            self._executor = self._executor_factory(
+                self.workers, _init_worker, (self._cpu_threads,)
+            )
+        return self._executor
@@ -5,15 +5,23 @@ from vlog_capture.infrastructure.daily_state import DailyStateStore
 from vlog_capture.infrastructure.settings import settings
 
 
-def is_publishable_summary(date_str: str) -> bool:
+def summary_sources(date_str: str) -> tuple[Path, ...]:
+    """Transcripts the date's summary was built from, per the daily state."""
     entry = DailyStateStore().get(date_str)
     source_files = entry.get("summary_source_files", [])
-    if not isinstance(source_files, list) or not source_files:
-        return False
-
-    paths = tuple(
+    if not isinstance(source_files, list):
+        return ()
+    return tuple(
         settings.transcript_dir / Path(str(name)).name for name in source_files
     )
+
+
+def is_publishable_summary(
+    date_str: str, sources: tuple[Path, ...] | None = None
+) -> bool:
+    paths = summary_sources(date_str) if sources is None else sources
+    if not paths:
+        return False
     if not all(path.is_file() for path in paths):
         return False
 
@@ -1,13 +1,20 @@
 import json
 import uuid
 from datetime import date, datetime
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
 from supabase import Client, create_client
 from vlog_capture.infrastructure.image_optimizer import ImageOptimizer
-from vlog_capture.infrastructure.publication import is_publishable_summary
 from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.sync_manifest import (
+    SyncBatch,
+    SyncManifest,
+    entry_candidate,
+    file_stamp,
+    hidden_chunks,
+)
 from vlog_capture.portability import runtime_directories
 
 
@@ -21,6 +28,16 @@ class FileRepository:
     def save_text(self, path: str, content: str) -> None:
         Path(path).write_text(content, encoding="utf-8")
 
+    def append_text(self, path: str, content: str) -> None:
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write(content)
+
+    def replace(self, source: str, target: str) -> None:
+        Path(source).replace(target)
+
+    def delete(self, path: str) -> None:
+        Path(path).unlink(missing_ok=True)
+
     def save_summary(self, summary: str, date_str: str) -> None:
         summary_path = Path(settings.summary_dir) / f"{date_str}_summary.txt"
         summary_path.parent.mkdir(parents=True, exist_ok=True)
@@ -107,82 +124,38 @@ class SupabaseRepository:
         if not self.client:
             return
         client = self.client
-        self._sync_summaries(client)
-        self._sync_novels(client)
+        manifest = SyncManifest()
+        self._sync_summaries(client, manifest)
+        self._sync_novels(client, manifest)
         self._sync_photos(client)
-        self._sync_evaluations(client)
+        self._sync_evaluations(client, manifest)
 
-    def _sync_summaries(self, client: Client) -> None:
-        rows = []
-        blocked_paths: list[Path] = []
+    def _sync_summaries(self, client: Client, manifest: SyncManifest) -> None:
         summary_dir = Path(settings.summary_dir)
         if not summary_dir.exists():
             return
+        candidates = []
         for path in summary_dir.glob("*.txt"):
             if not path.stem.endswith("_summary") or "_" in path.stem.replace(
                 "_summary", ""
             ):
                 continue
             date_str = path.stem.split("_")[0]
-            if not is_publishable_summary(date_str):
-                blocked_paths.append(path)
-                continue
-            date_obj = datetime.strptime(date_str, "%Y%m%d").date()
-            rows.append(
-                {
-                    "file_path": path.as_posix(),
-                    "date": date_obj.isoformat(),
-                    "title": path.stem,
-                    "content": path.read_text(encoding="utf-8"),
-                    "tags": ["summary"],
-                    "is_public": True,
-                }
-            )
-        for path in blocked_paths:
-            (
-                client.table("daily_entries")
-                .update({"is_public": False})
-                .eq("file_path", path.as_posix())
-                .execute()
-            )
-        if rows:
-            client.table("daily_entries").upsert(
-                rows, on_conflict="file_path"
-            ).execute()
+            candidates.append(entry_candidate(path, date_str, path.stem, ["summary"]))
+        _push_entries(client, manifest, manifest.batch("daily_entries", candidates))
 
-    def _sync_novels(self, client: Client) -> None:
-        rows = []
-        blocked_paths: list[Path] = []
+    def _sync_novels(self, client: Client, manifest: SyncManifest) -> None:
         novel_dir = Path(settings.novel_out_dir)
         if not novel_dir.exists():
             return
+        candidates = []
         for path in novel_dir.glob("*.md"):
             if not path.stem.isdigit() or len(path.stem) != 8:
                 continue
-            date_str = path.stem
-            if not is_publishable_summary(date_str):
-                blocked_paths.append(path)
-                continue
-            date_obj = datetime.strptime(date_str, "%Y%m%d").date()
-            rows.append(
-                {
-                    "file_path": path.as_posix(),
-                    "date": date_obj.isoformat(),
-                    "title": f"Novel {date_str}",
-                    "content": path.read_text(encoding="utf-8"),
-                    "tags": ["novel"],
-                    "is_public": True,
-                }
-            )
-        for path in blocked_paths:
-            (
-                client.table("novels")
-                .update({"is_public": False})
-                .eq("file_path", path.as_posix())
-                .execute()
+            candidates.append(
+                entry_candidate(path, path.stem, f"Novel {path.stem}", ["novel"])
             )
-        if rows:
-            client.table("novels").upsert(rows, on_conflict="file_path").execute()
+        _push_entries(client, manifest, manifest.batch("novels", candidates))
 
     def _sync_photos(self, client: Client) -> None:
         photo_dir = Path(settings.photo_dir)
@@ -226,33 +199,48 @@ class SupabaseRepository:
                 "date", date_obj.isoformat()
             ).execute()
 
-    def _sync_evaluations(self, client: Client) -> None:
-        rows = []
+    def _sync_evaluations(self, client: Client, manifest: SyncManifest) -> None:
         eval_dir = Path(settings.summary_dir).parent / "evaluations"
         if not eval_dir.exists():
             return
-        for path in eval_dir.glob("*.json"):
-            date_str = path.stem
-            if not date_str.isdigit() or len(date_str) != 8:
-                continue
-            date_obj = datetime.strptime(date_str, "%Y%m%d").date()
-            data = json.loads(path.read_text(encoding="utf-8"))
-            rows.append(
-                {
-                    "date": date_obj.isoformat(),
-                    "target_type": "novel",
-                    "score": data.get("quality_score", 0),
-                    "reasoning": json.dumps(
-                        {
-                            "faithfulness": data.get("faithfulness_score"),
-                            "quality": data.get("quality_score"),
-                            "reasoning": data.get("reasoning"),
-                        },
-                        ensure_ascii=False,
-                    ),
-                }
-            )
-        if rows:
+        candidates = [
+            (path.stem, file_stamp(path), partial(_evaluation_row, path))
+            for path in eval_dir.glob("*.json")
+            if path.stem.isdigit() and len(path.stem) == 8
+        ]
+        batch = manifest.batch("evaluations", candidates)
+        if batch.rows:
             client.table("evaluations").upsert(
-                rows, on_conflict="date, target_type"
+                batch.rows, on_conflict="date, target_type"
             ).execute()
+        manifest.record(batch)
+
+
+def _evaluation_row(path: Path) -> dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        "date": datetime.strptime(path.stem, "%Y%m%d").date().isoformat(),
+        "target_type": "novel",
+        "score": data.get("quality_score", 0),
+        "reasoning": json.dumps(
+            {
+                "faithfulness": data.get("faithfulness_score"),
+                "quality": data.get("quality_score"),
+                "reasoning": data.get("reasoning"),
+            },
+            ensure_ascii=False,
+        ),
+    }
+
+
+def _push_entries(client: Client, manifest: SyncManifest, batch: SyncBatch) -> None:
+    for keys in hidden_chunks(batch):
+        (
+            client.table(batch.table)
+            .update({"is_public": False})
+            .in_("file_path", keys)
+            .execute()
+        )
+    if batch.rows:
+        client.table(batch.table).upsert(batch.rows, on_conflict="file_path").execute()
+    manifest.record(batch)
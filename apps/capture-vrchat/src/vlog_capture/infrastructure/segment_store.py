@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO
+from uuid import UUID, uuid5
+
+from vlog_memory_domain import Utterance
+
+# One (start_ms, byte offset) pair per segment line.
+_INDEX_RECORD = struct.Struct("<qq")
+
+
+@dataclass(frozen=True, slots=True)
+class TranscriptSegment:
+    start_ms: int
+    end_ms: int
+    text: str
+    avg_logprob: float
+    no_speech_prob: float
+
+    @classmethod
+    def from_whisper(cls, segment: Any) -> TranscriptSegment:
+        return cls(
+            start_ms=round(segment.start * 1000),
+            end_ms=round(segment.end * 1000),
+            text=segment.text.strip(),
+            avg_logprob=round(segment.avg_logprob, 4),
+            no_speech_prob=round(segment.no_speech_prob, 4),
+        )
+
+
+def segment_path(transcript: Path) -> Path:
+    """Segment file that sits next to a plain-text transcript."""
+    return transcript.with_suffix(".segments.jsonl")
+
+
+def index_path(segments: Path) -> Path:
+    return segments.with_suffix(".idx")
+
+
+class SegmentWriter:
+    """Write segments as JSONL plus a packed start-time/offset index.
+
+    Both files appear only on a clean ``close``; an interrupted transcription
+    leaves no partial store behind.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._partial = path.with_name(path.name + ".part")
+        self._handle = open(self._partial, "wb")
+        self._index = bytearray()
+
+    def __enter__(self) -> SegmentWriter:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def append(self, segment: TranscriptSegment) -> None:
+        self._index += _INDEX_RECORD.pack(segment.start_ms, self._handle.tell())
+        line = json.dumps(asdict(segment), ensure_ascii=False, separators=(",", ":"))
+        self._handle.write(line.encode("utf-8") + b"\n")
+
+    def close(self) -> None:
+        self._handle.close()
+        index = index_path(self._path)
+        index.with_name(index.name + ".part").write_bytes(self._index)
+        # Index first: a crash in between then leaves a new index next to an
+        # old segment file, which ``read_segments`` detects and rebuilds.
+        index.with_name(index.name + ".part").replace(index)
+        self._partial.replace(self._path)
+
+    def abort(self) -> None:
+        self._handle.close()
+        self._partial.unlink(missing_ok=True)
+
+
+def read_segments(
+    path: Path, start_ms: int | None = None, end_ms: int | None = None
+) -> list[TranscriptSegment]:
+    """Read the segments overlapping ``[start_ms, end_ms)``, or all of them.
+
+    A time range seeks through the index, so only the matching lines are parsed.
+    Whisper emits segments in time order, which the index lookup relies on.
+    An index that does not end at the file's last line is rebuilt first.
+    """
+    with open(path, "rb") as handle:
+        if start_ms is None and end_ms is None:
+            return [_parse(line) for line in handle]
+        starts, offsets = _load_index(index_path(path), handle)
+        first = max(0, bisect_left(starts, start_ms or 0) - 1)
+        stop = len(starts) if end_ms is None else bisect_right(starts, end_ms - 1)
+        if first >= stop:
+            return []
+        handle.seek(offsets[first])
+        segments = (_parse(handle.readline()) for _ in range(stop - first))
+        return [
+            segment
+            for segment in segments
+            if start_ms is None or segment.end_ms > start_ms
+        ]
+
+
+def load_utterances(
+    path: Path,
+    episode_id: str,
+    recorded_at: datetime,
+) -> list[Utterance]:
+    """Build ``Utterance`` objects for a recording without touching its audio.
+
+    ``recorded_at`` is the aware start time of the recording. Utterance ids are
+    derived from the episode and segment position, so reloading is idempotent.
+    """
+    namespace = UUID(episode_id)
+    utterances = []
+    for position, segment in enumerate(read_segments(path)):
+        if not segment.text:
+            continue
+        utterances.append(
+            Utterance(
+                episode_id=episode_id,
+                started_at=recorded_at + timedelta(milliseconds=segment.start_ms),
+                ended_at=recorded_at + timedelta(milliseconds=segment.end_ms),
+                text=segment.text,
+                id=str(uuid5(namespace, f"{position}:{segment.start_ms}")),
+            )
+        )
+    return utterances
+
+
+def copy_segments(source: Path, target: Path) -> None:
+    """Carry a recording's segment store over to a renamed transcript."""
+    source_segments = segment_path(source)
+    if not source_segments.exists():
+        return
+    target_segments = segment_path(target)
+    for src, dst in (
+        (index_path(source_segments), index_path(target_segments)),
+        (source_segments, target_segments),
+    ):
+        partial = dst.with_name(dst.name + ".part")
+        partial.write_bytes(src.read_bytes())
+        os.replace(partial, dst)
+
+
+def _load_index(path: Path, handle: BinaryIO) -> tuple[list[int], list[int]]:
+    try:
+        records = list(_INDEX_RECORD.iter_unpack(path.read_bytes()))
+    except (OSError, struct.error):
+        records = []
+    if not _index_matches(records, handle):
+        records = _rebuild_index(path, handle)
+    return [start for start, _ in records], [offset for _, offset in records]
+
+
+def _index_matches(records: list[tuple[int, int]], handle: BinaryIO) -> bool:
+    """Whether the last record points at the start time of the last line."""
+    size = handle.seek(0, os.SEEK_END)
+    if not records:
+        return size == 0
+    start_ms, offset = records[-1]
+    if offset >= size:
+        return False
+    handle.seek(offset)
+    line = handle.readline()
+    if handle.tell() != size or (offset and not _follows_newline(handle, offset)):
+        return False
+    try:
+        return _parse(line).start_ms == start_ms
+    except (ValueError, TypeError):
+        return False
+
+
+def _follows_newline(handle: BinaryIO, offset: int) -> bool:
+    handle.seek(offset - 1)
+    return handle.read(1) == b"\n"
+
+
+def _rebuild_index(path: Path, handle: BinaryIO) -> list[tuple[int, int]]:
+    records = []
+    handle.seek(0)
+    offset = 0
+    for line in handle:
+        records.append((_parse(line).start_ms, offset))
+        offset += len(line)
+    partial = path.with_name(path.name + ".part")
+    partial.write_bytes(b"".join(_INDEX_RECORD.pack(*record) for record in records))
+    os.replace(partial, path)
+    return records
+
+
+def _parse(line: bytes) -> TranscriptSegment:
+    return TranscriptSegment(**json.loads(line))
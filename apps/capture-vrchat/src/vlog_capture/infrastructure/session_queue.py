@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+from vlog_capture.domain.entities import RecordingSession
+from vlog_capture.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# A session that was claimed this often without finishing keeps crashing the
+# service; it is dropped instead of being replayed on every restart.
+MAX_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class QueuedSession:
+    item_id: str
+    session_id: str | None
+    file_paths: tuple[str, ...]
+    start_time: str
+    end_time: str | None
+    enqueued_at: float
+    attempts: int = 0
+
+    @property
+    def session(self) -> RecordingSession:
+        return RecordingSession(
+            file_paths=self.file_paths,
+            start_time=datetime.fromisoformat(self.start_time),
+            end_time=datetime.fromisoformat(self.end_time) if self.end_time else None,
+        )
+
+
+class SessionQueue:
+    """Finished recording sessions waiting for processing, persisted as JSON.
+
+    Items stay in the file until ``done`` is called, so sessions that were
+    queued or in flight when the service stopped are processed after restart.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = Path(path or settings.session_queue_file)
+        self._condition = threading.Condition()
+        self._items: list[QueuedSession] = self._load()
+        self._claimed: set[str] = set()
+
+    @property
+    def depth(self) -> int:
+        with self._condition:
+            return len(self._items)
+
+    @property
+    def in_progress(self) -> int:
+        with self._condition:
+            return len(self._claimed)
+
+    def oldest_age_seconds(self) -> float | None:
+        with self._condition:
+            if not self._items:
+                return None
+            oldest = min(item.enqueued_at for item in self._items)
+        return max(0.0, round(time.time() - oldest, 1))
+
+    def put(self, session: RecordingSession, session_id: str | None) -> QueuedSession:
+        item = QueuedSession(
+            item_id=uuid4().hex,
+            session_id=session_id,
+            file_paths=tuple(session.file_paths),
+            start_time=session.start_time.isoformat(),
+            end_time=session.end_time.isoformat() if session.end_time else None,
+            enqueued_at=time.time(),
+        )
+        with self._condition:
+            self._items.append(item)
+            self._save()
+            self._condition.notify()
+        return item
+
+    def claim(self, timeout: float | None = None) -> QueuedSession | None:
+        """Block until an unclaimed session is available and mark it in flight."""
+        with self._condition:
+            if not self._condition.wait_for(self._next_unclaimed, timeout):
+                return None
+            item = self._next_unclaimed()
+            assert item is not None
+            claimed = QueuedSession(**{**asdict(item), "attempts": item.attempts + 1})
+            self._items[self._items.index(item)] = claimed
+            self._claimed.add(claimed.item_id)
+            self._save()
+            return claimed
+
+    def done(self, item: QueuedSession) -> None:
+        with self._condition:
+            self._items = [
+                queued for queued in self._items if queued.item_id != item.item_id
+            ]
+            self._claimed.discard(item.item_id)
+            self._save()
+
+    def _next_unclaimed(self) -> QueuedSession | None:
+        for item in self._items:
+            if item.item_id not in self._claimed:
+                return item
+        return None
+
+    def _load(self) -> list[QueuedSession]:
+        if not self._path.exists():
+            return []
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+            items = [
+                QueuedSession(**{**raw, "file_paths": tuple(raw["file_paths"])})
+                for raw in payload.get("items", [])
+            ]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            logger.exception(
+                "Session queue is unreadable; starting empty: %s", self._path
+            )
+            return []
+        kept = []
+        for item in items:
+            if item.attempts >= MAX_ATTEMPTS:
+                logger.error(
+                    "Dropping session %s after %d interrupted attempts: %s",
+                    item.session_id,
+                    item.attempts,
+                    list(item.file_paths),
+                )
+                continue
+            kept.append(item)
+        return kept
+
+    def _save(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(f"{self._path.suffix}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"version": 1, "items": [asdict(item) for item in self._items]},
+                indent=2,
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self._path)
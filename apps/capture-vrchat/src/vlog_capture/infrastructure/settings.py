@@ -147,12 +147,20 @@ class Settings(BaseSettings):
         default="",
         validation_alias="VLOG_SUPABASE_SERVICE_ROLE_KEY",
     )
+    sync_manifest_file: Path = Field(
+        default_factory=lambda: _runtime_default("state", "supabase_sync.json"),
+        validation_alias="VLOG_SYNC_MANIFEST_FILE",
+    )
     discord_webhook_url: str = Field(
         default="",
         validation_alias="VLOG_DISCORD_WEBHOOK_URL",
     )
 
     check_interval: int = _config.get("process", {}).get("check_interval", 5)
+    adaptive_check_interval: bool = _config.get("process", {}).get(
+        "adaptive_interval", False
+    )
+    max_check_interval: int = _config.get("process", {}).get("max_check_interval", 30)
     process_names: set[str] = Field(
         default_factory=lambda: set(
             _config.get("process", {}).get("names", "VRChat").split(",")
@@ -166,12 +174,55 @@ class Settings(BaseSettings):
     sample_rate: int = _config.get("audio", {}).get("sample_rate", 16000)
     channels: int = _config.get("audio", {}).get("channels", 1)
     block_size: int = _config.get("audio", {}).get("block_size", 1024)
+    ring_buffer_seconds: float = _config.get("audio", {}).get(
+        "ring_buffer_seconds", 30.0
+    )
+    preroll_seconds: float = _config.get("audio", {}).get("preroll_seconds", 0.3)
+    hangover_seconds: float = _config.get("audio", {}).get("hangover_seconds", 0.8)
+    segment_seconds: int = _config.get("audio", {}).get("segment_seconds", 900)
+    segment_max_bytes: int = _config.get("audio", {}).get(
+        "segment_max_bytes", 64 * 1024 * 1024
+    )
+    segment_silence_seconds: float = _config.get("audio", {}).get(
+        "segment_silence_seconds", 30.0
+    )
 
     whisper_model_size: str = _config.get("whisper", {}).get("model_size", "large-v3")
     whisper_device: str = _config.get("whisper", {}).get("device", "cuda")
     whisper_compute_type: str = _config.get("whisper", {}).get(
         "compute_type", "float16"
     )
+    transcription_service: bool = _config.get("whisper", {}).get("service", False)
+    transcription_socket: Path = Field(
+        default_factory=lambda: _runtime_default("state", "transcriber.sock"),
+        validation_alias="VLOG_TRANSCRIPTION_SOCKET",
+    )
+    transcription_idle_seconds: float = _config.get("whisper", {}).get(
+        "idle_seconds", 600.0
+    )
+    transcription_timeout_seconds: float = _config.get("whisper", {}).get(
+        "service_timeout_seconds", 120.0
+    )
+    transcription_timeout_factor: float = _config.get("whisper", {}).get(
+        "service_timeout_factor", 2.0
+    )
+    whisper_cpu_parallel: bool = _config.get("whisper", {}).get("cpu_parallel", False)
+    whisper_cpu_workers: int = _config.get("whisper", {}).get("cpu_workers", 0)
+    whisper_worker_memory_mb: int = _config.get("whisper", {}).get(
+        "worker_memory_mb", 1500
+    )
+    whisper_memory_budget_mb: int = _config.get("whisper", {}).get(
+        "memory_budget_mb", 0
+    )
+    whisper_model_memory_mb: int = _config.get("whisper", {}).get(
+        "model_memory_mb", 3200
+    )
+    model_ram_budget_mb: int = _config.get("models", {}).get("ram_budget_mb", 0)
+    model_vram_budget_mb: int = _config.get("models", {}).get("vram_budget_mb", 0)
+    transcript_index_file: Path = Field(
+        default_factory=lambda: _runtime_default("state", "transcript_index.sqlite3"),
+        validation_alias="VLOG_TRANSCRIPT_INDEX_FILE",
+    )
     transcript_dir: Path = Field(
         default_factory=lambda: _runtime_default("data", "transcripts"),
         validation_alias="VLOG_TRANSCRIPT_DIR",
@@ -201,6 +252,14 @@ class Settings(BaseSettings):
 
     image_model: str = _config.get("image", {}).get("model", "Tongyi-MAI/Z-Image-Turbo")
     image_device: str = _config.get("image", {}).get("device", "cuda")
+    image_model_memory_mb: int = _config.get("image", {}).get("model_memory_mb", 16000)
+    image_batch_size: int = _config.get("image", {}).get("batch_size", 0)
+    image_max_batch_size: int = _config.get("image", {}).get("max_batch_size", 4)
+    image_batch_memory_mb: int = _config.get("image", {}).get("batch_memory_mb", 2000)
+    image_seed_file: Path = Field(
+        default_factory=lambda: _runtime_default("state", "image_seeds.json"),
+        validation_alias="VLOG_IMAGE_SEED_FILE",
+    )
     image_height: int = _config.get("image", {}).get("height", 1024)
     image_width: int = _config.get("image", {}).get("width", 1024)
     image_num_inference_steps: int = _config.get("image", {}).get(
@@ -226,6 +285,56 @@ class Settings(BaseSettings):
     min_transcript_size_bytes: int = _config.get("processing", {}).get(
         "min_transcript_size_bytes", 50
     )
+    summary_map_reduce: bool = _config.get("summary", {}).get("map_reduce", True)
+    summary_chunk_chars: int = _config.get("summary", {}).get("chunk_chars", 60000)
+    summary_chunk_dir: Path = Field(
+        default_factory=lambda: _runtime_default("state", "summary_chunks"),
+        validation_alias="VLOG_SUMMARY_CHUNK_DIR",
+    )
+    summary_chunk_max_bytes: int = _config.get("summary", {}).get(
+        "chunk_cache_max_bytes", 64 * 1024 * 1024
+    )
+    summary_chunk_max_age_days: float = _config.get("summary", {}).get(
+        "chunk_cache_max_age_days", 30
+    )
+    novel_context_chars: int = _config.get("novel", {}).get("context_chars", 16000)
+    novel_context_chapters: int = _config.get("novel", {}).get("context_chapters", 3)
+    novel_synopsis_chars: int = _config.get("novel", {}).get("synopsis_chars", 2000)
+    novel_synopsis_seed_chapters: int = _config.get("novel", {}).get(
+        "synopsis_seed_chapters", 30
+    )
+    novel_synopsis_file: Path = Field(
+        default_factory=lambda: _runtime_default("state", "novel_synopsis.json"),
+        validation_alias="VLOG_NOVEL_SYNOPSIS_FILE",
+    )
+    novel_pipeline_depth: int = _config.get("novel", {}).get("pipeline_depth", 2)
+    ai_provider: str = _config.get("ai", {}).get("provider", "gemini")
+    ai_concurrency: int = _config.get("ai", {}).get("concurrency", 4)
+    ai_requests_per_minute: float = _config.get("ai", {}).get("requests_per_minute", 60)
+    ai_deadline_seconds: float = _config.get("ai", {}).get("deadline_seconds", 300)
+    llm_cache: bool = _config.get("llm_cache", {}).get("enabled", True)
+    llm_cache_max_bytes: int = _config.get("llm_cache", {}).get(
+        "max_bytes", 256 * 1024 * 1024
+    )
+    llm_cache_max_age_days: float = _config.get("llm_cache", {}).get("max_age_days", 30)
+    llm_cache_dir: Path = Field(
+        default_factory=lambda: _runtime_default("state", "llm_cache"),
+        validation_alias="VLOG_LLM_CACHE_DIR",
+    )
+    rolling_transcription: bool = _config.get("processing", {}).get(
+        "rolling_transcription", False
+    )
+    repetition_max_period: int = _config.get("processing", {}).get(
+        "repetition_max_period", 16
+    )
+    processing_workers: int = _config.get("processing", {}).get("workers", 1)
+    daily_state_backend: str = _config.get("processing", {}).get(
+        "daily_state_backend", "json"
+    )
+    session_queue_file: Path = Field(
+        default_factory=lambda: _runtime_default("state", "session_queue.json"),
+        validation_alias="VLOG_SESSION_QUEUE_FILE",
+    )
     archive_dir: Path = Field(
         default_factory=lambda: _runtime_default("data", "archives"),
         validation_alias="VLOG_ARCHIVE_DIR",
@@ -264,7 +373,20 @@ class Settings(BaseSettings):
     def normalize_data_path(cls, value: Path) -> Path:
         return resolve_runtime_path(value, "data")
 
-    @field_validator("trace_file", "incident_file", "error_log_file", mode="after")
+    @field_validator(
+        "trace_file",
+        "incident_file",
+        "error_log_file",
+        "transcription_socket",
+        "session_queue_file",
+        "transcript_index_file",
+        "summary_chunk_dir",
+        "llm_cache_dir",
+        "novel_synopsis_file",
+        "image_seed_file",
+        "sync_manifest_file",
+        mode="after",
+    )
     @classmethod
     def normalize_state_path(cls, value: Path) -> Path:
         return resolve_runtime_path(value, "state")
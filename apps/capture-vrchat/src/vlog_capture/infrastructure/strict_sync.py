@@ -4,14 +4,22 @@ import json
 import os
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
+from hashlib import sha256
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
 from supabase import create_client
 from vlog_capture.infrastructure.image_optimizer import ImageOptimizer
-from vlog_capture.infrastructure.publication import is_publishable_summary
 from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.sync_manifest import (
+    SyncBatch,
+    SyncManifest,
+    entry_candidate,
+    file_stamp,
+    hidden_chunks,
+)
 from vlog_capture.portability import runtime_directories
 
 
@@ -22,6 +30,7 @@ class SyncReport:
     novels: int
     photos: int
     evaluations: int
+    unchanged: int = 0
 
     @property
     def total(self) -> int:
@@ -30,17 +39,26 @@ class SyncReport:
     def to_dict(self) -> dict[str, int | str | bool]:
         return {
             "run_id": self.run_id,
-            "verified": self.total > 0,
+            "verified": self.total + self.unchanged > 0,
             "total": self.total,
             "summaries": self.summaries,
             "novels": self.novels,
             "photos": self.photos,
             "evaluations": self.evaluations,
+            "unchanged": self.unchanged,
         }
 
 
 class StrictSupabaseSync:
-    def __init__(self, client: Any | None = None) -> None:
+    """Push changed rows to Supabase and verify every pushed row came back.
+
+    Counts cover only what this run sent; rows the manifest already has in
+    their current form are reported as ``unchanged``.
+    """
+
+    def __init__(
+        self, client: Any | None = None, manifest: SyncManifest | None = None
+    ) -> None:
         self.run_id = os.environ.get("VLOG_RUN_ID") or str(uuid4())
         url = settings.supabase_url
         key = settings.supabase_service_role_key
@@ -52,16 +70,22 @@ class StrictSupabaseSync:
                     "SUPABASE_SERVICE_ROLE_KEY are required"
                 )
             self.client = create_client(url, key)
+        self.manifest = manifest or SyncManifest(target=url)
+        self._unchanged = 0
+        self._pushed_dates: set[str] = set()
 
     def sync(self) -> SyncReport:
+        self._unchanged = 0
+        self._pushed_dates = set()
         report = SyncReport(
             run_id=self.run_id,
             summaries=self._sync_summaries(),
             novels=self._sync_novels(),
             photos=self._sync_photos(),
             evaluations=self._sync_evaluations(),
+            unchanged=self._unchanged,
         )
-        if report.total == 0:
+        if report.total + report.unchanged == 0:
             raise RuntimeError("Supabase sync produced zero verified records")
         self._write_report(report)
         return report
@@ -83,115 +107,97 @@ class StrictSupabaseSync:
             )
         return len(data)
 
-    def _sync_summaries(self) -> int:
-        rows: list[dict[str, Any]] = []
-        blocked_paths: list[Path] = []
-        for path in Path(settings.summary_dir).glob("*_summary.txt"):
-            date_str = path.stem.removesuffix("_summary")
-            if not is_publishable_summary(date_str):
-                blocked_paths.append(path)
-                continue
-            if not (date_str.isdigit() and len(date_str) == 8):
-                continue
-            rows.append(
-                {
-                    "file_path": path.as_posix(),
-                    "date": datetime.strptime(date_str, "%Y%m%d").date().isoformat(),
-                    "title": path.stem,
-                    "content": path.read_text(encoding="utf-8"),
-                    "tags": ["summary"],
-                    "is_public": True,
-                }
-            )
-        for path in blocked_paths:
+    def _push_entries(self, batch: SyncBatch) -> int:
+        for keys in hidden_chunks(batch):
             (
-                self.client.table("daily_entries")
+                self.client.table(batch.table)
                 .update({"is_public": False})
-                .eq("file_path", path.as_posix())
+                .in_("file_path", keys)
                 .execute()
             )
-        return self._verified_upsert("daily_entries", rows, "file_path")
+        verified = self._verified_upsert(batch.table, batch.rows, "file_path")
+        self.manifest.record(batch)
+        self._unchanged += batch.unchanged
+        self._pushed_dates.update(row["date"] for row in batch.rows)
+        return verified
+
+    def _sync_summaries(self) -> int:
+        candidates = []
+        for path in Path(settings.summary_dir).glob("*_summary.txt"):
+            date_str = path.stem.removesuffix("_summary")
+            if date_str.isdigit() and len(date_str) == 8:
+                candidates.append(
+                    entry_candidate(path, date_str, path.stem, ["summary"])
+                )
+        return self._push_entries(self.manifest.batch("daily_entries", candidates))
 
     def _sync_novels(self) -> int:
-        rows: list[dict[str, Any]] = []
-        blocked_paths: list[Path] = []
-        for path in Path(settings.novel_out_dir).glob("*.md"):
-            if not (path.stem.isdigit() and len(path.stem) == 8):
-                continue
-            if not is_publishable_summary(path.stem):
-                blocked_paths.append(path)
-                continue
-            rows.append(
-                {
-                    "file_path": path.as_posix(),
-                    "date": datetime.strptime(path.stem, "%Y%m%d").date().isoformat(),
-                    "title": f"Novel {path.stem}",
-                    "content": path.read_text(encoding="utf-8"),
-                    "tags": ["novel"],
-                    "is_public": True,
-                }
-            )
-        for path in blocked_paths:
-            (
-                self.client.table("novels")
-                .update({"is_public": False})
-                .eq("file_path", path.as_posix())
-                .execute()
-            )
-        return self._verified_upsert("novels", rows, "file_path")
+        candidates = [
+            entry_candidate(path, path.stem, f"Novel {path.stem}", ["novel"])
+            for path in Path(settings.novel_out_dir).glob("*.md")
+            if path.stem.isdigit() and len(path.stem) == 8
+        ]
+        return self._push_entries(self.manifest.batch("novels", candidates))
 
     def _sync_photos(self) -> int:
+        candidates = [
+            (path.stem, file_stamp(path), partial(_photo_row, path))
+            for path in Path(settings.photo_dir).glob("*.png")
+            if path.stem.isdigit() and len(path.stem) == 8
+        ]
+        # Rows pushed this run may be new and still lack their image_url.
+        force = {date.replace("-", "") for date in self._pushed_dates}
+        batch = self.manifest.batch("photos", candidates, force=force)
         verified = 0
-        for path in Path(settings.photo_dir).glob("*.png"):
-            if not (path.stem.isdigit() and len(path.stem) == 8):
-                continue
-            date_value = datetime.strptime(path.stem, "%Y%m%d").date().isoformat()
-            image_data, extension = ImageOptimizer.to_webp(path)
-            storage_path = f"photos/{path.stem}{extension}"
-            upload = self.client.storage.from_("vlog-photos").upload(
-                storage_path,
-                image_data,
-                {
-                    "content-type": f"image/{extension.lstrip('.')}",
-                    "upsert": "true",
-                },
-            )
-            if upload is None:
-                raise RuntimeError(f"Storage upload returned no result for {path}")
-            image_url = self.client.storage.from_("vlog-photos").get_public_url(
-                storage_path
-            )
-            for table in ("novels", "daily_entries"):
-                response = (
-                    self.client.table(table)
-                    .update({"image_url": image_url})
-                    .eq("date", date_value)
-                    .execute()
-                )
-                data = getattr(response, "data", None)
-                if not isinstance(data, list) or not data:
-                    raise RuntimeError(
-                        f"Image URL verification failed for {table} on {date_value}"
-                    )
+        for row in batch.rows:
+            self._push_photo(Path(settings.photo_dir) / f"{row['stem']}.png")
             verified += 1
+        self.manifest.record(batch)
+        self._unchanged += batch.unchanged
         return verified
 
+    def _push_photo(self, path: Path) -> None:
+        date_value = datetime.strptime(path.stem, "%Y%m%d").date().isoformat()
+        image_data, extension = ImageOptimizer.to_webp(path)
+        storage_path = f"photos/{path.stem}{extension}"
+        upload = self.client.storage.from_("vlog-photos").upload(
+            storage_path,
+            image_data,
+            {
+                "content-type": f"image/{extension.lstrip('.')}",
+                "upsert": "true",
+            },
+        )
+        if upload is None:
+            raise RuntimeError(f"Storage upload returned no result for {path}")
+        image_url = self.client.storage.from_("vlog-photos").get_public_url(
+            storage_path
+        )
+        for table in ("novels", "daily_entries"):
+            response = (
+                self.client.table(table)
+                .update({"image_url": image_url})
+                .eq("date", date_value)
+                .execute()
+            )
+            data = getattr(response, "data", None)
+            if not isinstance(data, list) or not data:
+                raise RuntimeError(
+                    f"Image URL verification failed for {table} on {date_value}"
+                )
+
     def _sync_evaluations(self) -> int:
-        rows: list[dict[str, Any]] = []
         eval_dir = Path(settings.summary_dir).parent / "evaluations"
-        for path in eval_dir.glob("*.json") if eval_dir.exists() else []:
-            if not (path.stem.isdigit() and len(path.stem) == 8):
-                continue
-            data = json.loads(path.read_text(encoding="utf-8"))
-            rows.append(
-                {
-                    "date": datetime.strptime(path.stem, "%Y%m%d").date().isoformat(),
-                    "target_type": "novel",
-                    "score": data.get("quality_score", 0),
-                    "reasoning": json.dumps(data, ensure_ascii=False),
-                }
-            )
-        return self._verified_upsert("evaluations", rows, "date,target_type")
+        candidates = [
+            (path.stem, file_stamp(path), partial(_evaluation_row, path))
+            for path in (eval_dir.glob("*.json") if eval_dir.exists() else [])
+            if path.stem.isdigit() and len(path.stem) == 8
+        ]
+        batch = self.manifest.batch("evaluations", candidates)
+        verified = self._verified_upsert("evaluations", batch.rows, "date,target_type")
+        self.manifest.record(batch)
+        self._unchanged += batch.unchanged
+        return verified
 
     def _write_report(self, report: SyncReport) -> None:
         report_dir = runtime_directories().state / "sync_reports"
@@ -203,3 +209,17 @@ class StrictSupabaseSync:
             encoding="utf-8",
         )
         temporary.replace(target)
+
+
+def _photo_row(path: Path) -> dict[str, Any]:
+    return {"stem": path.stem, "sha256": sha256(path.read_bytes()).hexdigest()}
+
+
+def _evaluation_row(path: Path) -> dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        "date": datetime.strptime(path.stem, "%Y%m%d").date().isoformat(),
+        "target_type": "novel",
+        "score": data.get("quality_score", 0),
+        "reasoning": json.dumps(data, ensure_ascii=False),
+    }
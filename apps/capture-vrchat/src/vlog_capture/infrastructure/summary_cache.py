@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from hashlib import sha256
+from pathlib import Path
+from typing import Iterator
+
+from vlog_capture.infrastructure.llm_cache import prune_entries
+from vlog_capture.infrastructure.settings import settings
+
+# Pruning walks every entry, so it runs on the first write and then every Nth.
+_PRUNE_EVERY = 64
+_writes = itertools.count()
+
+
+class SummaryChunkCache:
+    """Session notes keyed by the hash of their input text and prompt signature.
+
+    One file per entry, so a lookup never loads other days' notes. Entries not
+    read for ``max_age_days`` are dropped, and past ``max_bytes`` the least
+    recently used ones go first, as in ``LLMResponseCache``.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        max_bytes: int | None = None,
+        max_age_days: float | None = None,
+    ) -> None:
+        self._directory = Path(directory or settings.summary_chunk_dir)
+        self.max_bytes = (
+            settings.summary_chunk_max_bytes if max_bytes is None else max_bytes
+        )
+        days = (
+            settings.summary_chunk_max_age_days
+            if max_age_days is None
+            else max_age_days
+        )
+        self.max_age_seconds = days * 86400
+
+    def get(self, text: str, signature: str) -> str | None:
+        path = self._path(text, signature)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            notes = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return notes
+
+    def put(self, text: str, signature: str, notes: str) -> None:
+        path = self._path(text, signature)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(notes, encoding="utf-8")
+        tmp_path.replace(path)
+        if next(_writes) % _PRUNE_EVERY == 0:
+            self.prune()
+
+    def prune(self) -> int:
+        """Apply the age and size limits; returns the number of entries removed."""
+        return prune_entries(
+            self._directory.glob("*.txt"), self.max_age_seconds, self.max_bytes
+        )
+
+    def _path(self, text: str, signature: str) -> Path:
+        digest = sha256()
+        digest.update(signature.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return self._directory / f"{digest.hexdigest()}.txt"
+
+
+def split_for_context(text: str, limit: int) -> list[str]:
+    """Split ``text`` into pieces of at most ``limit`` chars.
+
+    Cuts prefer a line break, then a sentence end, then a space in the last
+    fifth of each window, so the same text always splits the same way.
+    """
+    if limit <= 0 or len(text) <= limit:
+        return [text]
+    pieces = []
+    start = 0
+    while len(text) - start > limit:
+        cut = _cut(text, start, limit)
+        pieces.append(text[start:cut])
+        start = cut
+    pieces.append(text[start:])
+    return pieces
+
+
+def iter_file_for_context(path: Path, limit: int) -> Iterator[str]:
+    """``split_for_context`` over a file's text, holding about ``limit`` chars."""
+    with open(path, encoding="utf-8") as handle:
+        if limit <= 0:
+            yield handle.read()
+            return
+        buffer = ""
+        while block := handle.read(limit):
+            buffer += block
+            while len(buffer) > limit:
+                cut = _cut(buffer, 0, limit)
+                yield buffer[:cut]
+                buffer = buffer[cut:]
+        yield buffer
+
+
+def _cut(text: str, start: int, limit: int) -> int:
+    window_end = start + limit
+    floor = start + limit * 4 // 5
+    for separator in ("\n", "。", " "):
+        cut = text.rfind(separator, floor, window_end)
+        if cut != -1:
+            return cut + 1
+    return window_end
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Collection, Iterable, Iterator, Mapping
+
+from vlog_capture.infrastructure.daily_state import fingerprint_text
+from vlog_capture.infrastructure.publication import (
+    is_publishable_summary,
+    summary_sources,
+)
+from vlog_capture.infrastructure.settings import settings
+
+BLOCKED = "blocked"
+# Keys per ``is_public`` update, keeping the PostgREST ``in`` filter URL short.
+_HIDE_CHUNK = 100
+
+# (row key, stat stamp of its inputs, builder returning the row or None if blocked)
+Candidate = tuple[str, Any, Callable[[], "dict[str, Any] | None"]]
+
+
+def file_stamp(*paths: Path) -> list[list[Any]]:
+    """Name, size, mtime and inode of each input; a missing file stamps as size -1."""
+    stamps: list[list[Any]] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            stamps.append([path.as_posix(), -1, 0, 0])
+            continue
+        stamps.append([path.as_posix(), stat.st_size, stat.st_mtime_ns, stat.st_ino])
+    return stamps
+
+
+def row_digest(row: Mapping[str, Any]) -> str:
+    return fingerprint_text(json.dumps(row, ensure_ascii=False, sort_keys=True))
+
+
+def entry_candidate(
+    path: Path, date_str: str, title: str, tags: list[str]
+) -> Candidate:
+    """Candidate for a ``daily_entries`` or ``novels`` row built from ``path``.
+
+    Publication depends on the date's source transcripts, so their stats are
+    part of the stamp and a changed transcript re-checks the row.
+    """
+    sources = summary_sources(date_str)
+    stamp = [settings.min_transcript_size_bytes, file_stamp(path, *sources)]
+    return (
+        path.as_posix(),
+        stamp,
+        partial(_entry_row, path, date_str, title, tags, sources),
+    )
+
+
+def hidden_chunks(batch: SyncBatch) -> Iterator[list[str]]:
+    for start in range(0, len(batch.blocked), _HIDE_CHUNK):
+        yield batch.blocked[start : start + _HIDE_CHUNK]
+
+
+def _entry_row(
+    path: Path,
+    date_str: str,
+    title: str,
+    tags: list[str],
+    sources: tuple[Path, ...],
+) -> dict[str, Any] | None:
+    if not is_publishable_summary(date_str, sources):
+        return None
+    return {
+        "file_path": path.as_posix(),
+        "date": datetime.strptime(date_str, "%Y%m%d").date().isoformat(),
+        "title": title,
+        "content": path.read_text(encoding="utf-8"),
+        "tags": tags,
+        "is_public": True,
+    }
+
+
+@dataclass
+class SyncBatch:
+    table: str
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    blocked: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+class SyncManifest:
+    """Last-synced content hash of each Supabase row, keyed by table and row key.
+
+    Entries also keep the stat stamp of the files a row was built from, so an
+    untouched row is skipped without reading anything. The manifest belongs to
+    one Supabase project; pointing at another one, or deleting the file,
+    makes the next sync a full one.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, path: Path | None = None, target: str | None = None) -> None:
+        self._path = Path(path or settings.sync_manifest_file)
+        self._target = settings.supabase_url if target is None else target
+        with self._lock:
+            self._tables = self._load()
+
+    def batch(
+        self,
+        table: str,
+        candidates: Iterable[Candidate],
+        force: Collection[str] = (),
+    ) -> SyncBatch:
+        """Split candidates into rows to upsert, keys to hide and unchanged rows.
+
+        Keys in ``force`` are rebuilt and sent even when the manifest has them.
+        """
+        batch = SyncBatch(table)
+        known = self._tables.get(table, {})
+        for key, stamp, build in candidates:
+            entry = known.get(key)
+            if entry is not None and entry.get("stamp") == stamp and key not in force:
+                batch.unchanged += 1
+                continue
+            row = build()
+            digest = BLOCKED if row is None else row_digest(row)
+            batch.entries[key] = {"stamp": stamp, "hash": digest}
+            if entry is not None and entry.get("hash") == digest and key not in force:
+                batch.unchanged += 1
+            elif row is None:
+                batch.blocked.append(key)
+            else:
+                batch.rows.append(row)
+        return batch
+
+    def record(self, batch: SyncBatch) -> None:
+        """Remember a batch once Supabase has accepted it."""
+        if not batch.entries:
+            return
+        with self._lock:
+            self._tables.setdefault(batch.table, {}).update(batch.entries)
+            self._save()
+
+    def _load(self) -> dict[str, dict[str, dict[str, Any]]]:
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if (
+            not isinstance(payload, dict)
+            or payload.get("target") != self._target
+            or not isinstance(payload.get("tables"), dict)
+        ):
+            return {}
+        return payload["tables"]
+
+    def _save(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(f"{self._path.suffix}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"version": 1, "target": self._target, "tables": self._tables},
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self._path)
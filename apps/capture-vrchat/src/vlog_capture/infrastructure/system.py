@@ -1,23 +1,59 @@
 from __future__ import annotations
 
+import functools
+import logging
+import math
 import os
 import re
 import subprocess
 import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Iterable,
+    Iterator,
+)
 
 import psutil
+from vlog_capture.infrastructure.model_registry import model_registry
+from vlog_capture.infrastructure.segment_store import (
+    SegmentWriter,
+    TranscriptSegment,
+    copy_segments,
+    segment_path,
+)
 from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.text_repetition import (
+    WordDeduper,
+    collapse_repetitions,
+    dedupe_adjacent_words,
+)
+from vlog_capture.infrastructure.transcript_cache import (
+    UNRECORDED_SIGNATURE,
+    TranscriptCache,
+    decoding_signature,
+)
 
 if TYPE_CHECKING:
     from faster_whisper import WhisperModel
 
+logger = logging.getLogger(__name__)
+
 SILENCE_THRESHOLD = 0.02
 _RECORD_START_TIMEOUT_SECONDS = 10.0
 _RECORD_STOP_TIMEOUT_SECONDS = 30.0
+_DECODE_OPTIONS: dict[str, Any] = {
+    "beam_size": 5,
+    "vad_filter": True,
+    "vad_parameters": {"min_silence_duration_ms": 100, "speech_pad_ms": 30},
+}
 
 
 @dataclass(frozen=True)
@@ -74,16 +110,165 @@ class SystemResourceMonitor:
 
 
 class RecordingThreadError(RuntimeError):
-    pass
+    def __init__(self, message: str, file_paths: tuple[str, ...] = ()) -> None:
+        super().__init__(message)
+        # Closed segments that are still usable after the thread failed.
+        self.file_paths = file_paths
+
+
+class AudioBlockRing:
+    """Bounded single-producer/single-consumer queue of preallocated audio blocks."""
+
+    def __init__(self, capacity: int, block_size: int, channels: int) -> None:
+        import numpy as np
+
+        self._blocks = np.zeros((capacity, block_size, channels), dtype=np.float32)
+        self._capacity = capacity
+        self._head = 0
+        self._depth = 0
+        self._condition = threading.Condition()
+        self.high_water = 0
+        self.dropped_blocks = 0
+        self.input_overflows = 0
+
+    @property
+    def depth(self) -> int:
+        with self._condition:
+            return self._depth
+
+    def push(self, data: Any, *, overflowed: bool = False) -> bool:
+        with self._condition:
+            if overflowed:
+                self.input_overflows += 1
+            if self._depth == self._capacity:
+                self.dropped_blocks += 1
+                return False
+            slot = self._head
+        # The consumer never reads a slot before depth covers it.
+        self._blocks[slot][...] = data
+        with self._condition:
+            self._head = (slot + 1) % self._capacity
+            self._depth += 1
+            self.high_water = max(self.high_water, self._depth)
+            self._condition.notify()
+        return True
+
+    def peek(self, timeout: float) -> Any | None:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._depth > 0, timeout):
+                return None
+            return self._blocks[(self._head - self._depth) % self._capacity]
+
+    def release(self) -> None:
+        with self._condition:
+            self._depth -= 1
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                "queue_depth": self._depth,
+                "queue_capacity": self._capacity,
+                "queue_high_water": self.high_water,
+                "dropped_blocks": self.dropped_blocks,
+                "input_overflows": self.input_overflows,
+            }
+
+
+class SilenceGate:
+    """Energy gate that keeps a short pre-roll and holds open through pauses.
+
+    Blocks below the threshold are parked in a preallocated pre-roll ring and
+    written ahead of the next speech block, so word onsets survive. After
+    speech, ``hangover_seconds`` of quieter blocks are still kept so soft
+    endings and short pauses are not clipped.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        block_size: int,
+        channels: int,
+        threshold: float = SILENCE_THRESHOLD,
+        preroll_seconds: float = 0.0,
+        hangover_seconds: float = 0.0,
+    ) -> None:
+        import numpy as np
+
+        self._np = np
+        self._threshold_sq = threshold * threshold
+        self._block_seconds = block_size / sample_rate
+        preroll_blocks = math.ceil(max(preroll_seconds, 0.0) / self._block_seconds)
+        self._preroll = np.zeros(
+            (max(preroll_blocks, 1), block_size, channels), dtype=np.float32
+        )
+        self._preroll_capacity = preroll_blocks
+        self._preroll_head = 0
+        self._preroll_count = 0
+        self._hangover_blocks = math.ceil(
+            max(hangover_seconds, 0.0) / self._block_seconds
+        )
+        self._hangover_left = 0
+        self.kept_blocks = 0
+        self.dropped_blocks = 0
+
+    def is_speech(self, block: Any) -> bool:
+        flat = block.reshape(-1)
+        if flat.size == 0:
+            return False
+        # sum(x^2) > T^2 * n is rms > T without sqrt/mean temporaries.
+        return float(self._np.dot(flat, flat)) > self._threshold_sq * flat.size
+
+    def feed(self, block: Any, write: Callable[[Any], object]) -> bool:
+        if self.is_speech(block):
+            self._flush_preroll(write)
+            self._hangover_left = self._hangover_blocks
+        elif self._hangover_left > 0:
+            self._hangover_left -= 1
+        else:
+            self._park(block)
+            return False
+        write(block)
+        self.kept_blocks += 1
+        return True
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "kept_seconds": round(self.kept_blocks * self._block_seconds, 3),
+            "dropped_seconds": round(self.dropped_blocks * self._block_seconds, 3),
+        }
+
+    def _park(self, block: Any) -> None:
+        if self._preroll_capacity == 0:
+            self.dropped_blocks += 1
+            return
+        if self._preroll_count == self._preroll_capacity:
+            self.dropped_blocks += 1
+        else:
+            self._preroll_count += 1
+        self._preroll[self._preroll_head][...] = block
+        self._preroll_head = (self._preroll_head + 1) % self._preroll_capacity
+
+    def _flush_preroll(self, write: Callable[[Any], object]) -> None:
+        start = self._preroll_head - self._preroll_count
+        for offset in range(self._preroll_count):
+            write(self._preroll[(start + offset) % self._preroll_capacity])
+        self.kept_blocks += self._preroll_count
+        self._preroll_count = 0
 
 
 class AudioRecorder:
-    def __init__(self) -> None:
+    def __init__(self, on_segment: Callable[[str], None] | None = None) -> None:
         self._base_dir = settings.recording_dir
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._started_event = threading.Event()
         self._current_file: str | None = None
+        self._segments: list[str] = []
+        self._on_segment = on_segment
+        self._ring: AudioBlockRing | None = None
+        self._gate: SilenceGate | None = None
+        self._reader_error: Exception | None = None
         self._last_error: Exception | None = None
         self._lock = threading.Lock()
 
@@ -92,10 +277,10 @@ class AudioRecorder:
             if self._current_file and self.is_recording:
                 return self._current_file
             os.makedirs(self._base_dir, exist_ok=True)
-            self._current_file = os.path.join(
-                self._base_dir, datetime.now().strftime("%Y%m%d_%H%M%S.flac")
-            )
+            self._segments = []
+            self._current_file = self._next_path()
             self._last_error = None
+            self._reader_error = None
             self._stop_event.clear()
             self._started_event.clear()
             self._thread = threading.Thread(
@@ -131,14 +316,19 @@ class AudioRecorder:
             raise TimeoutError("Audio recording thread did not stop within 30 seconds")
 
         error = self._last_error
-        path = self._cleanup_state(remove_empty=False)
-        if error is not None:
-            raise RecordingThreadError("Audio recording thread failed") from error
-        if path and os.path.exists(path):
+        usable: list[str] = []
+        for path in self._cleanup_state(remove_empty=False):
+            if not os.path.exists(path):
+                continue
             if os.path.getsize(path) > 100:
-                return (path,)
-            os.unlink(path)
-        return None
+                usable.append(path)
+            else:
+                os.unlink(path)
+        if error is not None:
+            raise RecordingThreadError(
+                "Audio recording thread failed", file_paths=tuple(usable)
+            ) from error
+        return tuple(usable) or None
 
     @property
     def is_recording(self) -> bool:
@@ -148,132 +338,565 @@ class AudioRecorder:
     def last_error(self) -> Exception | None:
         return self._last_error
 
-    def _cleanup_state(self, *, remove_empty: bool) -> str | None:
+    def stats(self) -> dict[str, int | float]:
+        stats: dict[str, int | float] = {}
+        if self._ring is not None:
+            stats.update(self._ring.stats())
+        if self._gate is not None:
+            stats.update(self._gate.stats())
+        return stats
+
+    def _next_path(self) -> str:
+        stamp = datetime.now()
+        while True:
+            path = os.path.join(self._base_dir, stamp.strftime("%Y%m%d_%H%M%S.flac"))
+            if not os.path.exists(path) and path not in self._segments:
+                return path
+            stamp += timedelta(seconds=1)
+
+    def _cleanup_state(self, *, remove_empty: bool) -> tuple[str, ...]:
         with self._lock:
-            path = self._current_file
+            paths = tuple(self._segments)
+            if self._current_file:
+                paths += (self._current_file,)
             self._thread = None
             self._current_file = None
-            if remove_empty and path and os.path.exists(path):
-                try:
-                    if os.path.getsize(path) <= 100:
-                        os.unlink(path)
-                except OSError:
-                    pass
-            return path
+            self._segments = []
+            if remove_empty:
+                for path in paths:
+                    try:
+                        if os.path.exists(path) and os.path.getsize(path) <= 100:
+                            os.unlink(path)
+                    except OSError:
+                        pass
+            return paths
+
+    def _should_rotate(
+        self, path: str, opened_at: float, frames: int, silent_since: float | None
+    ) -> bool:
+        if frames == 0:
+            return False
+        now = time.monotonic()
+        if settings.segment_seconds > 0 and now - opened_at >= settings.segment_seconds:
+            return True
+        if (
+            settings.segment_max_bytes > 0
+            and os.path.getsize(path) >= settings.segment_max_bytes
+        ):
+            return True
+        # Closing at long silences only pays off when segments are consumed live.
+        return (
+            self._on_segment is not None
+            and silent_since is not None
+            and settings.segment_silence_seconds > 0
+            and now - silent_since >= settings.segment_silence_seconds
+        )
+
+    def _rotate_segment(self) -> str:
+        with self._lock:
+            closed = self._current_file
+            if closed is None:
+                raise RecordingThreadError("Recording path was not initialized")
+            self._segments.append(closed)
+            self._current_file = self._next_path()
+            next_path = self._current_file
+        if self._on_segment is not None:
+            try:
+                self._on_segment(closed)
+            except Exception:
+                logger.exception("Closed segment callback failed: %s", closed)
+        return next_path
+
+    def _read_loop(self, stream: Any, ring: AudioBlockRing) -> None:
+        # Keep this thread minimal: anything slow here loses input blocks.
+        try:
+            while not self._stop_event.is_set():
+                data, overflowed = stream.read(settings.block_size)
+                ring.push(data, overflowed=overflowed)
+        except Exception as exc:
+            self._reader_error = exc
 
     def _record_loop(self) -> None:
         # PortAudio and NumPy are only required when recording actually starts.
-        import numpy as np
         import sounddevice as sd
         import soundfile as sf
 
+        def open_segment(path: str) -> "sf.SoundFile":
+            return sf.SoundFile(
+                path,
+                mode="w",
+                samplerate=settings.sample_rate,
+                channels=settings.channels,
+                subtype="PCM_16",
+                format="FLAC",
+            )
+
+        file = None
         try:
             path = self._current_file
             if path is None:
                 raise RecordingThreadError("Recording path was not initialized")
-            with (
-                sf.SoundFile(
-                    path,
-                    mode="w",
-                    samplerate=settings.sample_rate,
-                    channels=settings.channels,
-                    subtype="PCM_16",
-                    format="FLAC",
-                ) as file,
-                sd.InputStream(
-                    samplerate=settings.sample_rate,
-                    channels=settings.channels,
-                    blocksize=settings.block_size,
-                ) as stream,
-            ):
-                self._started_event.set()
-                while not self._stop_event.is_set():
-                    data, overflowed = stream.read(settings.block_size)
-                    if overflowed:
-                        raise RecordingThreadError("Audio input overflow detected")
-                    rms_source = (
-                        np.frombuffer(data, dtype=np.int16)
-                        if isinstance(data, bytes)
-                        else data
-                    )
-                    if rms_source.size > 0:
-                        rms = float(np.sqrt(np.mean(np.square(rms_source))))
-                        if rms > SILENCE_THRESHOLD:
-                            file.write(data)
+            ring = AudioBlockRing(
+                capacity=max(
+                    2,
+                    math.ceil(
+                        settings.ring_buffer_seconds
+                        * settings.sample_rate
+                        / settings.block_size
+                    ),
+                ),
+                block_size=settings.block_size,
+                channels=settings.channels,
+            )
+            self._ring = ring
+            gate = SilenceGate(
+                sample_rate=settings.sample_rate,
+                block_size=settings.block_size,
+                channels=settings.channels,
+                preroll_seconds=settings.preroll_seconds,
+                hangover_seconds=settings.hangover_seconds,
+            )
+            self._gate = gate
+            file = open_segment(path)
+            segment_path = path
+            with sd.InputStream(
+                samplerate=settings.sample_rate,
+                channels=settings.channels,
+                blocksize=settings.block_size,
+            ) as stream:
+                reader = threading.Thread(
+                    target=self._read_loop,
+                    args=(stream, ring),
+                    name="vlog-audio-reader",
+                    daemon=True,
+                )
+                reader.start()
+                try:
+                    self._started_event.set()
+                    opened_at = time.monotonic()
+                    frames = 0
+                    silent_since: float | None = None
+                    while True:
+                        block = ring.peek(timeout=0.1)
+                        if block is None:
+                            if self._reader_error is not None:
+                                raise RecordingThreadError(
+                                    "Audio input stream failed"
+                                ) from self._reader_error
+                            if not reader.is_alive():
+                                break
+                        else:
+                            try:
+                                if gate.feed(block, file.write):
+                                    frames += len(block)
+                                    silent_since = None
+                                elif silent_since is None:
+                                    silent_since = time.monotonic()
+                            finally:
+                                ring.release()
+                        if self._should_rotate(
+                            segment_path, opened_at, frames, silent_since
+                        ):
+                            # The reader keeps filling the ring meanwhile, so
+                            # consecutive segments have no gap between them.
+                            file.close()
+                            segment_path = self._rotate_segment()
+                            file = open_segment(segment_path)
+                            opened_at = time.monotonic()
+                            frames = 0
+                            silent_since = None
+                finally:
+                    self._stop_event.set()
+                    reader.join()
         except Exception as exc:
             self._last_error = exc
             self._started_event.set()
         finally:
+            if file is not None:
+                file.close()
             self._started_event.set()
 
 
+def whisper_signature(compute_type: str | None = None) -> str:
+    """Decoding signature for the configured model at ``compute_type``."""
+    return decoding_signature(
+        settings.whisper_model_size,
+        compute_type or settings.whisper_compute_type,
+        _DECODE_OPTIONS,
+    )
+
+
+# Model keys whose CUDA load failed in this process; they load on CPU int8.
+_cuda_load_failures: set[str] = set()
+
+
+@functools.cache
+def _cuda_device_count() -> int | None:
+    try:
+        import ctranslate2
+    except ImportError:
+        return None
+    return ctranslate2.get_cuda_device_count()
+
+
 class Transcriber:
-    def __init__(self) -> None:
-        self._model: "WhisperModel | None" = None
+    def __init__(
+        self,
+        device: str | None = None,
+        compute_type: str | None = None,
+        cpu_threads: int = 0,
+        cache: TranscriptCache | None = None,
+        also_current: Collection[str] = (),
+    ) -> None:
+        self._device = device
+        self._compute_type = compute_type
+        self._cpu_threads = cpu_threads
+        self._cache = cache or TranscriptCache()
+        # Other decoding signatures whose transcripts are as good as our own.
+        self._also_current = tuple(also_current)
 
     @property
     def model(self) -> "WhisperModel":
-        if self._model is None:
-            import ctranslate2
-            from faster_whisper import WhisperModel
+        device, _ = self._setup()
+        try:
+            return self._registered_model()
+        except RuntimeError:
+            if device == "cpu":
+                raise
+            # Missing CUDA/cuDNN libraries surface only when the model loads.
+            logger.warning(
+                "Whisper failed to load on %s; falling back to CPU int8",
+                device,
+                exc_info=True,
+            )
+            _cuda_load_failures.add(self._configured_key)
+            return self._registered_model()
 
-            device = settings.whisper_device
-            compute_type = settings.whisper_compute_type
-            if device == "cuda" and ctranslate2.get_cuda_device_count() == 0:
-                device = "cpu"
-                compute_type = "int8"
+    def _registered_model(self) -> "WhisperModel":
+        device, compute_type = self._setup()
+        memory_mb = (
+            settings.whisper_worker_memory_mb
+            if compute_type.startswith("int8")
+            else settings.whisper_model_memory_mb
+        )
+        return model_registry.get(
+            self._model_key,
+            self._load_model,
+            nbytes=memory_mb * 1024 * 1024,
+            device=device,
+        )
+
+    def _setup(self) -> tuple[str, str]:
+        """Device and compute type the model is (or will be) loaded with."""
+        device = self._device or settings.whisper_device
+        compute_type = self._compute_type or settings.whisper_compute_type
+        if device == "cuda" and (
+            _cuda_device_count() == 0 or self._configured_key in _cuda_load_failures
+        ):
+            return "cpu", "int8"
+        return device, compute_type
+
+    @property
+    def _configured_key(self) -> str:
+        return self._key(
+            self._device or settings.whisper_device,
+            self._compute_type or settings.whisper_compute_type,
+        )
+
+    @property
+    def _model_key(self) -> str:
+        return self._key(*self._setup())
 
-            self._model = WhisperModel(
+    def _key(self, device: str, compute_type: str) -> str:
+        return ":".join(
+            (
+                "whisper",
                 settings.whisper_model_size,
-                device=device,
-                compute_type=compute_type,
+                device,
+                compute_type,
+                str(self._cpu_threads),
             )
-        return self._model
+        )
 
-    def transcribe(self, audio_path: str) -> str:
-        segments, _ = self.model.transcribe(
-            audio_path,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(min_silence_duration_ms=100, speech_pad_ms=30),
+    def _load_model(self) -> "WhisperModel":
+        from faster_whisper import WhisperModel
+
+        device, compute_type = self._setup()
+        return WhisperModel(
+            settings.whisper_model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=self._cpu_threads,
         )
-        return " ".join(segment.text.strip() for segment in segments).strip()
+
+    @property
+    def is_loaded(self) -> bool:
+        return model_registry.is_resident(self._model_key)
+
+    @property
+    def signature(self) -> str:
+        """Signature of the setup that actually decodes, CPU fallback included."""
+        return whisper_signature(self._setup()[1])
+
+    def transcribe(self, audio_path: str) -> str:
+        return " ".join(
+            segment.text for segment in self.iter_segments(audio_path)
+        ).strip()
+
+    def iter_segments(self, audio_path: str) -> Iterator[TranscriptSegment]:
+        segments, _ = self.model.transcribe(audio_path, **_DECODE_OPTIONS)
+        for segment in segments:
+            yield TranscriptSegment.from_whisper(segment)
+
+    def transcript_path(self, audio_path: str) -> str:
+        return str(_transcript_path(audio_path))
+
+    def _cached_path(self, audio_path: str) -> Path | None:
+        out_path = _transcript_path(audio_path)
+        digest = self._cache.digest(audio_path)
+        accepted = self._also_current
+        configured = whisper_signature(self._compute_type)
+        if configured != self.signature:
+            # Transcripts from the configured setup beat our CPU fallback's.
+            accepted = (*accepted, configured)
+        cached = self._cache.lookup(digest, self.signature, accepted)
+        if cached is not None:
+            if cached.transcript != out_path:
+                # Renamed recording: reuse the transcript under the new stem.
+                text = cached.transcript.read_text(encoding="utf-8").strip()
+                out_path.write_text(text + "\n", encoding="utf-8")
+                copy_segments(cached.transcript, out_path)
+                self._cache.record(digest, out_path, cached.signature, audio_path)
+            return out_path
+        if (
+            out_path.exists()
+            and self._cache.entry(digest) is None
+            and not self._cache.is_indexed(out_path)
+        ):
+            # Transcript written before the index existed; adopt it as is.
+            self._cache.record(digest, out_path, UNRECORDED_SIGNATURE, audio_path)
+            return out_path
+        return None
+
+    def cached(self, audio_path: str) -> tuple[str, str] | None:
+        """Return the transcript for this audio if the cache holds a current one."""
+        path = self._cached_path(audio_path)
+        if path is None:
+            return None
+        return path.read_text(encoding="utf-8").strip(), str(path)
+
+    def iter_transcript(self, audio_path: str) -> Iterator[str]:
+        """Yield the transcript in pieces as Whisper decodes it.
+
+        The pieces join to the text ``transcribe_and_save`` returns, and the
+        transcript file and cache entry are written the same way.
+        """
+        path = self._cached_path(audio_path)
+        if path is not None:
+            yield from _read_stripped(path)
+            return
+        yield from self._transcribe_to_disk(audio_path)
 
     def transcribe_and_save(self, audio_path: str) -> tuple[str, str]:
-        base = Path(audio_path).stem
-        os.makedirs(settings.transcript_dir, exist_ok=True)
-        out_path = Path(settings.transcript_dir) / f"{base}.txt"
-        if out_path.exists():
-            return out_path.read_text(encoding="utf-8").strip(), str(out_path)
-        text = self.transcribe(audio_path)
-        out_path.write_text(text + "\n", encoding="utf-8")
-        return text, str(out_path)
+        hit = self.cached(audio_path)
+        if hit is not None:
+            return hit
+        text = "".join(self._transcribe_to_disk(audio_path))
+        return text, self.transcript_path(audio_path)
+
+    def _transcribe_to_disk(self, audio_path: str) -> Iterator[str]:
+        # Writes the transcript, its segment store and the cache entry.
+        out_path = _transcript_path(audio_path)
+        partial = out_path.with_name(out_path.name + ".part")
+        try:
+            with (
+                SegmentWriter(segment_path(out_path)) as store,
+                open(partial, "w", encoding="utf-8") as handle,
+            ):
+                texts = self._stored_texts(audio_path, store)
+                for piece in _join_segments(texts):
+                    handle.write(piece)
+                    yield piece
+                handle.write("\n")
+            partial.replace(out_path)
+        finally:
+            partial.unlink(missing_ok=True)
+        self._cache.record(
+            self._cache.digest(audio_path), out_path, self.signature, audio_path
+        )
+
+    def _stored_texts(self, audio_path: str, store: SegmentWriter) -> Iterator[str]:
+        for segment in self.iter_segments(audio_path):
+            store.append(segment)
+            yield segment.text
 
     def unload(self) -> None:
-        self._model = None
+        model_registry.release(self._model_key)
+
+
+def _transcript_path(audio_path: str) -> Path:
+    os.makedirs(settings.transcript_dir, exist_ok=True)
+    return Path(settings.transcript_dir) / f"{Path(audio_path).stem}.txt"
+
+
+def _join_segments(texts: Iterable[str]) -> Iterator[str]:
+    # Streams " ".join(texts).strip() for texts that are already stripped.
+    started = False
+    gap = 0
+    for text in texts:
+        if started:
+            gap += 1
+        if text:
+            yield " " * gap + text if started else text
+            started = True
+            gap = 0
+
+
+def _read_stripped(path: Path, chunk_size: int = 1 << 16) -> Iterator[str]:
+    # Streams path.read_text().strip() without holding the whole file.
+    held = ""
+    started = False
+    with open(path, encoding="utf-8") as handle:
+        while chunk := handle.read(chunk_size):
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            body = chunk.rstrip()
+            if body:
+                yield held + body
+                held = chunk[len(body) :]
+            else:
+                held += chunk
 
 
 class ProcessMonitor:
-    def __init__(self) -> None:
+    """Detect VRChat, re-checking only the last matched process while it lives.
+
+    The match is remembered as ``(pid, start time)`` and shared by all monitors
+    in the process, so the short-lived monitors of the daily jobs hit it too.
+    A full scan (``/proc`` when available, psutil otherwise) runs only on a miss.
+    """
+
+    _matches: ClassVar[dict[tuple[Path, frozenset[str]], tuple[int, str]]] = {}
+    _matches_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, proc_root: Path = Path("/proc")) -> None:
         self._targets = {name.lower() for name in settings.process_names}
+        self._proc_root = proc_root
+        self._proc_dir = str(proc_root)
+        self._cache_key = (proc_root, frozenset(self._targets))
         self._last_status = False
+        self._stable_ticks = 0
 
     def is_running(self) -> bool:
         current_status = self._check_processes()
+        if current_status == self._last_status:
+            self._stable_ticks += 1
+        else:
+            self._stable_ticks = 0
         self._last_status = current_status
         return current_status
 
+    def next_interval(self) -> float:
+        """Seconds until the next check; backs off while the status is stable."""
+        base = float(settings.check_interval)
+        if not settings.adaptive_check_interval:
+            return base
+        backoff = base * 2 ** min(self._stable_ticks, 16)
+        return min(max(base, settings.max_check_interval), backoff)
+
     def _check_processes(self) -> bool:
-        for proc in psutil.process_iter(["name", "exe"]):
-            name = (proc.info.get("name") or "").lower()
-            exe = (proc.info.get("exe") or "").lower()
-            if name in self._targets or exe in self._targets:
+        with self._matches_lock:
+            cached = self._matches.get(self._cache_key)
+        if cached is not None:
+            pid, started = cached
+            if self._start_time(pid) == started:
                 return True
-            if any(target in name for target in self._targets):
-                return True
-            if any(target in exe for target in self._targets):
-                return True
-        return False
+
+        match = self._scan()
+        with self._matches_lock:
+            if match is None:
+                self._matches.pop(self._cache_key, None)
+            else:
+                self._matches[self._cache_key] = match
+        return match is not None
+
+    def _matches_target(self, name: str, exe: str) -> bool:
+        name = name.lower()
+        exe = exe.lower()
+        return any(target in name or target in exe for target in self._targets)
+
+    def _scan(self) -> tuple[int, str] | None:
+        if self._proc_root.is_dir():
+            return self._scan_proc()
+        for proc in psutil.process_iter(["name", "exe", "create_time"]):
+            name = proc.info.get("name") or ""
+            exe = proc.info.get("exe") or ""
+            if self._matches_target(name, exe):
+                return proc.pid, str(proc.info.get("create_time"))
+        return None
+
+    def _scan_proc(self) -> tuple[int, str] | None:
+        # Plain string paths: pathlib overhead dominates a scan of thousands of pids.
+        root = self._proc_dir
+        pids = [entry.name for entry in os.scandir(root) if entry.name.isdigit()]
+        # Names are one small read each; exe links are only followed if no name matched.
+        for pid in pids:
+            if self._matches_target(self._proc_name(pid), ""):
+                started = self._start_time(int(pid))
+                if started is not None:
+                    return int(pid), started
+        for pid in pids:
+            try:
+                exe = os.readlink(f"{root}/{pid}/exe")
+            except OSError:
+                continue
+            if self._matches_target("", exe):
+                started = self._start_time(int(pid))
+                if started is not None:
+                    return int(pid), started
+        return None
+
+    def _proc_name(self, pid: str) -> str:
+        base = f"{self._proc_dir}/{pid}"
+        try:
+            with open(f"{base}/comm", "rb") as handle:
+                name = handle.read().decode("utf-8", errors="replace").strip()
+        except OSError:
+            return ""
+        if len(name) < 15:
+            return name
+        # comm is truncated to 15 characters; recover the full name from argv[0].
+        try:
+            with open(f"{base}/cmdline", "rb") as handle:
+                argv0 = handle.read().split(b"\0", 1)[0]
+        except OSError:
+            return name
+        full = re.split(r"[\\/]", argv0.decode("utf-8", errors="replace"))[-1]
+        return full if full.startswith(name) else name
+
+    def _start_time(self, pid: int) -> str | None:
+        if self._proc_root.is_dir():
+            try:
+                with open(f"{self._proc_dir}/{pid}/stat", "rb") as handle:
+                    stat = handle.read().decode("utf-8", errors="replace")
+            except OSError:
+                return None
+            # Field 22 (starttime); the command name may itself contain spaces.
+            return stat.rsplit(")", 1)[-1].split()[19]
+        try:
+            return str(psutil.Process(pid).create_time())
+        except psutil.Error:
+            return None
+
+
+_TOKEN_CHAR = r"[^\s、。?!]"
+_REPEATED_PUNCTUATION = re.compile(r"([、。])\1+")
+_LEADING_PUNCTUATION = re.compile(r"^[、。]+")
+_SPACED_PUNCTUATION = re.compile(r" [、。]+")
+_SPACE = re.compile(r"\s")
 
 
 class TranscriptPreprocessor:
@@ -316,6 +939,17 @@ class TranscriptPreprocessor:
         r"ん",
     ]
 
+    # Fillers only count as whole tokens between separators, so one scan with an
+    # anchored alternation removes them all; nothing it leaves can form a new one.
+    _FILLER_PATTERN = re.compile(
+        rf"(?<!{_TOKEN_CHAR})"
+        f"(?:{'|'.join(sorted(FILLERS, key=len, reverse=True))})"
+        rf"(?!{_TOKEN_CHAR})"
+    )
+
+    def stream(self) -> "StreamingTranscriptPreprocessor":
+        return StreamingTranscriptPreprocessor(self, settings.repetition_max_period)
+
     def process(self, text: str) -> str:
         text = self._normalize_text(text)
         text = self._remove_repetition(text)
@@ -328,29 +962,154 @@ class TranscriptPreprocessor:
         return re.sub(r"\.{2,}", " ", txt)
 
     def _remove_repetition(self, txt: str) -> str:
-        return re.sub(r"(.{1,4}?)\1{4,}", r"\1", txt)
+        collapsed = collapse_repetitions(txt, settings.repetition_max_period)
+        if collapsed.removed_chars:
+            logger.info(
+                "Collapsed %d repeated characters from transcript",
+                collapsed.removed_chars,
+            )
+        return collapsed.text
 
     def _remove_fillers(self, txt: str) -> str:
-        fillers = sorted(self.FILLERS, key=len, reverse=True)
-        pattern = f"(^|[\\s、。?!])({'|'.join(fillers)})(?=[\\s、。?!]|$)"
-
-        def repl(match: re.Match[str]) -> str:
-            leading = match.group(1)
-            return (leading if leading != "^" else "") + " "
-
-        for _ in range(20):
-            previous = txt
-            txt = re.sub(pattern, repl, txt)
-            if txt == previous:
-                break
-        txt = re.sub(r"\s+", " ", txt).strip()
-        txt = re.sub(r"([、。])\1+", r"\1", txt)
-        txt = re.sub(r"^[、。]+", "", txt).strip()
-        txt = re.sub(r"\s+[、。]+", "", txt)
-        return re.sub(r"\s+", " ", txt).strip()
+        # str.split() and \s agree on whitespace; split/join is the faster collapse.
+        txt = " ".join(self._FILLER_PATTERN.sub(" ", txt).split())
+        txt = _REPEATED_PUNCTUATION.sub(r"\1", txt)
+        txt = _LEADING_PUNCTUATION.sub("", txt).lstrip()
+        # Spaces are single here, so dropping " 、" runs cannot leave doubles.
+        return _SPACED_PUNCTUATION.sub("", txt)
 
     def _dedupe_words(self, txt: str) -> str:
-        return re.sub(r"(\S+)\s+\1\b", r"\1", txt)
+        return dedupe_adjacent_words(txt)
 
     def _merge_lines(self, txt: str) -> str:
         return re.sub(r"\s+", " ", txt.replace("\n", " ")).strip()
+
+
+class StreamingTranscriptPreprocessor:
+    """Incremental ``TranscriptPreprocessor.process`` with bounded carry-over.
+
+    Text may be fed in pieces split anywhere; the concatenated output of
+    ``feed`` and ``finish`` equals ``process`` on the concatenated input. The
+    repetition stage waits for a whitespace cut that no periodic run of up to
+    ``max_period`` chars crosses, fillers and punctuation are cleaned per chunk,
+    and the word dedupe holds back its last two tokens.
+    """
+
+    _FRESH, _STARTED, _EMITTING = range(3)
+    # A run this long without a safe cut is split anyway to bound memory.
+    _MAX_PENDING_CHARS = 1 << 20
+    # collapse_repetitions' default, which the batch path uses.
+    _MIN_REPEATS = 5
+
+    def __init__(self, preprocessor: TranscriptPreprocessor, max_period: int) -> None:
+        self._preprocessor = preprocessor
+        self._max_period = max_period
+        self._reach = self._MIN_REPEATS * max_period
+        self._raw = ""
+        # Normalised text; ``[:_start]`` is already processed and kept as context.
+        self._buffer = ""
+        self._start = 0
+        self._checked = 0
+        self._state = self._FRESH
+        self._deduper = WordDeduper()
+        self.removed_repetition_chars = 0
+
+    def feed(self, text: str) -> str:
+        raw = self._raw + text
+        # A trailing run of dots may continue in the next piece.
+        keep = len(raw.rstrip("."))
+        self._raw = raw[keep:]
+        self._buffer += self._preprocessor._normalize_text(raw[:keep])
+        cut = self._find_cut()
+        if cut is None:
+            return ""
+        head = self._buffer[self._start : cut]
+        self._start = cut
+        # Keep enough context to measure runs that reach back over the cut.
+        drop = max(0, self._start - self._reach)
+        self._buffer = self._buffer[drop:]
+        self._start -= drop
+        self._checked -= drop
+        return self._emit(head)
+
+    def finish(self) -> str:
+        self._buffer += self._preprocessor._normalize_text(self._raw)
+        output = self._emit(self._buffer[self._start :]) + self._deduper.finish()
+        if self.removed_repetition_chars:
+            logger.info(
+                "Collapsed %d repeated characters from transcript",
+                self.removed_repetition_chars,
+            )
+        self._raw = self._buffer = ""
+        self._start = self._checked = 0
+        self._state = self._FRESH
+        return output
+
+    def _find_cut(self) -> int | None:
+        low = max(self._checked, self._start + 1)
+        # Judging a cut needs a full collapsible run's worth of text after it.
+        high = len(self._buffer) - self._reach
+        self._checked = max(low, high)
+        candidates = [
+            match.start()
+            for match in _SPACE.finditer(self._buffer, low, max(low, high))
+        ]
+        for cut in reversed(candidates):
+            if not self._run_crosses(cut):
+                return cut
+        if len(self._buffer) - self._start > self._MAX_PENDING_CHARS:
+            return candidates[-1] if candidates else len(self._buffer)
+        return None
+
+    def _run_crosses(self, cut: int) -> bool:
+        # A collapse of period p needs a p-periodic stretch of _MIN_REPEATS * p
+        # chars; if none spans the cut, no match crosses it and both halves
+        # collapse exactly as the whole would.
+        text = self._buffer
+        end = len(text)
+        for period in range(1, self._max_period + 1):
+            need = (self._MIN_REPEATS - 1) * period
+            i = max(0, cut - period)
+            while i < cut:
+                if text[i] != text[i + period]:
+                    i += 1
+                    continue
+                first = i
+                while first > 0 and text[first - 1] == text[first - 1 + period]:
+                    first -= 1
+                    if i - first >= need:
+                        return True
+                last = i
+                while text[last] == text[last + period]:
+                    last += 1
+                    if last - first >= need or last + period >= end:
+                        return True
+                i = last + 1
+        return False
+
+    def _emit(self, head: str) -> str:
+        collapsed = collapse_repetitions(head, self._max_period)
+        self.removed_repetition_chars += collapsed.removed_chars
+        cleaned = self._clean(collapsed.text)
+        return self._deduper.feed(cleaned) if cleaned else ""
+
+    def _clean(self, chunk: str) -> str:
+        txt = " ".join(self._preprocessor._FILLER_PATTERN.sub(" ", chunk).split())
+        if not txt:
+            return ""
+        txt = _REPEATED_PUNCTUATION.sub(r"\1", txt)
+        if self._state == self._FRESH:
+            # Only the very start of the transcript loses its leading punctuation.
+            self._state = self._STARTED
+            txt = _LEADING_PUNCTUATION.sub("", txt).lstrip()
+        elif self._state == self._EMITTING:
+            stripped = _LEADING_PUNCTUATION.sub("", txt)
+            if stripped == txt:
+                txt = " " + txt
+            else:
+                # " 、" across the chunk boundary: drop it and join directly.
+                txt = stripped
+        txt = _SPACED_PUNCTUATION.sub("", txt)
+        if txt:
+            self._state = self._EMITTING
+        return txt
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+_WHITESPACE_SPLIT = re.compile(r"(\s+)")
+# Past this many candidate offsets a border search switches to KMP.
+_DIRECT_PROBES = 16
+
+
+@dataclass(frozen=True)
+class RepetitionCollapse:
+    text: str
+    removed_chars: int
+
+
+def collapse_repetitions(
+    text: str, max_period: int = 4, min_repeats: int = 5
+) -> RepetitionCollapse:
+    """Replace a unit of up to ``max_period`` chars repeated ``min_repeats``+ times.
+
+    Matches ``re.sub(rf"(.{{1,{max_period}}}?)\\1{{{min_repeats - 1},}}", r"\\1")``
+    exactly, but runs in O(n * max_period): for every period the length of the
+    periodic run starting at each offset is computed in one vectorised pass, and
+    the leftmost, shortest-period run is collapsed first.
+    """
+    n = len(text)
+    if max_period < 1 or min_repeats < 2 or n < min_repeats:
+        return RepetitionCollapse(text, 0)
+
+    import numpy as np
+
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    # "." does not match a newline, so a unit may not contain one.
+    not_newline = codes != ord("\n")
+    offsets = np.arange(n)
+    candidates = []
+    for period in range(1, max_period + 1):
+        need = (min_repeats - 1) * period
+        if n < period + need:
+            break
+        span = n - period
+        same = (codes[period:] == codes[:span]) & not_newline[:span]
+        breaks = np.where(same, span, offsets[:span])
+        run = np.minimum.accumulate(breaks[::-1])[::-1] - offsets[:span]
+        starts = np.flatnonzero(run >= need)
+        if starts.size:
+            candidates.append((period, starts, run[starts] // period))
+
+    pieces: list[str] = []
+    removed = 0
+    position = 0
+    while candidates:
+        best: tuple[int, int, int] | None = None
+        for period, starts, extra in candidates:
+            index = int(starts.searchsorted(position))
+            if index < starts.size and (best is None or starts[index] < best[0]):
+                best = (int(starts[index]), period, int(extra[index]))
+        if best is None:
+            break
+        start, period, extra = best
+        pieces.append(text[position : start + period])
+        removed += extra * period
+        position = start + (extra + 1) * period
+    pieces.append(text[position:])
+    return RepetitionCollapse("".join(pieces), removed)
+
+
+def dedupe_adjacent_words(text: str) -> str:
+    """Linear-time equivalent of ``re.sub(r"(\\S+)\\s+\\1\\b", r"\\1", text)``.
+
+    The regex backtracks through every suffix of a token, which is quadratic on
+    the long space-free runs typical of Japanese transcripts. Here each pair of
+    neighbouring tokens is compared once: the longest suffix of the left token
+    that also starts the right token and ends on a word boundary is dropped from
+    the right token together with the whitespace in between.
+    """
+    deduper = WordDeduper()
+    return deduper.feed(text) + deduper.finish()
+
+
+class WordDeduper:
+    """Incremental ``dedupe_adjacent_words`` holding back only the last two tokens.
+
+    A token is final once a later one has started, so text may arrive in chunks
+    split anywhere.
+    """
+
+    def __init__(self) -> None:
+        self._pending = ""
+        # Chars of the first pending token already consumed by a match.
+        self._skip = 0
+
+    def feed(self, text: str) -> str:
+        self._pending += text
+        return self._drain(final=False)
+
+    def finish(self) -> str:
+        output = self._drain(final=True) + self._pending[self._skip :]
+        self._pending = ""
+        self._skip = 0
+        return output
+
+    def _drain(self, final: bool) -> str:
+        parts = _WHITESPACE_SPLIT.split(self._pending)
+        # parts alternate token, gap, token...; the last token may still grow,
+        # so without ``final`` the pair ending in it waits for more text.
+        last_left = len(parts) - (3 if final else 5)
+        pieces: list[str] = []
+        index = 0
+        while index <= last_left:
+            left, gap, right = parts[index], parts[index + 1], parts[index + 2]
+            length = _shared_word_length(left, right, self._skip)
+            pieces.append(left[self._skip :])
+            if length:
+                self._skip = length
+            else:
+                pieces.append(gap)
+                self._skip = 0
+            index += 2
+        if index:
+            self._pending = "".join(parts[index:])
+        return "".join(pieces)
+
+
+def _is_word(char: str | None) -> bool:
+    return char is not None and (char.isalnum() or char == "_")
+
+
+def _ends_on_boundary(right: str, length: int) -> bool:
+    following = right[length] if length < len(right) else None
+    return _is_word(right[length - 1]) != _is_word(following)
+
+
+def _shared_word_length(left: str, right: str, allowed: int) -> int:
+    """Longest ``L`` with ``left[-L:] == right[:L]``, ``L <= len(left) - allowed``
+    and a word boundary after ``right[:L]``; 0 when there is none."""
+    if not left or not right or allowed >= len(left):
+        return 0
+    first = right[0]
+    start = left.find(first, allowed)
+    probes = 0
+    while start != -1:
+        length = len(left) - start
+        if (
+            length <= len(right)
+            and right.startswith(left[start:])
+            and _ends_on_boundary(right, length)
+        ):
+            return length
+        probes += 1
+        if probes > _DIRECT_PROBES:
+            return _shared_word_length_kmp(left, right, start + 1)
+        start = left.find(first, start + 1)
+    return 0
+
+
+def _shared_word_length_kmp(left: str, right: str, allowed: int) -> int:
+    failure = [0] * len(right)
+    state = 0
+    for index in range(1, len(right)):
+        while state and right[index] != right[state]:
+            state = failure[state - 1]
+        if right[index] == right[state]:
+            state += 1
+        failure[index] = state
+
+    state = 0
+    for index in range(allowed, len(left)):
+        if state == len(right):
+            state = failure[state - 1]
+        while state and left[index] != right[state]:
+            state = failure[state - 1]
+        if left[index] == right[state]:
+            state += 1
+
+    # Walk the borders from longest to shortest.
+    while state:
+        if _ends_on_boundary(right, state):
+            return state
+        state = failure[state - 1]
+    return 0
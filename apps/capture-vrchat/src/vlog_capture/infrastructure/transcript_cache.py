@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, ClassVar, Collection, Iterator
+
+from vlog_capture.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Transcripts that predate the index were produced by an unknown configuration.
+UNRECORDED_SIGNATURE = "unrecorded"
+_CHUNK_BYTES = 1024 * 1024
+_SQLITE_SUFFIXES = frozenset({".sqlite3", ".sqlite", ".db"})
+_ENTRY_COLUMNS = "digest, transcript, signature, audio"
+
+
+def decoding_signature(
+    model_size: str, compute_type: str, options: dict[str, Any]
+) -> str:
+    return json.dumps(
+        {"model": model_size, "compute_type": compute_type, "decode": options},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def content_hash(path: Path) -> str:
+    digest = sha256()
+    with open(path, "rb") as handle:
+        while chunk := handle.read(_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedTranscript:
+    content_hash: str
+    transcript: Path
+    signature: str
+    audio: str
+
+
+class TranscriptCache:
+    """Index of transcripts keyed by audio content hash and decoding signature.
+
+    Audio hashes are memoised by inode, size and mtime, so renaming a recording
+    or moving it into the archive costs neither a transcription nor a rehash.
+    The index is a WAL-mode SQLite database shared by the recorder, the
+    transcription service and worker processes; each write is one statement,
+    so concurrent writers never drop each other's entries. A ``.json`` index
+    next to it is imported once.
+    """
+
+    # Per process: a connection must not be used across fork.
+    _connections: ClassVar[
+        dict[tuple[int, Path], tuple[sqlite3.Connection, threading.Lock]]
+    ] = {}
+    _connections_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: Path | None = None) -> None:
+        path = Path(path or settings.transcript_index_file)
+        self._path = (
+            path if path.suffix in _SQLITE_SUFFIXES else path.with_suffix(".sqlite3")
+        )
+        self._json_path = path.with_suffix(".json")
+
+    def digest(self, audio_path: str | Path) -> str:
+        audio = Path(audio_path)
+        identity = _file_identity(audio)
+        with self._db() as connection:
+            row = connection.execute(
+                "SELECT digest FROM files WHERE identity = ?", (identity,)
+            ).fetchone()
+        if row:
+            return row[0]
+        digest = content_hash(audio)
+        with self._db() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO files (identity, digest) VALUES (?, ?)",
+                (identity, digest),
+            )
+        return digest
+
+    def entry(self, digest: str) -> CachedTranscript | None:
+        with self._db() as connection:
+            row = connection.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM entries WHERE digest = ?", (digest,)
+            ).fetchone()
+        return _entry(row) if row else None
+
+    def is_indexed(self, transcript: Path) -> bool:
+        with self._db() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM entries WHERE transcript = ? LIMIT 1",
+                (str(transcript),),
+            ).fetchone()
+        return row is not None
+
+    def lookup(
+        self, digest: str, signature: str, also: Collection[str] = ()
+    ) -> CachedTranscript | None:
+        """Return a current transcript, or one recorded before the index existed.
+
+        ``also`` names further signatures whose transcripts count as current.
+        """
+        entry = self.entry(digest)
+        if entry is None or entry.signature not in (
+            signature,
+            UNRECORDED_SIGNATURE,
+            *also,
+        ):
+            return None
+        if not entry.transcript.exists():
+            return None
+        return entry
+
+    def record(
+        self, digest: str, transcript: Path, signature: str, audio: str | Path
+    ) -> None:
+        with self._db() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(digest, transcript, signature, audio, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    digest,
+                    str(transcript),
+                    signature,
+                    str(audio),
+                    datetime.now().isoformat(timespec="seconds"),
+                ),
+            )
+
+    def stale(self, signature: str) -> list[CachedTranscript]:
+        """Transcripts produced by another model, compute type or decoding setup."""
+        with self._db() as connection:
+            rows = connection.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM entries "
+                "WHERE signature != ? ORDER BY digest",
+                (signature,),
+            ).fetchall()
+        return [_entry(row) for row in rows]
+
+    @contextmanager
+    def _db(self) -> Iterator[sqlite3.Connection]:
+        # Opened on first use, so building a Transcriber creates no files.
+        key = (os.getpid(), self._path.absolute())
+        with self._connections_lock:
+            shared = self._connections.get(key)
+            if shared is None:
+                shared = self._connections[key] = (self._open(), threading.Lock())
+        connection, lock = shared
+        with lock:
+            yield connection
+
+    def _open(self) -> sqlite3.Connection:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self._path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                digest TEXT PRIMARY KEY,
+                transcript TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                audio TEXT NOT NULL,
+                recorded_at TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS entries_transcript ON entries (transcript);
+            CREATE TABLE IF NOT EXISTS files (
+                identity TEXT PRIMARY KEY,
+                digest TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self._migrate(connection)
+        return connection
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            done = connection.execute(
+                "SELECT 1 FROM meta WHERE key = 'json_migrated'"
+            ).fetchone()
+            if not done:
+                payload = _load_json(self._json_path)
+                for digest, raw in payload.get("entries", {}).items():
+                    connection.execute(
+                        "INSERT OR IGNORE INTO entries "
+                        "(digest, transcript, signature, audio, recorded_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            digest,
+                            str(raw.get("transcript", "")),
+                            str(raw.get("signature", UNRECORDED_SIGNATURE)),
+                            str(raw.get("audio", "")),
+                            str(raw.get("recorded_at", "")),
+                        ),
+                    )
+                for identity, digest in payload.get("files", {}).items():
+                    connection.execute(
+                        "INSERT OR IGNORE INTO files (identity, digest) VALUES (?, ?)",
+                        (identity, digest),
+                    )
+                connection.execute(
+                    "INSERT INTO meta (key, value) VALUES ('json_migrated', ?)",
+                    (str(self._json_path) if payload else "",),
+                )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        else:
+            connection.execute("COMMIT")
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError:
+        logger.warning("Transcript index is unreadable; not importing: %s", path)
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _file_identity(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _entry(row: tuple[str, str, str, str]) -> CachedTranscript:
+    digest, transcript, signature, audio = row
+    return CachedTranscript(
+        content_hash=digest,
+        transcript=Path(transcript),
+        signature=signature,
+        audio=audio,
+    )
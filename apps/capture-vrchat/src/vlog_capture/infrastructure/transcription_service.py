@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+import logging
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from vlog_capture.domain.interfaces import TranscriberProtocol
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.system import Transcriber
+
+logger = logging.getLogger(__name__)
+
+_CONNECT_TIMEOUT_SECONDS = 2.0
+
+
+class ServiceUnavailableError(ConnectionError):
+    """The transcription service socket could not be connected to."""
+
+
+class TranscriptionServer:
+    """Keep one Whisper model resident and serve jobs over a local Unix socket.
+
+    Requests and responses are single JSON lines. The model is unloaded after
+    ``idle_seconds`` without jobs and reloaded lazily by the next one.
+    """
+
+    def __init__(
+        self,
+        transcriber: TranscriberProtocol | None = None,
+        socket_path: Path | None = None,
+        idle_seconds: float | None = None,
+    ) -> None:
+        self._transcriber = transcriber or Transcriber()
+        self.socket_path = Path(socket_path or settings.transcription_socket)
+        self._idle_seconds = (
+            settings.transcription_idle_seconds
+            if idle_seconds is None
+            else idle_seconds
+        )
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: _UnixServer | None = None
+        self._loaded = False
+        self._last_job_at = time.monotonic()
+        self.jobs = 0
+
+    def serve_forever(self) -> None:
+        self._server = self._bind()
+        watchdog = threading.Thread(
+            target=self._unload_when_idle,
+            name="vlog-transcriber-idle",
+            daemon=True,
+        )
+        watchdog.start()
+        logger.info("Transcription service listening on %s", self.socket_path)
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self._stop.set()
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            with self._lock:
+                self._transcriber.unload()
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        operation = request.get("op", "transcribe")
+        if operation == "status":
+            return {"ok": True, "loaded": self._loaded, "jobs": self.jobs}
+        if operation != "transcribe" or not request.get("audio_path"):
+            return {"ok": False, "error": f"invalid request: {operation}"}
+        with self._lock:
+            try:
+                text, path = self._transcriber.transcribe_and_save(
+                    str(request["audio_path"])
+                )
+            except Exception as exc:
+                logger.exception("Transcription job failed")
+                return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            finally:
+                self._loaded = True
+                self._last_job_at = time.monotonic()
+            self.jobs += 1
+        return {"ok": True, "text": text, "path": path}
+
+    def unload_if_idle(self) -> bool:
+        with self._lock:
+            if not self._loaded:
+                return False
+            if time.monotonic() - self._last_job_at < self._idle_seconds:
+                return False
+            self._transcriber.unload()
+            self._loaded = False
+        logger.info("Transcription model unloaded after idle timeout")
+        return True
+
+    def _unload_when_idle(self) -> None:
+        interval = min(max(self._idle_seconds / 4, 0.05), 5.0)
+        while not self._stop.wait(interval):
+            self.unload_if_idle()
+
+    def _bind(self) -> _UnixServer:
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise RuntimeError(
+                    f"Transcription service already running: {self.socket_path}"
+                )
+            self.socket_path.unlink()
+        server = _UnixServer(str(self.socket_path), _RequestHandler)
+        server.service = self
+        self.socket_path.chmod(0o600)
+        return server
+
+
+class TranscriptionClient:
+    """TranscriberProtocol backed by the resident service.
+
+    Falls back to an in-process ``Transcriber`` only when the service cannot
+    be reached. A job the service accepted but did not answer within a
+    timeout scaled to the recording's length raises ``TimeoutError``: the
+    service may still be decoding it, and a second model on the same GPU
+    and transcript would work against keeping one resident.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        fallback: TranscriberProtocol | None = None,
+    ) -> None:
+        self.socket_path = Path(socket_path or settings.transcription_socket)
+        self._fallback = fallback
+
+    def transcribe_and_save(self, audio_path: str) -> tuple[str, str]:
+        try:
+            response = self.request(
+                {"op": "transcribe", "audio_path": str(Path(audio_path).resolve())},
+                timeout=_job_timeout(audio_path),
+            )
+        except ServiceUnavailableError:
+            logger.warning(
+                "Transcription service unavailable at %s; transcribing in-process",
+                self.socket_path,
+            )
+            return self._local().transcribe_and_save(audio_path)
+        if not response.get("ok"):
+            raise RuntimeError(f"Transcription service failed: {response.get('error')}")
+        return str(response["text"]), str(response["path"])
+
+    def unload(self) -> None:
+        # The service owns model residency; only a local fallback is released.
+        if self._fallback is not None:
+            self._fallback.unload()
+
+    def request(
+        self, payload: dict[str, Any], timeout: float | None = None
+    ) -> dict[str, Any]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(_CONNECT_TIMEOUT_SECONDS)
+            try:
+                client.connect(str(self.socket_path))
+            except OSError as exc:
+                raise ServiceUnavailableError(str(exc)) from exc
+            client.settimeout(
+                settings.transcription_timeout_seconds if timeout is None else timeout
+            )
+            client.sendall(json.dumps(payload, ensure_ascii=False).encode() + b"\n")
+            with client.makefile("rb") as reader:
+                try:
+                    line = reader.readline()
+                except TimeoutError as exc:
+                    raise TimeoutError(
+                        f"Transcription service at {self.socket_path} did not "
+                        "answer in time; the job may still be running there"
+                    ) from exc
+        if not line:
+            raise ConnectionError("Transcription service closed the connection")
+        return json.loads(line)
+
+    def _local(self) -> TranscriberProtocol:
+        if self._fallback is None:
+            self._fallback = Transcriber()
+        return self._fallback
+
+
+def make_transcriber() -> TranscriberProtocol:
+    if (
+        settings.transcription_service
+        and hasattr(socket, "AF_UNIX")
+        and settings.transcription_socket.exists()
+    ):
+        return TranscriptionClient()
+    if settings.whisper_cpu_parallel:
+        from vlog_capture.infrastructure.parallel_transcription import (
+            ParallelTranscriber,
+        )
+
+        return ParallelTranscriber()
+    return Transcriber()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    service: TranscriptionServer
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: _UnixServer
+
+    def handle(self) -> None:
+        for raw in self.rfile:
+            try:
+                request = json.loads(raw)
+            except json.JSONDecodeError:
+                response: dict[str, Any] = {"ok": False, "error": "invalid JSON"}
+            else:
+                response = (
+                    self.server.service.handle(request)
+                    if isinstance(request, dict)
+                    else {"ok": False, "error": "request must be an object"}
+                )
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+
+
+def _job_timeout(audio_path: str) -> float:
+    """Seconds to wait for the service: a fixed allowance plus the audio length."""
+    try:
+        import soundfile
+
+        duration = float(soundfile.info(audio_path).duration)
+    except Exception:
+        # Unreadable or missing audio; the service reports the real error.
+        duration = 0.0
+    return (
+        settings.transcription_timeout_seconds
+        + duration * settings.transcription_timeout_factor
+    )
+
+
+def _is_listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(_CONNECT_TIMEOUT_SECONDS)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
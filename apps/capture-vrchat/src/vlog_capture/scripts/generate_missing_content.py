@@ -1,6 +1,7 @@
 import logging
 
 from vlog_capture.infrastructure.ai import ImageGenerator, Novelizer
+from vlog_capture.infrastructure.artifact_index import settings_artifact_index
 from vlog_capture.infrastructure.graph_storage import GraphStorage
 from vlog_capture.infrastructure.repositories import SupabaseRepository
 from vlog_capture.infrastructure.settings import settings
@@ -27,30 +28,19 @@ def main() -> None:
     build_novel_use_case = BuildNovelUseCase(novelizer, image_generator, graph_storage)
     supabase_repo = SupabaseRepository()
 
-    summary_files = list(settings.summary_dir.glob("*_summary.txt"))
-    logger.info("Found %d summary files.", len(summary_files))
-
-    dates_to_process: list[str] = []
-    for summary_file in summary_files:
-        parts = summary_file.stem.split("_")
-        if not parts or not parts[0].isdigit() or len(parts[0]) != 8:
-            continue
-
-        date_str = parts[0]
-        normalized_stem = summary_file.stem.replace("_summary", "")
-        if "_" in normalized_stem:
-            continue
-        dates_to_process.append(date_str)
-
-    dates_to_process.sort()
+    index = settings_artifact_index()
+    dates_to_process = sorted(
+        date_str
+        for date_str in index.dates("summaries")
+        if index.has_stem("summaries", f"{date_str}_summary")
+    )
     logger.info("Found %d valid daily summary dates.", len(dates_to_process))
 
+    novel_dates = []
+    image_only = []
     for date_str in dates_to_process:
-        novel_path = settings.novel_out_dir / f"{date_str}.md"
-        photo_path = settings.photo_dir / f"{date_str}.png"
-
-        novel_exists = novel_path.exists()
-        photo_exists = photo_path.exists()
+        novel_exists = index.has_stem("novels", date_str)
+        photo_exists = index.has_stem("photos", date_str)
         if novel_exists and photo_exists:
             continue
 
@@ -62,16 +52,22 @@ def main() -> None:
         )
 
         if not novel_exists:
-            logger.info("Generating Novel and Image for %s...", date_str)
-            build_novel_use_case.execute(date=date_str)
-            logger.info("Successfully generated content for %s", date_str)
+            novel_dates.append(date_str)
         elif not photo_exists:
-            logger.info(
-                "Novel exists but Image missing for %s. Generating Image...", date_str
-            )
-            novel_text = novel_path.read_text(encoding="utf-8")
-            image_generator.generate_from_novel(novel_text, photo_path)
-            logger.info("Successfully generated image for %s", date_str)
+            logger.info("Novel exists but Image missing for %s.", date_str)
+            novel_path = settings.novel_out_dir / f"{date_str}.md"
+            photo_path = settings.photo_dir / f"{date_str}.png"
+            image_only.append((novel_path.read_text(encoding="utf-8"), photo_path))
+
+    if image_only:
+        logger.info("Generating %d missing images...", len(image_only))
+        image_generator.generate_from_novels(image_only)
+        logger.info("Successfully generated %d images", len(image_only))
+
+    if novel_dates:
+        logger.info("Generating Novel and Image for %d dates...", len(novel_dates))
+        for novel_path in build_novel_use_case.execute_many(novel_dates):
+            logger.info("Successfully generated content for %s", novel_path.stem)
 
     logger.info("Syncing to Supabase...")
     supabase_repo.sync()
@@ -1,10 +1,15 @@
+import queue
+import threading
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 
 from vlog_capture.domain.interfaces import ImageGeneratorProtocol, NovelizerProtocol
+from vlog_capture.infrastructure.ai_executor import AIExecutor
 from vlog_capture.infrastructure.daily_state import DailyStateStore
 from vlog_capture.infrastructure.graph_storage import GraphStorage
-from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager, NovelJob
 
 
 class BuildNovelUseCase:
@@ -13,11 +18,83 @@ class BuildNovelUseCase:
         novelizer: NovelizerProtocol,
         image_generator: ImageGeneratorProtocol,
         graph_storage: GraphStorage,
+        daily_artifacts: DailyArtifactManager | None = None,
     ):
         self._novelizer = novelizer
         self._image_generator = image_generator
         self._graph_storage = graph_storage
-        self._daily_artifacts = DailyArtifactManager(DailyStateStore())
+        self._daily_artifacts = daily_artifacts or DailyArtifactManager(
+            DailyStateStore()
+        )
+
+    def execute_many(
+        self, dates: Sequence[str], executor: AIExecutor | None = None
+    ) -> list[Path]:
+        """Build novels for several dates, overlapping chapters and images.
+
+        Chapters are written one at a time: each date is planned only after
+        the previous date's chapter is saved, so its story so far matches a
+        date-by-date run. Saved chapters go to one image thread through a
+        queue of ``novel_pipeline_depth`` entries, so images render while the
+        next chapter is written. ``executor`` only supplies the deadline.
+        """
+        artifacts = self._daily_artifacts
+        paths: list[Path] = []
+        chapters: queue.Queue[tuple[NovelJob, str] | None] = queue.Queue(
+            maxsize=max(1, settings.novel_pipeline_depth)
+        )
+        failures: list[Exception] = []
+
+        def render() -> None:
+            while (item := chapters.get()) is not None:
+                # Render whatever else is already waiting in the same batch.
+                batch = [item]
+                while len(batch) < settings.image_max_batch_size:
+                    try:
+                        item = chapters.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        break
+                    batch.append(item)
+                try:
+                    paths.extend(artifacts.render_novels(batch, self._image_generator))
+                except Exception as exc:
+                    failures.append(exc)
+                    return
+                if item is None:
+                    return
+
+        renderer = threading.Thread(target=render, name="novel-images", daemon=True)
+        renderer.start()
+
+        def hand_off(job: NovelJob, chapter: str) -> None:
+            artifacts.save_chapter(job, chapter)
+            if not _offer(chapters, (job, chapter), renderer):
+                raise failures[0]
+
+        executor = executor or AIExecutor()
+        try:
+            for date_str in dates:
+                if failures:
+                    break
+                job = artifacts.plan_novel(
+                    date_str, self._graph_storage, self._novelizer
+                )
+                if isinstance(job, NovelJob):
+                    chapter = executor.run_one(
+                        job,
+                        lambda job: artifacts.generate_chapter(job, self._novelizer),
+                    )
+                    hand_off(job, chapter)
+                elif job is not None:
+                    paths.append(job)
+        finally:
+            _offer(chapters, None, renderer)
+            renderer.join()
+        if failures:
+            raise failures[0]
+        return sorted(paths)
 
     def execute(self, date: str | None = None) -> Path | None:
         target_date = date or datetime.now().strftime("%Y%m%d")
@@ -27,3 +104,18 @@ class BuildNovelUseCase:
             self._image_generator,
             self._graph_storage,
         )
+
+
+def _offer(
+    chapters: queue.Queue[tuple[NovelJob, str] | None],
+    item: tuple[NovelJob, str] | None,
+    renderer: threading.Thread,
+) -> bool:
+    """Block until ``item`` is queued; ``False`` if the image thread stopped."""
+    while renderer.is_alive():
+        try:
+            chapters.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
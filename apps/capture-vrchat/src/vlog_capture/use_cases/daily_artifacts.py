@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 
 from vlog_capture.domain.entities import RecordingSession
@@ -15,18 +17,54 @@ from vlog_capture.infrastructure.daily_state import (
     DailySourceBundle,
     DailyStateStore,
     collect_daily_sources,
-    fingerprint_paths,
     fingerprint_text,
 )
+from vlog_capture.infrastructure.novel_context import NovelContextBuilder
 from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.summary_cache import (
+    SummaryChunkCache,
+    iter_file_for_context,
+    split_for_context,
+)
+
+# Rounds of condensing notes before the daily prompt; each round shrinks them.
+_MAX_REDUCE_ROUNDS = 3
+_SESSION_TIME = re.compile(r"\d{8}_(\d{2})(\d{2})\d{2}")
+
+
+@dataclass(frozen=True)
+class SummaryJob:
+    date_str: str
+    bundle: DailySourceBundle
+    summary_path: Path
+    session: RecordingSession | None = None
+
+
+@dataclass(frozen=True)
+class NovelJob:
+    date_str: str
+    summary_text: str
+    summary_hash: str
+    context: str
+    context_hash: str
+    novel_so_far: str
+    novel_path: Path
+    photo_path: Path
 
 
 class DailyArtifactManager:
-    def __init__(self, state_store: DailyStateStore | None = None):
+    def __init__(
+        self,
+        state_store: DailyStateStore | None = None,
+        chunk_cache: SummaryChunkCache | None = None,
+        novel_context: NovelContextBuilder | None = None,
+    ):
         self._state = state_store or DailyStateStore()
+        self._chunk_cache = chunk_cache or SummaryChunkCache()
+        self._novel_context = novel_context or NovelContextBuilder()
 
     def summary_sources_for_date(self, date_str: str) -> tuple[Path, ...]:
-        return collect_daily_sources(date_str).paths
+        return collect_daily_sources(date_str, self._state.fingerprints).paths
 
     def refresh_summary(
         self,
@@ -38,13 +76,36 @@ class DailyArtifactManager:
         session: RecordingSession | None = None,
         fallback_text: str | None = None,
     ) -> str | None:
+        job = self.plan_summary(
+            date_str,
+            source_paths=source_paths,
+            session=session,
+            fallback_text=fallback_text,
+        )
+        if not isinstance(job, SummaryJob):
+            return job
+        summary_text = self.generate_summary(job, summarizer)
+        return self.commit_summary(job, summary_text, file_repository)
+
+    def plan_summary(
+        self,
+        date_str: str,
+        *,
+        source_paths: tuple[Path, ...] | None = None,
+        session: RecordingSession | None = None,
+        fallback_text: str | None = None,
+    ) -> SummaryJob | str | None:
+        """Return the current summary (or ``None``) if no model call is needed.
+
+        Otherwise return the job for ``generate_summary``. ``refresh_summary``
+        is the three steps in sequence; multi-date commands run
+        ``generate_summary`` concurrently and the other two in date order.
+        """
         summary_path = settings.summary_dir / f"{date_str}_summary.txt"
         source_bundle = self._resolve_sources(date_str, source_paths, fallback_text)
         state_entry = self._state.get(date_str)
 
-        has_text_input = bool(source_bundle.combined_text.strip())
-
-        if not has_text_input:
+        if not source_bundle.has_text:
             if summary_path.exists():
                 existing = summary_path.read_text(encoding="utf-8")
                 if existing.strip():
@@ -83,24 +144,36 @@ class DailyArtifactManager:
                 )
                 return existing
 
-        summary_text = self._summarize_transcript(
+        return SummaryJob(date_str, source_bundle, summary_path, session)
+
+    def generate_summary(
+        self, job: SummaryJob, summarizer: DailySummarizerProtocol
+    ) -> str:
+        return self._summarize_sources(
             summarizer,
-            source_bundle.combined_text,
-            date_str,
-            session=session,
+            job.bundle,
+            job.date_str,
+            session=job.session,
         )
+
+    def commit_summary(
+        self,
+        job: SummaryJob,
+        summary_text: str,
+        file_repository: FileRepositoryProtocol,
+    ) -> str | None:
         if not summary_text.strip():
-            self._state.record_empty(date_str, "empty summary output")
+            self._state.record_empty(job.date_str, "empty summary output")
             return None
 
-        summary_path.parent.mkdir(parents=True, exist_ok=True)
-        file_repository.save_text(str(summary_path), summary_text)
+        job.summary_path.parent.mkdir(parents=True, exist_ok=True)
+        file_repository.save_text(str(job.summary_path), summary_text)
         self._state.record_summary(
-            date_str,
-            source_paths=source_bundle.paths,
-            source_hash=source_bundle.source_hash,
+            job.date_str,
+            source_paths=job.bundle.paths,
+            source_hash=job.bundle.source_hash,
             summary_text=summary_text,
-            summary_path=summary_path,
+            summary_path=job.summary_path,
         )
         return summary_text
 
@@ -111,6 +184,23 @@ class DailyArtifactManager:
         image_generator: ImageGeneratorProtocol,
         graph_storage: GraphStorageProtocol | None = None,
     ) -> Path | None:
+        job = self.plan_novel(date_str, graph_storage, novelizer)
+        if not isinstance(job, NovelJob):
+            return job
+        chapter = self.generate_chapter(job, novelizer)
+        return self.commit_novel(job, chapter, image_generator)
+
+    def plan_novel(
+        self,
+        date_str: str,
+        graph_storage: GraphStorageProtocol | None = None,
+        novelizer: NovelizerProtocol | None = None,
+    ) -> NovelJob | Path | None:
+        """Return the existing novel path (or ``None``) if no chapter is needed.
+
+        ``novelizer`` is only used to bring the synopsis of earlier chapters up
+        to date; without it the context is just the latest chapters.
+        """
         summary_path = settings.summary_dir / f"{date_str}_summary.txt"
         if not summary_path.exists():
             return None
@@ -142,27 +232,73 @@ class DailyArtifactManager:
                 )
             return novel_path
 
-        if novel_path.exists():
-            novel_so_far = novel_path.read_text(encoding="utf-8")
-        else:
-            novel_so_far = ""
-        chapter = novelizer.generate_chapter(summary_text, novel_so_far, context)
+        novel_so_far = self._novel_context.build(date_str, novelizer)
+        return NovelJob(
+            date_str=date_str,
+            summary_text=summary_text,
+            summary_hash=summary_hash,
+            context=context,
+            context_hash=context_hash,
+            novel_so_far=novel_so_far,
+            novel_path=novel_path,
+            photo_path=photo_path,
+        )
+
+    def generate_chapter(self, job: NovelJob, novelizer: NovelizerProtocol) -> str:
+        return novelizer.generate_chapter(
+            job.summary_text, job.novel_so_far, job.context
+        )
+
+    def commit_novel(
+        self,
+        job: NovelJob,
+        chapter: str,
+        image_generator: ImageGeneratorProtocol,
+    ) -> Path:
+        self.save_chapter(job, chapter)
+        return self.render_novel(job, chapter, image_generator)
+
+    def save_chapter(self, job: NovelJob, chapter: str) -> None:
+        job.novel_path.parent.mkdir(parents=True, exist_ok=True)
+        job.novel_path.write_text(chapter, encoding="utf-8")
 
-        novel_path.parent.mkdir(parents=True, exist_ok=True)
-        novel_path.write_text(chapter, encoding="utf-8")
+    def render_novel(
+        self,
+        job: NovelJob,
+        chapter: str,
+        image_generator: ImageGeneratorProtocol,
+    ) -> Path:
+        """Render the chapter's image and record the finished novel."""
+        return self.render_novels([(job, chapter)], image_generator)[0]
 
-        photo_path.parent.mkdir(parents=True, exist_ok=True)
-        image_generator.generate_from_novel(chapter, photo_path)
+    def render_novels(
+        self,
+        chapters: Sequence[tuple[NovelJob, str]],
+        image_generator: ImageGeneratorProtocol,
+    ) -> list[Path]:
+        """Render several chapters' images, batched when the generator can."""
+        for job, _ in chapters:
+            job.photo_path.parent.mkdir(parents=True, exist_ok=True)
+        generate_many = getattr(image_generator, "generate_from_novels", None)
+        if generate_many is not None and len(chapters) > 1:
+            generate_many([(chapter, job.photo_path) for job, chapter in chapters])
+            return [self._record_novel(job, chapter) for job, chapter in chapters]
+        paths = []
+        for job, chapter in chapters:
+            image_generator.generate_from_novel(chapter, job.photo_path)
+            paths.append(self._record_novel(job, chapter))
+        return paths
 
+    def _record_novel(self, job: NovelJob, chapter: str) -> Path:
         self._state.record_novel(
-            date_str,
-            summary_hash=summary_hash,
-            context_hash=context_hash,
+            job.date_str,
+            summary_hash=job.summary_hash,
+            context_hash=job.context_hash,
             chapter_text=chapter,
-            novel_path=novel_path,
-            photo_path=photo_path,
+            novel_path=job.novel_path,
+            photo_path=job.photo_path,
         )
-        return novel_path
+        return job.novel_path
 
     def _resolve_sources(
         self,
@@ -170,20 +306,14 @@ class DailyArtifactManager:
         source_paths: tuple[Path, ...] | None,
         fallback_text: str | None,
     ) -> DailySourceBundle:
+        fingerprints = self._state.fingerprints
         if source_paths is not None:
             paths = tuple(Path(path) for path in source_paths)
             if not paths:
-                return collect_daily_sources(date_str)
-            combined_text = "\n\n".join(
-                path.read_text(encoding="utf-8") for path in paths
-            )
-            return DailySourceBundle(
-                paths=paths,
-                source_hash=fingerprint_paths(paths),
-                combined_text=combined_text,
-            )
+                return collect_daily_sources(date_str, fingerprints)
+            return DailySourceBundle.from_paths(paths, fingerprints)
 
-        bundle = collect_daily_sources(date_str)
+        bundle = collect_daily_sources(date_str, fingerprints)
         if bundle.paths:
             return bundle
 
@@ -197,7 +327,8 @@ class DailyArtifactManager:
         return DailySourceBundle(
             paths=tuple(),
             source_hash=fingerprint_text(text),
-            combined_text=text,
+            has_text=True,
+            inline_text=text,
         )
 
     def _bootstrap_summary_state(
@@ -216,6 +347,66 @@ class DailyArtifactManager:
             summary_path=summary_path,
         )
 
+    def _summarize_sources(
+        self,
+        summarizer: DailySummarizerProtocol,
+        bundle: DailySourceBundle,
+        date_str: str,
+        *,
+        session: RecordingSession | None = None,
+    ) -> str:
+        """Summarise the day's transcripts directly when they fit one prompt.
+
+        Longer days are summarised per session first and the cached notes are
+        combined: a new session costs one notes call plus the daily call over
+        the notes, which are condensed further until they fit one prompt.
+        """
+        summarize_chunk = getattr(summarizer, "summarize_chunk", None)
+        if (
+            summarize_chunk is None
+            or not settings.summary_map_reduce
+            or not bundle.paths
+            or _fits_one_prompt(bundle, settings.summary_chunk_chars)
+        ):
+            return self._summarize_transcript(
+                summarizer, bundle.combined_text, date_str, session=session
+            )
+
+        signature = getattr(summarizer, "chunk_signature", "")
+        limit = settings.summary_chunk_chars
+        notes = []
+        for path in bundle.paths:
+            # Read piece by piece so a long session never sits in memory whole.
+            parts = [
+                self._chunk_notes(summarize_chunk, signature, piece)
+                for piece in iter_file_for_context(path, limit)
+                if piece.strip()
+            ]
+            if not parts:
+                continue
+            notes.append(f"【{_session_label(path)}】\n" + "\n".join(parts))
+
+        combined = "\n\n".join(notes)
+        for _ in range(_MAX_REDUCE_ROUNDS):
+            if len(combined) <= limit:
+                break
+            combined = "\n\n".join(
+                self._chunk_notes(summarize_chunk, signature, piece)
+                for piece in split_for_context(combined, limit)
+            )
+        return self._summarize_transcript(
+            summarizer, combined, date_str, session=session
+        )
+
+    def _chunk_notes(
+        self, summarize_chunk: Callable[[str], str], signature: str, text: str
+    ) -> str:
+        notes = self._chunk_cache.get(text, signature)
+        if notes is None:
+            notes = summarize_chunk(text)
+            self._chunk_cache.put(text, signature, notes)
+        return notes
+
     def _summarize_transcript(
         self,
         summarizer: DailySummarizerProtocol,
@@ -237,3 +428,16 @@ class DailyArtifactManager:
         first_line = summary.splitlines()[0].strip()
         first_sentence = re.split(r"[。．.!?！？]", first_line, maxsplit=1)[0].strip()
         return first_sentence[:200] or first_line[:200] or summary[:200]
+
+
+def _session_label(path: Path) -> str:
+    match = _SESSION_TIME.search(path.stem)
+    return f"{match.group(1)}:{match.group(2)}" if match else path.stem
+
+
+def _fits_one_prompt(bundle: DailySourceBundle, limit: int) -> bool:
+    if limit <= 0:
+        return True
+    # UTF-8 takes at most four bytes a char, so larger days are never read here.
+    size = sum(path.stat().st_size for path in bundle.paths)
+    return size <= 4 * limit and len(bundle.combined_text) <= limit
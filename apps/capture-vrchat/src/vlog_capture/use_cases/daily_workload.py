@@ -2,21 +2,20 @@ from __future__ import annotations
 
 import json
 import math
-import re
 from dataclasses import asdict, dataclass
-from pathlib import Path
 
 import yaml
 
-from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.artifact_index import (
+    ArtifactIndex,
+    settings_artifact_index,
+)
 from vlog_capture.infrastructure.system import ProcessMonitor, SystemResourceMonitor
 from vlog_capture.project import PROJECT_ROOT
 
 _PROJECT_ROOT = PROJECT_ROOT
 COGNEE_QUEUE_PATH = _PROJECT_ROOT / "data" / "cognee_queue.yaml"
 
-_AUDIO_SUFFIXES = {".wav", ".flac", ".mp3"}
-
 
 @dataclass(frozen=True)
 class DailyWorkloadCounts:
@@ -164,13 +163,12 @@ class DailyWorkloadPlanner:
         resource_ready, resource_reason, _ = resource_monitor.is_idle_for_heavy_work(
             snapshot=resource_snapshot
         )
-        recordings_pending = self._count_pending_recordings()
-        transcript_dates = self._extract_dates(settings.transcript_dir.glob("*.txt"))
-        summary_dates = self._extract_dates(settings.summary_dir.glob("*_summary.txt"))
-        novel_dates = self._extract_dates(settings.novel_out_dir.glob("*.md"))
-        evaluation_dates = self._extract_dates(
-            (settings.summary_dir.parent / "evaluations").glob("*.json")
-        )
+        index = settings_artifact_index()
+        recordings_pending = self._count_pending_recordings(index)
+        transcript_dates = index.dates("transcripts")
+        summary_dates = index.dates("summaries")
+        novel_dates = index.dates("novels")
+        evaluation_dates = index.dates("evaluations")
 
         transcript_days_pending = len(transcript_dates - summary_dates)
         summary_days_pending = len(summary_dates - novel_dates)
@@ -201,35 +199,16 @@ class DailyWorkloadPlanner:
             next_action_limit=next_limit,
         )
 
-    def _count_pending_recordings(self) -> int:
-        if not settings.recording_dir.exists():
-            return 0
-        pending = 0
-        for audio_path in settings.recording_dir.glob("*"):
-            if audio_path.suffix.lower() not in _AUDIO_SUFFIXES:
-                continue
-            if not self._transcript_exists_for(audio_path):
-                pending += 1
-        return pending
-
-    def _transcript_exists_for(self, audio_path: Path) -> bool:
-        stem = audio_path.stem
-        return any(
-            path.exists()
-            for path in (
-                settings.transcript_dir / f"{stem}.txt",
-                settings.transcript_dir / f"cleaned_{stem}.txt",
+    def _count_pending_recordings(self, index: ArtifactIndex) -> int:
+        return sum(
+            1
+            for audio_path in index.paths("recordings")
+            if not (
+                index.has_stem("transcripts", audio_path.stem)
+                or index.has_stem("transcripts", f"cleaned_{audio_path.stem}")
             )
         )
 
-    def _extract_dates(self, paths) -> set[str]:
-        dates: set[str] = set()
-        for path in paths:
-            match = re.search(r"(\d{8})", Path(path).stem)
-            if match:
-                dates.add(match.group(1))
-        return dates
-
     def _load_cognee_stats(self) -> dict[str, int]:
         if not COGNEE_QUEUE_PATH.exists():
             return {"pending": 0, "processing": 0, "failed": 0, "batch_size": 5}
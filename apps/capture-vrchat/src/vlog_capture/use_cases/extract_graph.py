@@ -2,9 +2,10 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
-import google.generativeai as genai
-
+from vlog_capture.infrastructure.ai import _genai
 from vlog_capture.infrastructure.graph_storage import GraphStorage
+from vlog_capture.infrastructure.llm_cache import generate_text
+from vlog_capture.infrastructure.observability import TraceLogger
 from vlog_capture.infrastructure.settings import settings
 
 
@@ -12,18 +13,29 @@ class ExtractGraphUseCase:
     def __init__(self, storage: GraphStorage):
         self.storage = storage
         self._model = None
+        self._tracer = TraceLogger()
 
     def execute(self, summary_path: Path) -> int:
-        if not summary_path.exists():
+        content = self.pending_text(summary_path)
+        if content is None:
             return 0
+        return self.store(summary_path, self.extract(content))
+
+    def pending_text(self, summary_path: Path) -> str | None:
+        """Summary text still to be extracted, or ``None`` if already stored."""
+        if not summary_path.exists():
+            return None
 
         if self.storage.is_source_processed(summary_path.name):
-            return 0
+            return None
 
         print(f"Extracting graph from {summary_path.name}...")
-        content = summary_path.read_text(encoding="utf-8")
-        triples = self._extract_with_llm(content)
+        return summary_path.read_text(encoding="utf-8")
+
+    def extract(self, content: str) -> List[Dict[str, Any]]:
+        return self._extract_with_llm(content)
 
+    def store(self, summary_path: Path, triples: List[Dict[str, Any]]) -> int:
         self.storage.add_triples(triples, source=summary_path.name)
         if triples:
             print(f"  -> Extracted {len(triples)} triples")
@@ -32,8 +44,9 @@ class ExtractGraphUseCase:
 
     def _extract_with_llm(self, text: str) -> List[Dict[str, Any]]:
         if not self._model:
-            genai.configure(api_key=settings.gemini_api_key)
-            self._model = genai.GenerativeModel(settings.gemini_model)
+            sdk = _genai()
+            sdk.configure(api_key=settings.gemini_api_key)
+            self._model = sdk.GenerativeModel(settings.gemini_model)
 
         profile_text = (
             settings.profile_path.read_text(encoding="utf-8")
@@ -71,13 +84,22 @@ class ExtractGraphUseCase:
             "テキスト:\n"
             f"{text}\n"
         )
-        response = self._model.generate_content(prompt)
-        result_text = response.text.strip()
+        result_text = generate_text(
+            self._model,
+            prompt,
+            model_name=settings.gemini_model,
+            component="graph_extract",
+            tracer=self._tracer,
+            validate=_parse_triples,
+        )
+        return _parse_triples(result_text)
+
 
-        # Extract JSON block
-        if "```json" in result_text:
-            result_text = result_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in result_text:
-            result_text = result_text.split("```")[1].split("```")[0].strip()
+def _parse_triples(result_text: str) -> Any:
+    # Extract JSON block
+    if "```json" in result_text:
+        result_text = result_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in result_text:
+        result_text = result_text.split("```")[1].split("```")[0].strip()
 
-        return json.loads(result_text)
+    return json.loads(result_text)
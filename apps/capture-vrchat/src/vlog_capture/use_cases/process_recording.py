@@ -1,3 +1,7 @@
+import logging
+import queue
+import threading
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from pathlib import Path
 
@@ -14,6 +18,8 @@ from vlog_capture.domain.interfaces import (
 from vlog_capture.infrastructure.settings import settings
 from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager
 
+logger = logging.getLogger(__name__)
+
 
 class ProcessRecordingUseCase:
     def __init__(
@@ -56,33 +62,103 @@ class ProcessRecordingUseCase:
         return True
 
     def execute_session(self, session: RecordingSession) -> bool:
-        transcripts_info = [
-            self._transcriber.transcribe_and_save(path) for path in session.file_paths
-        ]
-        self._transcriber.unload()
-
-        merged = " ".join(text for text, _ in transcripts_info)
-        cleaned = self._preprocessor.process(merged)
+        cleaned: str | None = None
+        cleaned_path: Path | None = None
+        if hasattr(self._transcriber, "iter_transcript") and hasattr(
+            self._preprocessor, "stream"
+        ):
+            cleaned_path = self._stream_session(session.file_paths)
+            self._transcriber.unload()
+        else:
+            cleaned = self._clean_session(session.file_paths)
 
-        if len(cleaned.encode("utf-8")) <= settings.min_transcript_size_bytes:
-            print(f"Transcript too short ({len(cleaned.encode('utf-8'))}B), skipping.")
+        if cleaned is None and cleaned_path is None:
             for audio_path in session.file_paths:
                 self._files.archive(audio_path)
             return False
 
-        if transcripts_info:
-            _, first_path = transcripts_info[0]
-            path = Path(first_path)
-            cleaned_path = path.with_name(f"cleaned_{path.name}")
-            self._files.save_text(str(cleaned_path), cleaned)
-
-        self._save_summary(cleaned, session)
+        self._save_summary(cleaned, session, cleaned_path=cleaned_path)
         self._generate_novel_and_photo(session)
 
         for audio_path in session.file_paths:
             self._files.archive(audio_path)
         return True
 
+    def _clean_session(self, audio_paths: Sequence[str]) -> str | None:
+        transcripts_info = self._transcribe_all(audio_paths)
+        self._transcriber.unload()
+
+        merged = " ".join(text for text, _ in transcripts_info)
+        cleaned = self._preprocessor.process(merged)
+
+        size = len(cleaned.encode("utf-8"))
+        if size <= settings.min_transcript_size_bytes:
+            print(f"Transcript too short ({size}B), skipping.")
+            return None
+
+        _, first_path = transcripts_info[0]
+        path = Path(first_path)
+        cleaned_path = path.with_name(f"cleaned_{path.name}")
+        self._files.save_text(str(cleaned_path), cleaned)
+        return cleaned
+
+    def _stream_session(self, audio_paths: Sequence[str]) -> Path | None:
+        """Clean the session transcript while Whisper is still decoding it.
+
+        Neither the raw nor the cleaned transcript is held in full; cleaned
+        text is streamed to a ``.part`` file once it is known to clear the
+        minimum size, and only a session that decodes completely replaces the
+        ``cleaned_`` transcript, whose path is returned.
+
+        Only transcribers with ``iter_transcript`` (the in-process
+        ``Transcriber``) stream. ``TranscriptionClient`` and
+        ``ParallelTranscriber`` take ``_clean_session``, which holds the
+        session's text in memory.
+        """
+        path = Path(self._transcriber.transcript_path(audio_paths[0]))
+        cleaned_path = str(path.with_name(f"cleaned_{path.name}"))
+        partial_path = f"{cleaned_path}.part"
+        stream = self._preprocessor.stream()
+        unsaved: list[str] = []
+        size = 0
+        written = False
+
+        def accept(chunk: str) -> None:
+            nonlocal size, written
+            if not chunk:
+                return
+            unsaved.append(chunk)
+            size += len(chunk.encode("utf-8"))
+            if size <= settings.min_transcript_size_bytes:
+                return
+            content = "".join(unsaved)
+            unsaved.clear()
+            if written:
+                self._files.append_text(partial_path, content)
+            else:
+                self._files.save_text(partial_path, content)
+                written = True
+
+        try:
+            for index, audio_path in enumerate(audio_paths):
+                if index:
+                    accept(stream.feed(" "))
+                for piece in self._transcriber.iter_transcript(audio_path):
+                    accept(stream.feed(piece))
+            accept(stream.finish())
+        except BaseException:
+            # collect_daily_sources prefers cleaned_ files, so never leave a
+            # truncated one behind.
+            if written:
+                self._files.delete(partial_path)
+            raise
+
+        if not written:
+            print(f"Transcript too short ({size}B), skipping.")
+            return None
+        self._files.replace(partial_path, cleaned_path)
+        return Path(cleaned_path)
+
     def _create_session(self, audio_path: str) -> RecordingSession:
         basename = Path(audio_path).stem
         start_time = datetime.strptime(basename, "%Y%m%d_%H%M%S")
@@ -92,6 +168,12 @@ class ProcessRecordingUseCase:
             end_time=datetime.now(),
         )
 
+    def _transcribe_all(self, audio_paths: Sequence[str]) -> list[tuple[str, str]]:
+        transcribe_many = getattr(self._transcriber, "transcribe_many", None)
+        if transcribe_many is not None:
+            return transcribe_many(audio_paths)
+        return [self._transcriber.transcribe_and_save(path) for path in audio_paths]
+
     def _process_transcript(self, audio_path: str) -> str | None:
         transcript, transcript_path = self._transcriber.transcribe_and_save(audio_path)
         self._transcriber.unload()
@@ -107,9 +189,22 @@ class ProcessRecordingUseCase:
         self._files.save_text(cleaned_path, cleaned)
         return cleaned
 
-    def _save_summary(self, transcript: str, session: RecordingSession) -> None:
+    def _save_summary(
+        self,
+        transcript: str | None,
+        session: RecordingSession,
+        cleaned_path: Path | None = None,
+    ) -> None:
+        """Refresh the day's summary from its transcripts on disk.
+
+        ``transcript`` is only used when the day has no transcript files; a
+        streamed session passes its ``cleaned_path`` instead, so its text is
+        read in bounded pieces rather than handed over whole.
+        """
         target_date = session.start_time.strftime("%Y%m%d")
         source_paths = self._daily_artifacts.summary_sources_for_date(target_date)
+        if not source_paths and cleaned_path is not None:
+            source_paths = (cleaned_path,)
         self._daily_artifacts.refresh_summary(
             target_date,
             self._summarizer,
@@ -133,3 +228,53 @@ class ProcessRecordingUseCase:
 
     def _finalize(self, audio_path: str) -> None:
         self._files.archive(audio_path)
+
+
+class SegmentTranscriptionWorker:
+    """Transcribe closed recording segments while the session is still running.
+
+    Results land in the regular transcript cache, so ``execute_session`` merges
+    them exactly like transcripts it produced itself.
+    """
+
+    def __init__(self, transcriber: TranscriberProtocol) -> None:
+        self._transcriber = transcriber
+        self._queue: queue.Queue[str] = queue.Queue()
+        self._pending: set[str] = set()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def submit(self, audio_path: str) -> None:
+        with self._condition:
+            self._pending.add(audio_path)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="vlog-segment-transcriber",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._queue.put(audio_path)
+
+    def wait_for(self, audio_paths: Iterable[str]) -> None:
+        targets = set(audio_paths)
+        with self._condition:
+            self._condition.wait_for(lambda: not (targets & self._pending))
+
+    def _run(self) -> None:
+        while True:
+            audio_path = self._queue.get()
+            try:
+                self._transcriber.transcribe_and_save(audio_path)
+            except Exception:
+                # execute_session transcribes the segment again at session end.
+                logger.exception("Rolling segment transcription failed: %s", audio_path)
+            finally:
+                with self._condition:
+                    self._pending.discard(audio_path)
+                    self._condition.notify_all()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from vlog_capture.infrastructure.ai_executor import AIExecutor
+from vlog_capture.infrastructure.fake_llm import FakeGenerativeModel
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time a multi-date backfill against the offline fake provider"
+    )
+    parser.add_argument("--dates", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--rpm", type=float, default=0, help="0 disables pacing")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    prompts = [f"summary for day {day}" for day in range(args.dates)]
+    for concurrency in args.concurrency:
+        model = FakeGenerativeModel(latency_seconds=args.latency)
+        executor = AIExecutor(
+            concurrency=concurrency,
+            requests_per_minute=args.rpm,
+            deadline_seconds=0,
+        )
+        started = time.perf_counter()
+        executor.run_ordered(prompts, model.generate_content)
+        elapsed = time.perf_counter() - started
+        print(
+            f"concurrency {concurrency:3d}  {args.dates} dates  {elapsed:7.2f} s  "
+            f"{args.dates / elapsed:6.1f} dates/s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from pathlib import Path
+
+from vlog_capture.infrastructure.daily_state import DailyStateStore
+
+
+def _dates(days: int) -> list[str]:
+    start = date(2021, 1, 1)
+    return [
+        (start + timedelta(days=offset)).strftime("%Y%m%d") for offset in range(days)
+    ]
+
+
+def _record(store: DailyStateStore, date_str: str) -> None:
+    store.record_summary(
+        date_str,
+        source_paths=[
+            Path(f"cleaned_{date_str}_{hour:02d}0000.txt") for hour in range(4)
+        ],
+        source_hash="0" * 64,
+        summary_text=f"summary for {date_str}",
+        summary_path=Path(f"summaries/{date_str}_summary.txt"),
+    )
+
+
+def _seconds(func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def _bench(path: Path, dates: list[str], updates: int, shared: bool) -> None:
+    store = DailyStateStore(path)
+
+    def populate() -> None:
+        with store.transaction():
+            for date_str in dates:
+                _record(store, date_str)
+
+    def update() -> None:
+        for date_str in dates[-updates:]:
+            _record(store, date_str)
+
+    def sync_scan() -> None:
+        # is_publishable_summary builds a fresh store for every date.
+        for date_str in dates:
+            if not shared:
+                DailyStateStore._backends.clear()
+            DailyStateStore(path).get(date_str)
+
+    populate_s = _seconds(populate)
+    update_s = _seconds(update)
+    scan_s = _seconds(sync_scan)
+    label = f"{path.suffix[1:]}{'' if shared else ' (reparsed per lookup)'}"
+    print(
+        f"{label:28} populate {populate_s * 1000:8.1f} ms  "
+        f"{updates} single updates {update_s * 1000:8.1f} ms  "
+        f"{len(dates)} lookups {scan_s * 1000:8.1f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare the JSON and SQLite daily state backends"
+    )
+    parser.add_argument("--days", type=int, default=5 * 365 + 1)
+    parser.add_argument("--updates", type=int, default=100)
+    args = parser.parse_args()
+
+    dates = _dates(args.days)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _bench(root / "uncached" / "daily_state.json", dates, args.updates, False)
+        _bench(root / "daily_state.json", dates, args.updates, True)
+        _bench(root / "daily_state.sqlite3", dates, args.updates, True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
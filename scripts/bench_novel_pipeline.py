@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from vlog_capture.infrastructure.ai_executor import AIExecutor
+from vlog_capture.infrastructure.daily_state import DailyStateStore
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.use_cases.build_novel import BuildNovelUseCase
+from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager
+
+
+class _Novelizer:
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def generate_chapter(
+        self, today_summary: str, novel_so_far: str = "", context: str = ""
+    ) -> str:
+        time.sleep(self.seconds)
+        return f"chapter for {today_summary}"
+
+
+class _ImageGenerator:
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def generate_from_novel(self, chapter_text: str, output_path: Path) -> None:
+        time.sleep(self.seconds)
+        output_path.write_bytes(b"")
+
+
+class _NoGraph:
+    def search(self, query: str, limit: int = 5) -> list:
+        return []
+
+    def get_context_string(self, triples: list) -> str:
+        return ""
+
+
+def _run(
+    root: Path, dates: list[str], args: argparse.Namespace, pipelined: bool
+) -> float:
+    for name, attr in (
+        ("summaries", "summary_dir"),
+        ("novels", "novel_out_dir"),
+        ("photos", "photo_dir"),
+    ):
+        (root / name).mkdir(parents=True)
+        setattr(settings, attr, root / name)
+    for date_str in dates:
+        (root / "summaries" / f"{date_str}_summary.txt").write_text(
+            f"day {date_str}", encoding="utf-8"
+        )
+    use_case = BuildNovelUseCase(
+        _Novelizer(args.chapter_seconds),
+        _ImageGenerator(args.image_seconds),
+        _NoGraph(),  # type: ignore[arg-type]
+        DailyArtifactManager(DailyStateStore(root / "daily_state.json")),
+    )
+    started = time.perf_counter()
+    if pipelined:
+        use_case.execute_many(dates, AIExecutor(1, 0, 0))
+    else:
+        for date_str in dates:
+            use_case.execute(date_str)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare date-by-date and pipelined novel backfills"
+    )
+    parser.add_argument("--dates", type=int, default=20)
+    parser.add_argument("--chapter-seconds", type=float, default=0.2)
+    parser.add_argument("--image-seconds", type=float, default=0.2)
+    args = parser.parse_args()
+
+    dates = [f"2026{1 + day // 28:02d}{1 + day % 28:02d}" for day in range(args.dates)]
+    with tempfile.TemporaryDirectory() as tmp:
+        sequential = _run(Path(tmp) / "sequential", dates, args, False)
+        pipelined = _run(Path(tmp) / "pipelined", dates, args, True)
+    print(f"date by date  {sequential:7.2f} s")
+    print(f"pipelined     {pipelined:7.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from vlog_capture.infrastructure.parallel_transcription import ParallelTranscriber
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.system import Transcriber
+
+
+def _timed(transcriber, files: list[str]) -> tuple[float, list[str]]:
+    with tempfile.TemporaryDirectory() as transcript_dir:
+        settings.transcript_dir = Path(transcript_dir)
+        started = time.perf_counter()
+        if isinstance(transcriber, ParallelTranscriber):
+            results = transcriber.transcribe_many(files)
+        else:
+            results = [transcriber.transcribe_and_save(path) for path in files]
+        elapsed = time.perf_counter() - started
+        transcriber.unload()
+    return elapsed, [text for text, _ in results]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare sequential and process-pool CPU transcription"
+    )
+    parser.add_argument("files", nargs="+", help="Audio segments of one session")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    files = [str(Path(path)) for path in args.files]
+    sequential, expected = _timed(Transcriber(device="cpu", compute_type="int8"), files)
+    parallel_transcriber = ParallelTranscriber(workers=args.workers)
+    parallel, actual = _timed(parallel_transcriber, files)
+
+    print(f"Segments: {len(files)}")
+    print(f"Sequential: {sequential:.1f}s")
+    print(f"Parallel ({parallel_transcriber.workers} workers): {parallel:.1f}s")
+    print(f"Speedup: {sequential / parallel:.2f}x")
+    if actual != expected:
+        print("Transcripts differ between sequential and parallel runs")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
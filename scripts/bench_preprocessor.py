@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from vlog_capture.infrastructure.system import TranscriptPreprocessor
+
+_WORDS = [
+    "今日はVRChatでフレンドと一緒にワールド巡りをした",
+    "それでさ",
+    "めっちゃ綺麗だった",
+    "次はどこに行こうか",
+    "ありがとうございます",
+]
+_SEPARATORS = [" ", "、", "。", "?", "!"]
+
+
+def synthetic_transcript(megabytes: float, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    vocabulary = _WORDS + TranscriptPreprocessor.FILLERS
+    target = int(megabytes * 1024 * 1024)
+    parts: list[str] = []
+    size = 0
+    while size < target:
+        word = rng.choice(vocabulary)
+        parts.append(word)
+        parts.append(rng.choice(_SEPARATORS))
+        size += len(word.encode("utf-8")) + 1
+    return "".join(parts)
+
+
+def _throughput(func, text: str, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func(text)
+    elapsed = (time.perf_counter() - started) / rounds
+    return len(text.encode("utf-8")) / (1024 * 1024) / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark TranscriptPreprocessor")
+    parser.add_argument("--megabytes", type=float, default=4.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    text = synthetic_transcript(args.megabytes)
+    preprocessor = TranscriptPreprocessor()
+    stages = {
+        "remove_fillers": preprocessor._remove_fillers,
+        "remove_repetition": preprocessor._remove_repetition,
+        "dedupe_words": preprocessor._dedupe_words,
+        "process": preprocessor.process,
+    }
+    print(f"Transcript: {args.megabytes:.1f} MB")
+    for name, stage in stages.items():
+        print(f"{name}: {_throughput(stage, text, args.rounds):.1f} MB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
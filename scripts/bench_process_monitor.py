@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import psutil
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.system import ProcessMonitor
+
+
+def _fake_proc(root: Path, processes: int, with_target: bool) -> None:
+    stat_tail = " ".join(["S"] + ["0"] * 18 + ["1000"] + ["0"] * 10)
+    for pid in range(1, processes + 1):
+        comm = "VRChat.exe" if with_target and pid == processes else f"worker{pid}"
+        proc = root / str(pid)
+        proc.mkdir()
+        (proc / "comm").write_text(comm + "\n", encoding="utf-8")
+        (proc / "stat").write_text(f"{pid} ({comm}) {stat_tail}", encoding="utf-8")
+        (proc / "cmdline").write_bytes(comm.encode() + b"\0")
+
+
+def _ticks_per_second(check, seconds: float) -> float:
+    ticks = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        check()
+        ticks += 1
+    return ticks / seconds
+
+
+def _process_iter_check(targets: set[str]) -> bool:
+    for proc in psutil.process_iter(["name", "exe"]):
+        name = (proc.info.get("name") or "").lower()
+        exe = (proc.info.get("exe") or "").lower()
+        if any(target in name or target in exe for target in targets):
+            return True
+    return False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ProcessMonitor ticks")
+    parser.add_argument("--processes", type=int, default=5000)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    targets = {name.lower() for name in settings.process_names}
+    print(f"Host processes: {len(psutil.pids())}")
+    print(
+        "psutil process_iter scan (host): "
+        f"{_ticks_per_second(lambda: _process_iter_check(targets), args.seconds):.1f} ticks/s"
+    )
+    for with_target, label in ((False, "miss"), (True, "hit")):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _fake_proc(root, args.processes, with_target)
+            monitor = ProcessMonitor(proc_root=root)
+            rate = _ticks_per_second(monitor.is_running, args.seconds)
+            print(
+                f"/proc monitor, {args.processes} processes, {label}: "
+                f"{rate:.1f} ticks/s"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
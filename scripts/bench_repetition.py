@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from collections.abc import Callable
+
+from vlog_capture.infrastructure.text_repetition import (
+    collapse_repetitions,
+    dedupe_adjacent_words,
+)
+
+_FUZZ_ALPHABET = ["a", "b", "あ", "い", " ", "\n", "。", "_", "ab", "ありがとう"]
+
+# Inputs that make the old backtracking regexes quadratic or near-miss heavy.
+WORST_CASES: dict[str, Callable[[int], str]] = {
+    "dedupe: long token pair": lambda n: "a" * n + " " + "a" * n + "b",
+    "dedupe: many short pairs": lambda n: "はい はい。" * (n // 6),
+    "collapse: near-miss periods": lambda n: ("abcd" * 3 + "x") * (n // 13),
+    "collapse: hallucination loop": lambda n: "ありがとうございます" * (n // 10),
+}
+
+
+def _seconds(func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def _fuzz(iterations: int, max_period: int) -> int:
+    rng = random.Random(0)
+    collapse = re.compile(rf"(.{{1,{max_period}}}?)\1{{4,}}")
+    dedupe = re.compile(r"(\S+)\s+\1\b")
+    for _ in range(iterations):
+        text = "".join(rng.choice(_FUZZ_ALPHABET) for _ in range(rng.randint(0, 48)))
+        if collapse_repetitions(text, max_period).text != collapse.sub(r"\1", text):
+            print(f"collapse mismatch: {text!r}")
+            return 1
+        if dedupe_adjacent_words(text) != dedupe.sub(r"\1", text):
+            print(f"dedupe mismatch: {text!r}")
+            return 1
+    print(f"fuzz: {iterations} inputs match the regex reference")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Fuzz and benchmark linear-time repetition collapse"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[250_000, 500_000, 1_000_000]
+    )
+    parser.add_argument("--max-period", type=int, default=16)
+    parser.add_argument("--fuzz", type=int, default=20_000)
+    args = parser.parse_args()
+
+    if _fuzz(args.fuzz, args.max_period):
+        return 1
+    for name, build in WORST_CASES.items():
+        previous = None
+        for size in args.sizes:
+            text = build(size)
+            if name.startswith("dedupe"):
+                elapsed = _seconds(lambda: dedupe_adjacent_words(text))
+            else:
+                elapsed = _seconds(lambda: collapse_repetitions(text, args.max_period))
+            growth = f" x{elapsed / previous:.2f}" if previous else ""
+            print(f"{name}, {len(text)} chars: {elapsed * 1000:.1f} ms{growth}")
+            previous = elapsed
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
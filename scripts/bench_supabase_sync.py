@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from vlog_capture.infrastructure import daily_state
+from vlog_capture.infrastructure.daily_state import DailyStateStore
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.strict_sync import StrictSupabaseSync
+from vlog_capture.infrastructure.sync_manifest import SyncManifest
+
+
+class _Response:
+    def __init__(self, data: list) -> None:
+        self.data = data
+
+
+class _Query:
+    def __init__(self, client: _Client) -> None:
+        self.client = client
+        self.data: list = []
+
+    def upsert(self, rows: list, on_conflict: str) -> _Query:
+        self.client.rows += len(rows)
+        self.data = rows
+        return self
+
+    def update(self, values: dict) -> _Query:
+        return self
+
+    def in_(self, column: str, keys: list) -> _Query:
+        self.client.rows += len(keys)
+        return self
+
+    def execute(self) -> _Response:
+        self.client.requests += 1
+        time.sleep(self.client.request_seconds)
+        return _Response(self.data)
+
+
+class _Client:
+    def __init__(self, request_seconds: float) -> None:
+        self.request_seconds = request_seconds
+        self.requests = 0
+        self.rows = 0
+
+    def table(self, name: str) -> _Query:
+        return _Query(self)
+
+
+def _sync(root: Path, request_seconds: float) -> tuple[float, _Client]:
+    client = _Client(request_seconds)
+    sync = StrictSupabaseSync(
+        client=client, manifest=SyncManifest(root / "sync.json", target="bench")
+    )
+    sync._write_report = lambda report: None  # type: ignore[method-assign]
+    started = time.perf_counter()
+    sync.sync()
+    return time.perf_counter() - started, client
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time a full Supabase sync against one with a few changed rows"
+    )
+    parser.add_argument("--dates", type=int, default=1000)
+    parser.add_argument("--changed", type=int, default=5)
+    parser.add_argument("--chars", type=int, default=20_000)
+    parser.add_argument("--request-seconds", type=float, default=0.05)
+    args = parser.parse_args()
+
+    dates = [
+        f"{2000 + day // 336}{1 + day // 28 % 12:02d}{1 + day % 28:02d}"
+        for day in range(args.dates)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for name, attr in (
+            ("summaries", "summary_dir"),
+            ("novels", "novel_out_dir"),
+            ("photos", "photo_dir"),
+            ("transcripts", "transcript_dir"),
+        ):
+            (root / name).mkdir()
+            setattr(settings, attr, root / name)
+        settings.daily_state_backend = "json"
+        daily_state.DEFAULT_STATE_PATH = root / "daily_state.json"
+        body = "x" * args.chars
+        state = {}
+        for date_str in dates:
+            (root / "transcripts" / f"{date_str}.txt").write_text(body, "utf-8")
+            (root / "summaries" / f"{date_str}_summary.txt").write_text(body, "utf-8")
+            (root / "novels" / f"{date_str}.md").write_text(body, "utf-8")
+            state[date_str] = {"summary_source_files": [f"{date_str}.txt"]}
+        DailyStateStore().save({"dates": state})
+
+        full, first = _sync(root, args.request_seconds)
+        for date_str in dates[: args.changed]:
+            (root / "novels" / f"{date_str}.md").write_text("revised", "utf-8")
+        incremental, second = _sync(root, args.request_seconds)
+    print(f"full sync         {full:7.2f} s  rows={first.rows}")
+    print(f"{args.changed} changed rows   {incremental:7.2f} s  rows={second.rows}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
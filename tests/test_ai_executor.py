@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+from vlog_capture.infrastructure.ai_executor import AIExecutor, TokenBucket
+from vlog_capture.infrastructure.daily_state import DailyStateStore
+from vlog_capture.infrastructure.fake_llm import FakeGenerativeModel
+from vlog_capture.infrastructure.repositories import FileRepository
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager, SummaryJob
+
+
+def test_commits_follow_input_order_with_bounded_concurrency():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(item: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05 if item % 2 == 0 else 0.01)
+        with lock:
+            active -= 1
+        return item * 10
+
+    committed = []
+    executor = AIExecutor(concurrency=3, requests_per_minute=0, deadline_seconds=0)
+    results = executor.run_ordered(
+        list(range(8)), work, lambda item, result: committed.append(result)
+    )
+
+    assert results == committed == [item * 10 for item in range(8)]
+    assert 1 < peak <= 3
+
+
+def test_failure_surfaces_after_earlier_items_commit():
+    def work(item: int) -> int:
+        if item == 2:
+            raise ValueError("bad date")
+        return item
+
+    committed = []
+    executor = AIExecutor(concurrency=4, requests_per_minute=0, deadline_seconds=0)
+    with pytest.raises(ValueError):
+        executor.run_ordered(
+            [0, 1, 2, 3], work, lambda item, result: committed.append(item)
+        )
+
+    assert committed == [0, 1]
+
+
+def test_deadline_raises_timeout():
+    executor = AIExecutor(concurrency=1, requests_per_minute=0, deadline_seconds=0.05)
+    model = FakeGenerativeModel(latency_seconds=0.3)
+
+    with pytest.raises(TimeoutError):
+        executor.run_ordered(["prompt"], model.generate_content)
+
+
+def test_token_bucket_paces_acquisitions():
+    import asyncio
+
+    bucket = TokenBucket(rate=50, capacity=1)
+
+    async def acquire_all() -> float:
+        started = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(acquire_all()) >= 0.09
+
+
+def test_summaries_fan_out_and_record_every_date(monkeypatch, tmp_path):
+    for name, attr in (("transcripts", "transcript_dir"), ("summaries", "summary_dir")):
+        (tmp_path / name).mkdir()
+        monkeypatch.setattr(settings, attr, tmp_path / name)
+    monkeypatch.setattr(settings, "summary_map_reduce", False)
+    state = DailyStateStore(tmp_path / "daily_state.json")
+    manager = DailyArtifactManager(state)
+    dates = [f"202606{day:02d}" for day in range(1, 7)]
+    for date_str in dates:
+        source = settings.transcript_dir / f"cleaned_{date_str}_120000.txt"
+        source.write_text(f"talk on {date_str}", encoding="utf-8")
+
+    class Summarizer:
+        def summarize(self, transcript, session=None, date_str=None, **kwargs):
+            time.sleep(0.02)
+            return f"summary of {date_str}"
+
+    jobs = [
+        manager.plan_summary(
+            date_str, source_paths=manager.summary_sources_for_date(date_str)
+        )
+        for date_str in dates
+    ]
+    assert all(isinstance(job, SummaryJob) for job in jobs)
+    AIExecutor(concurrency=4, requests_per_minute=0).run_ordered(
+        jobs,
+        lambda job: manager.generate_summary(job, Summarizer()),
+        lambda job, text: manager.commit_summary(job, text, FileRepository()),
+    )
+
+    for date_str in dates:
+        assert state.get(date_str)["summary_source_hash"]
+        assert manager.plan_summary(date_str) == f"summary of {date_str}"
+
+
+def test_slow_commit_does_not_delay_other_calls():
+    started = time.monotonic()
+    starts = []
+
+    def work(item: int) -> int:
+        starts.append(time.monotonic() - started)
+        time.sleep(0.05)
+        return item
+
+    committed = []
+
+    def commit(item: int, result: int) -> None:
+        time.sleep(0.2)
+        committed.append(item)
+
+    executor = AIExecutor(concurrency=2, requests_per_minute=0, deadline_seconds=0.15)
+    executor.run_ordered(list(range(6)), work, commit)
+
+    assert committed == list(range(6))
+    # Every call starts while the first commit is still running.
+    assert max(starts) < 0.2
+
+
+def test_run_one_applies_the_deadline():
+    executor = AIExecutor(concurrency=1, requests_per_minute=0, deadline_seconds=0.05)
+    model = FakeGenerativeModel(latency_seconds=0.3)
+
+    assert executor.run_one(2, lambda item: item * 10) == 20
+    with pytest.raises(TimeoutError):
+        executor.run_one("prompt", model.generate_content)
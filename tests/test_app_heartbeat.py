@@ -1,10 +1,14 @@
 import logging
+from datetime import datetime
+from pathlib import Path
 from unittest.mock import Mock
 
 from vlog_capture.app import Application
+from vlog_capture.domain.entities import RecordingSession
+from vlog_capture.infrastructure.session_queue import SessionQueue
 
 
-def _heartbeat_app() -> Application:
+def _heartbeat_app(tmp_path: Path) -> Application:
     app = Application.__new__(Application)
     app._last_heartbeat_at = -30.0
     app._last_heartbeat_log_at = -300.0
@@ -13,14 +17,15 @@ def _heartbeat_app() -> Application:
     app._recorder = Mock()
     app._recorder.is_recording = False
     app._active_file = None
-    app._processing_threads = set()
+    app._queue = SessionQueue(tmp_path / "session_queue.json")
+    app._rolling = None
     return app
 
 
 def test_waiting_heartbeat_is_logged_immediately_and_periodically(
-    monkeypatch, caplog
+    monkeypatch, caplog, tmp_path
 ) -> None:
-    app = _heartbeat_app()
+    app = _heartbeat_app(tmp_path)
     current_time = 1.0
     monkeypatch.setattr("vlog_capture.app.time.monotonic", lambda: current_time)
 
@@ -39,9 +44,9 @@ def test_waiting_heartbeat_is_logged_immediately_and_periodically(
 
 
 def test_heartbeat_logs_immediately_when_vrchat_state_changes(
-    monkeypatch, caplog
+    monkeypatch, caplog, tmp_path
 ) -> None:
-    app = _heartbeat_app()
+    app = _heartbeat_app(tmp_path)
     current_time = 1.0
     monkeypatch.setattr("vlog_capture.app.time.monotonic", lambda: current_time)
 
@@ -54,3 +59,21 @@ def test_heartbeat_logs_immediately_when_vrchat_state_changes(
         "Monitor waiting: VRChat process not detected; recording=False; workers=0",
         "Monitor heartbeat: VRChat detected; recording=False; workers=0",
     ]
+
+
+def test_heartbeat_reports_processing_queue(monkeypatch, tmp_path) -> None:
+    app = _heartbeat_app(tmp_path)
+    monkeypatch.setattr("vlog_capture.app.time.monotonic", lambda: 1.0)
+    app._queue.put(
+        RecordingSession(
+            file_paths=("a.flac",), start_time=datetime(2026, 4, 12, 12, 0, 0)
+        ),
+        "session-1",
+    )
+
+    app._heartbeat("healthy", vrchat_running=False)
+
+    context = app._events.heartbeat.call_args.kwargs["context"]
+    assert context["processing_queue"]["depth"] == 1
+    assert context["processing_queue"]["oldest_age_seconds"] >= 0
+    assert context["processing_threads"] == 0
@@ -0,0 +1,63 @@
+import os
+import time
+
+from vlog_capture.infrastructure import artifact_index
+from vlog_capture.infrastructure.artifact_index import ArtifactIndex
+
+
+def _settle(directory):
+    # Back-date the directory so its listing may be reused.
+    past = time.time() - 60
+    os.utime(directory, (past, past))
+
+
+def _layout(root):
+    for kind in ("recordings", "transcripts", "summaries", "novels"):
+        (root / kind).mkdir()
+    (root / "recordings" / "20260620_120000.flac").write_bytes(b"a")
+    (root / "recordings" / "20260621_090000.WAV").write_bytes(b"a")
+    (root / "recordings" / "notes.txt").write_text("x", encoding="utf-8")
+    (root / "transcripts" / "20260620_120000.txt").write_text("t", encoding="utf-8")
+    (root / "transcripts" / "cleaned_20260620_120000.txt").write_text(
+        "t", encoding="utf-8"
+    )
+    (root / "summaries" / "20260620_summary.txt").write_text("s", encoding="utf-8")
+    (root / "summaries" / "20260622_summary.txt").write_text("s", encoding="utf-8")
+    (root / "novels" / "20260622.md").write_text("n", encoding="utf-8")
+
+
+def test_index_answers_date_questions(tmp_path):
+    _layout(tmp_path)
+    index = ArtifactIndex.for_data_root(tmp_path)
+
+    assert index.dates("recordings") == {"20260620", "20260621"}
+    assert [p.name for p in index.paths("transcripts", "20260620")] == [
+        "20260620_120000.txt",
+        "cleaned_20260620_120000.txt",
+    ]
+    assert index.dates_without("summaries", "novels") == ["20260620"]
+    assert index.has_stem("transcripts", "cleaned_20260620_120000")
+    assert not index.has_stem("transcripts", "20260621_090000")
+    assert index.dates("evaluations") == set()
+    assert ArtifactIndex.for_data_root(tmp_path) is index
+
+
+def test_settled_directories_are_listed_once(monkeypatch, tmp_path):
+    _layout(tmp_path)
+    _settle(tmp_path / "summaries")
+    index = ArtifactIndex({"summaries": tmp_path / "summaries"})
+    scans = []
+    real_scan = artifact_index._scan
+    monkeypatch.setattr(
+        artifact_index,
+        "_scan",
+        lambda *args: scans.append(args[0]) or real_scan(*args),
+    )
+
+    for _ in range(5):
+        assert index.dates("summaries") == {"20260620", "20260622"}
+    assert len(scans) == 1
+
+    (tmp_path / "summaries" / "20260623_summary.txt").write_text("s", encoding="utf-8")
+    assert "20260623" in index.dates("summaries")
+    assert len(scans) == 2
@@ -0,0 +1,200 @@
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import numpy as np
+from vlog_capture.infrastructure import system
+from vlog_capture.infrastructure.settings import settings
+
+
+class FakeInputStream:
+    script: list[float] = []
+    overflow_reads: set[int] = set()
+
+    def __init__(self, samplerate, channels, blocksize):
+        self._channels = channels
+        self._reads = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def read(self, frames):
+        level = self.script[min(self._reads, len(self.script) - 1)]
+        overflowed = self._reads in self.overflow_reads
+        self._reads += 1
+        time.sleep(0.002)
+        noise = np.random.default_rng(self._reads).uniform(-level, level, frames)
+        return noise.astype(np.float32).reshape(frames, self._channels), overflowed
+
+
+def _patch_audio(monkeypatch, tmp_path, script: list[float]) -> None:
+    FakeInputStream.script = script
+    FakeInputStream.overflow_reads = set()
+    monkeypatch.setitem(
+        sys.modules, "sounddevice", types.SimpleNamespace(InputStream=FakeInputStream)
+    )
+    monkeypatch.setattr(settings, "recording_dir", tmp_path)
+    monkeypatch.setattr(settings, "sample_rate", 16000)
+    monkeypatch.setattr(settings, "channels", 1)
+    monkeypatch.setattr(settings, "block_size", 256)
+    monkeypatch.setattr(settings, "hangover_seconds", 0.0)
+
+
+def test_recorder_rotates_closed_segments_at_long_silence(monkeypatch, tmp_path):
+    _patch_audio(monkeypatch, tmp_path, [0.5] * 20 + [0.0] * 30 + [0.5])
+    monkeypatch.setattr(settings, "segment_seconds", 600)
+    monkeypatch.setattr(settings, "segment_silence_seconds", 0.02)
+    closed: list[str] = []
+    rotated = threading.Event()
+
+    def on_segment(path: str) -> None:
+        closed.append(path)
+        rotated.set()
+
+    recorder = system.AudioRecorder(on_segment=on_segment)
+    first = recorder.start()
+    assert rotated.wait(5)
+    time.sleep(0.2)
+    files = recorder.stop()
+
+    assert closed == [first]
+    assert files is not None
+    assert files[0] == first
+    assert len(files) == 2
+
+
+def test_recorder_without_callback_keeps_one_file(monkeypatch, tmp_path):
+    _patch_audio(monkeypatch, tmp_path, [0.5] * 10 + [0.0] * 20 + [0.5])
+    monkeypatch.setattr(settings, "segment_silence_seconds", 0.01)
+
+    recorder = system.AudioRecorder()
+    path = recorder.start()
+    time.sleep(0.15)
+    files = recorder.stop()
+
+    assert files == (path,)
+
+
+def test_input_overflow_is_counted_instead_of_stopping(monkeypatch, tmp_path):
+    _patch_audio(monkeypatch, tmp_path, [0.5])
+    FakeInputStream.overflow_reads = {3}
+
+    recorder = system.AudioRecorder()
+    path = recorder.start()
+    time.sleep(0.1)
+    assert recorder.is_recording
+    files = recorder.stop()
+
+    assert files == (path,)
+    assert recorder.stats()["input_overflows"] == 1
+    assert recorder.stats()["queue_depth"] == 0
+
+
+def test_block_ring_drops_newest_block_when_full():
+    ring = system.AudioBlockRing(capacity=2, block_size=4, channels=1)
+    blocks = [np.full((4, 1), value, dtype=np.float32) for value in (1, 2, 3)]
+
+    assert ring.push(blocks[0])
+    assert ring.push(blocks[1])
+    assert not ring.push(blocks[2])
+    assert float(ring.peek(timeout=0)[0, 0]) == 1.0
+    ring.release()
+    assert ring.push(blocks[2])
+    assert float(ring.peek(timeout=0)[0, 0]) == 2.0
+    ring.release()
+    assert float(ring.peek(timeout=0)[0, 0]) == 3.0
+    ring.release()
+
+    assert ring.peek(timeout=0) is None
+    assert ring.stats() == {
+        "queue_depth": 0,
+        "queue_capacity": 2,
+        "queue_high_water": 2,
+        "dropped_blocks": 1,
+        "input_overflows": 0,
+    }
+
+
+def test_silence_gate_keeps_preroll_and_hangover():
+    gate = system.SilenceGate(
+        sample_rate=4,
+        block_size=1,
+        channels=1,
+        threshold=0.1,
+        preroll_seconds=0.5,
+        hangover_seconds=0.25,
+    )
+    levels = [0.01, 0.02, 0.03, 0.04, 0.5, 0.05, 0.06, 0.07]
+    written: list[float] = []
+
+    active = [
+        gate.feed(
+            np.full((1, 1), level, dtype=np.float32),
+            lambda block: written.append(round(float(block[0, 0]), 2)),
+        )
+        for level in levels
+    ]
+
+    assert written == [0.03, 0.04, 0.5, 0.05]
+    assert active == [False, False, False, False, True, True, False, False]
+    assert gate.stats() == {"kept_seconds": 1.0, "dropped_seconds": 0.5}
+
+
+def test_silence_gate_matches_rms_threshold():
+    gate = system.SilenceGate(sample_rate=16000, block_size=512, channels=2)
+    rng = np.random.default_rng(7)
+    for scale in (0.001, 0.019, 0.021, 0.3):
+        block = rng.uniform(-scale, scale, (512, 2)).astype(np.float32) * 1.7
+        rms = float(np.sqrt(np.mean(np.square(block))))
+        assert gate.is_speech(block) == (rms > system.SILENCE_THRESHOLD)
+
+
+def test_recorder_rotates_by_size_without_callback(monkeypatch, tmp_path):
+    _patch_audio(monkeypatch, tmp_path, [0.5])
+    monkeypatch.setattr(settings, "segment_seconds", 0)
+    monkeypatch.setattr(settings, "segment_max_bytes", 4096)
+
+    recorder = system.AudioRecorder()
+    first = recorder.start()
+    time.sleep(0.3)
+    files = recorder.stop()
+
+    assert files is not None
+    assert files[0] == first
+    assert len(files) > 1
+    assert files == tuple(sorted(files))
+
+
+def test_failed_recorder_still_returns_closed_segments(monkeypatch, tmp_path):
+    _patch_audio(monkeypatch, tmp_path, [0.5])
+    monkeypatch.setattr(settings, "segment_seconds", 0)
+    monkeypatch.setattr(settings, "segment_max_bytes", 4096)
+    reads = {"count": 0}
+    original_read = FakeInputStream.read
+
+    def failing_read(self, frames):
+        reads["count"] += 1
+        if reads["count"] > 60:
+            raise OSError("device unplugged")
+        return original_read(self, frames)
+
+    monkeypatch.setattr(FakeInputStream, "read", failing_read)
+
+    recorder = system.AudioRecorder()
+    recorder.start()
+    deadline = time.monotonic() + 5
+    while recorder.is_recording and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    try:
+        recorder.stop()
+    except system.RecordingThreadError as exc:
+        assert len(exc.file_paths) > 1
+        assert all(Path(path).exists() for path in exc.file_paths)
+    else:
+        raise AssertionError("stop() should report the failed thread")
@@ -1,3 +1,5 @@
+import json
+from datetime import date
 from pathlib import Path
 
 import pytest
@@ -42,3 +44,50 @@ def test_success_notification_runs_after_audit(tmp_path: Path) -> None:
     assert audit_index < notify_index
     assert run_id
     assert calls[notify_index][1]["VLOG_DAILY_VERIFIED"] == "1"
+
+
+def _write_recordings(tmp_path: Path, *stems: str) -> None:
+    recordings = tmp_path / "data/recordings"
+    recordings.mkdir(parents=True, exist_ok=True)
+    for stem in stems:
+        (recordings / f"{stem}.flac").write_bytes(b"audio")
+
+
+def _run_records(tmp_path: Path) -> list[dict]:
+    log = tmp_path / "data/daily_runs.jsonl"
+    return [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+
+def test_transcription_runs_once_with_per_file_stage_records(tmp_path: Path) -> None:
+    today = date.today().strftime("%Y%m%d")
+    stems = [f"{today}_100000", f"{today}_110000"]
+    _write_recordings(tmp_path, *stems)
+    calls: list[list[str]] = []
+
+    def runner(command, env, cwd):
+        calls.append(list(command))
+        if "transcribe" in command:
+            assert env["VLOG_TASK_NAME"] == "transcribe:batch"
+            transcripts = tmp_path / "data/transcripts"
+            transcripts.mkdir(parents=True, exist_ok=True)
+            (transcripts / f"{stems[0]}.txt").write_text("text", encoding="utf-8")
+            raise RuntimeError("second file failed")
+
+    pipeline = DailyPipeline(
+        runner=runner, monitor=lambda: False, project_root=tmp_path
+    )
+    with pytest.raises(RuntimeError, match="second file failed"):
+        pipeline.run()
+
+    transcribe_calls = [command for command in calls if "transcribe" in command]
+    assert len(transcribe_calls) == 1
+    assert transcribe_calls[0].count("--file") == 2
+    terminal = {
+        record["task_name"]: record["status"]
+        for record in _run_records(tmp_path)
+        if record["status"] != "try"
+    }
+    assert terminal == {
+        f"transcribe:{stems[0]}": "success",
+        f"transcribe:{stems[1]}": "failed",
+    }
@@ -96,6 +96,32 @@ def test_refresh_summary_skips_when_sources_unchanged(monkeypatch, tmp_path):
     assert len(summarizer.calls) == 1
 
 
+def test_unchanged_refresh_reads_no_transcripts(monkeypatch, tmp_path):
+    _patch_settings(monkeypatch, tmp_path)
+    manager = DailyArtifactManager(DailyStateStore(tmp_path / "daily_state.json"))
+    summarizer = StubSummarizer()
+    for index in range(3):
+        source = settings.transcript_dir / f"cleaned_20260620_00000{index}.txt"
+        source.write_text(f"alpha {index}", encoding="utf-8")
+    manager.refresh_summary("20260620", summarizer, FileRepository())
+
+    read_bytes, read_text = Path.read_bytes, Path.read_text
+
+    def guarded(original):
+        def read(path, *args, **kwargs):
+            assert path.parent != settings.transcript_dir, f"read {path}"
+            return original(path, *args, **kwargs)
+
+        return read
+
+    monkeypatch.setattr(Path, "read_bytes", guarded(read_bytes))
+    monkeypatch.setattr(Path, "read_text", guarded(read_text))
+    again = manager.refresh_summary("20260620", summarizer, FileRepository())
+
+    assert again == "summary-1"
+    assert len(summarizer.calls) == 1
+
+
 def test_refresh_summary_rebuilds_when_sources_change(monkeypatch, tmp_path):
     _patch_settings(monkeypatch, tmp_path)
     state = DailyStateStore(tmp_path / "daily_state.json")
@@ -0,0 +1,105 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from vlog_capture.infrastructure.daily_state import (
+    DailyStateStore,
+    SourceFingerprintCache,
+    fingerprint_paths,
+)
+
+
+@pytest.fixture(params=["daily_state.json", "daily_state.sqlite3"])
+def state_path(request, tmp_path):
+    return tmp_path / request.param
+
+
+def _record(store: DailyStateStore, date_str: str) -> dict:
+    return store.record_summary(
+        date_str,
+        source_paths=[f"cleaned_{date_str}_120000.txt"],
+        source_hash="source",
+        summary_text=f"summary {date_str}",
+        summary_path=f"summaries/{date_str}_summary.txt",
+    )
+
+
+def test_records_round_trip_through_a_fresh_store(state_path):
+    _record(DailyStateStore(state_path), "20260412")
+    DailyStateStore(state_path).record_empty("20260413", "no audio")
+
+    store = DailyStateStore(state_path)
+    assert store.get("20260412")["summary_source_files"] == [
+        "cleaned_20260412_120000.txt"
+    ]
+    assert store.get("20260413")["status"] == "empty"
+    assert store.get("20260414") == {}
+    assert sorted(store.load()["dates"]) == ["20260412", "20260413"]
+
+
+def test_transaction_commits_all_dates_or_none(state_path):
+    store = DailyStateStore(state_path)
+    with store.transaction():
+        for day in range(10, 20):
+            _record(store, f"202604{day}")
+    assert len(store.load()["dates"]) == 10
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.record_empty("20260410", "rolled back")
+            store.record_empty("20260420", "rolled back")
+            assert store.get("20260420")["status"] == "empty"
+            raise RuntimeError("abort")
+
+    assert store.get("20260410")["status"] == "summary_ready"
+    assert store.get("20260420") == {}
+
+
+def test_sqlite_imports_json_state_once(tmp_path):
+    json_path = tmp_path / "daily_state.json"
+    json_path.write_text(
+        json.dumps({"version": 1, "dates": {"20260412": {"status": "empty"}}}),
+        encoding="utf-8",
+    )
+    db_path = tmp_path / "daily_state.sqlite3"
+
+    store = DailyStateStore(db_path)
+    assert store.get("20260412") == {"status": "empty"}
+    store.record_empty("20260412", "checked again")
+
+    DailyStateStore._backends.clear()
+    reopened = DailyStateStore(db_path)
+    assert reopened.get("20260412")["empty_reason"] == "checked again"
+    journal = db_path.with_name(db_path.name + "-wal")
+    assert journal.exists()
+
+
+def test_fingerprint_cache_matches_uncached_digest(tmp_path):
+    sources = [tmp_path / f"cleaned_20260412_0{index}0000.txt" for index in (2, 1)]
+    sources[0].write_text("  \n", encoding="utf-8")
+    sources[1].write_text("今日は", encoding="utf-8")
+    cache = SourceFingerprintCache(tmp_path / "source_fingerprints.json")
+
+    assert cache.fingerprint(sources) == (fingerprint_paths(sources), True)
+    assert cache.fingerprint(sources[:1]) == (fingerprint_paths(sources[:1]), False)
+
+    sources[0].write_text("変更", encoding="utf-8")
+    reopened = SourceFingerprintCache(tmp_path / "source_fingerprints.json")
+    assert reopened.fingerprint(sources) == (fingerprint_paths(sources), True)
+
+
+def test_fingerprints_are_shared_and_safe_across_threads(tmp_path):
+    store = DailyStateStore(tmp_path / "daily_state.json")
+    assert store.fingerprints is DailyStateStore(store._path).fingerprints
+
+    sources = []
+    for index in range(16):
+        source = tmp_path / f"cleaned_20260412_{index:02d}0000.txt"
+        source.write_text(f"text {index}", encoding="utf-8")
+        sources.append(source)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda source: store.fingerprints.fingerprint([source]), sources))
+
+    saved = json.loads((tmp_path / "source_fingerprints.json").read_text("utf-8"))
+    assert len(saved["entries"]) == len(sources)
+    assert not list(tmp_path.glob("*.tmp"))
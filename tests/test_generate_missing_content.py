@@ -0,0 +1,54 @@
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.scripts import generate_missing_content as script
+
+
+class FakeImageGenerator:
+    def __init__(self) -> None:
+        self.rendered = []
+
+    def generate_from_novels(self, jobs) -> None:
+        self.rendered.extend(path.stem for _, path in jobs)
+
+
+class FakeBuildNovel:
+    requested: list[str] = []
+
+    def __init__(self, *args) -> None:
+        pass
+
+    def execute_many(self, dates):
+        FakeBuildNovel.requested = list(dates)
+        return []
+
+
+class FakeRepository:
+    def sync(self) -> None:
+        pass
+
+
+def test_backfill_scan_uses_artifact_index(monkeypatch, tmp_path) -> None:
+    for name, attr in (
+        ("summaries", "summary_dir"),
+        ("novels", "novel_out_dir"),
+        ("photos", "photo_dir"),
+    ):
+        monkeypatch.setattr(settings, attr, tmp_path / name)
+        (tmp_path / name).mkdir()
+    for date_str in ("20250101", "20250102", "20250103"):
+        (tmp_path / "summaries" / f"{date_str}_summary.txt").write_text("s")
+    (tmp_path / "summaries" / "20250104_extra_summary.txt").write_text("s")
+    (tmp_path / "novels" / "20250101.md").write_text("n")
+    (tmp_path / "photos" / "20250101.png").write_bytes(b"")
+    (tmp_path / "novels" / "20250102.md").write_text("n")
+
+    images = FakeImageGenerator()
+    monkeypatch.setattr(script, "Novelizer", lambda: None)
+    monkeypatch.setattr(script, "ImageGenerator", lambda: images)
+    monkeypatch.setattr(script, "GraphStorage", lambda path: None)
+    monkeypatch.setattr(script, "BuildNovelUseCase", FakeBuildNovel)
+    monkeypatch.setattr(script, "SupabaseRepository", FakeRepository)
+
+    script.main()
+
+    assert images.rendered == ["20250102"]
+    assert FakeBuildNovel.requested == ["20250103"]
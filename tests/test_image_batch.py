@@ -0,0 +1,99 @@
+import sys
+from types import SimpleNamespace
+
+from vlog_capture.infrastructure import ai
+from vlog_capture.infrastructure.ai import ImageGenerator, ImageJob
+from vlog_capture.infrastructure.image_seeds import ImageSeedStore, derive_seed
+from vlog_capture.infrastructure.model_registry import ModelRegistry
+from vlog_capture.infrastructure.settings import settings
+
+
+class FakeGenerator:
+    def __init__(self, device: str) -> None:
+        self.seed: int | None = None
+
+    def manual_seed(self, seed: int) -> "FakeGenerator":
+        self.seed = seed
+        return self
+
+
+class FakeImage:
+    def __init__(self, prompt: str, seed: int) -> None:
+        self.content = f"{prompt}:{seed}"
+
+    def save(self, path) -> None:
+        path.write_text(self.content, encoding="utf-8")
+
+
+class FakePipeline:
+    batches: list[list[str]] = []
+
+    def to(self, device: str) -> "FakePipeline":
+        return self
+
+    def __call__(self, *, prompt, negative_prompt, generator, **kwargs):
+        assert len(prompt) == len(negative_prompt) == len(generator)
+        FakePipeline.batches.append(list(prompt))
+        return SimpleNamespace(
+            images=[FakeImage(text, gen.seed) for text, gen in zip(prompt, generator)]
+        )
+
+
+def _fake_backend(monkeypatch, tmp_path):
+    torch = SimpleNamespace(
+        cuda=SimpleNamespace(is_available=lambda: False),
+        float32="float32",
+        bfloat16="bfloat16",
+        Generator=FakeGenerator,
+    )
+    diffusers = SimpleNamespace(
+        DiffusionPipeline=SimpleNamespace(
+            from_pretrained=lambda *args, **kwargs: FakePipeline()
+        )
+    )
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    monkeypatch.setitem(sys.modules, "diffusers", diffusers)
+    monkeypatch.setattr(ai, "model_registry", ModelRegistry({"cpu": None}))
+    monkeypatch.setattr(settings, "image_device", "cpu")
+    monkeypatch.setattr(settings, "image_batch_size", 2)
+    monkeypatch.setattr(settings, "photo_prompt_dir", tmp_path / "prompts")
+    monkeypatch.setattr(settings, "trace_file", tmp_path / "traces.jsonl")
+    FakePipeline.batches = []
+    return ImageGenerator(ImageSeedStore(tmp_path / "image_seeds.json"))
+
+
+def test_batch_renders_each_image_with_its_sidecar_and_seed(monkeypatch, tmp_path):
+    generator = _fake_backend(monkeypatch, tmp_path)
+    jobs = [
+        ImageJob(f"prompt {day}", "negative", tmp_path / f"2026060{day}.png")
+        for day in range(1, 4)
+    ]
+
+    seeds = generator.generate_batch(jobs)
+
+    assert FakePipeline.batches == [["prompt 1", "prompt 2"], ["prompt 3"]]
+    assert seeds == [
+        derive_seed(settings.image_seed, job.output_path.stem) for job in jobs
+    ]
+    for job, seed in zip(jobs, seeds):
+        assert job.output_path.read_text(encoding="utf-8") == f"{job.prompt}:{seed}"
+        sidecar = settings.photo_prompt_dir / f"{job.output_path.stem}.txt"
+        assert sidecar.read_text(encoding="utf-8") == (
+            f"Prompt:\n{job.prompt}\n\nNegative Prompt:\nnegative"
+        )
+
+
+def test_single_image_regenerates_with_its_stored_seed(monkeypatch, tmp_path):
+    generator = _fake_backend(monkeypatch, tmp_path)
+    output = tmp_path / "20260601.png"
+    generator.generate_batch(
+        [
+            ImageJob("first", "negative", output, seed=1234),
+            ImageJob("other", "negative", tmp_path / "20260602.png"),
+        ]
+    )
+
+    generator.generate("first", "negative", output)
+
+    assert output.read_text(encoding="utf-8") == "first:1234"
+    assert FakePipeline.batches[-1] == ["first"]
@@ -0,0 +1,136 @@
+import json
+import os
+import time
+
+from vlog_capture.infrastructure.llm_cache import LLMResponseCache, generate_text
+from vlog_capture.infrastructure.observability import TraceLogger
+from vlog_capture.infrastructure.settings import settings
+
+
+class FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.parts = [text] if text else []
+
+
+class FakeModel:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls.append((prompt, kwargs))
+        return FakeResponse(f" reply {len(self.calls)} ")
+
+
+def _tracer(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "trace_file", tmp_path / "traces.jsonl")
+    return TraceLogger()
+
+
+def _cache_statuses(tmp_path):
+    lines = (tmp_path / "traces.jsonl").read_text(encoding="utf-8").splitlines()
+    return [json.loads(line)["metadata"]["cache"] for line in lines]
+
+
+def test_repeated_prompt_is_served_from_cache(monkeypatch, tmp_path):
+    tracer = _tracer(monkeypatch, tmp_path)
+    cache = LLMResponseCache(tmp_path / "cache", enabled=True)
+    model = FakeModel()
+
+    def run(prompt, config=None):
+        return generate_text(
+            model,
+            prompt,
+            model_name="model-a",
+            component="summarizer",
+            tracer=tracer,
+            generation_config=config,
+            cache=cache,
+        )
+
+    assert run("hello") == "reply 1"
+    assert run("hello") == "reply 1"
+    assert run("hello", {"max_output_tokens": 10}) == "reply 2"
+    assert model.calls[1] == ("hello", {"generation_config": {"max_output_tokens": 10}})
+    assert _cache_statuses(tmp_path) == ["miss", "hit", "miss"]
+
+
+def test_disabled_cache_always_calls_the_model(monkeypatch, tmp_path):
+    tracer = _tracer(monkeypatch, tmp_path)
+    cache = LLMResponseCache(tmp_path / "cache", enabled=False)
+    model = FakeModel()
+
+    for _ in range(2):
+        generate_text(
+            model, "hello", model_name="m", component="c", tracer=tracer, cache=cache
+        )
+
+    assert len(model.calls) == 2
+    assert _cache_statuses(tmp_path) == ["bypass", "bypass"]
+    assert not (tmp_path / "cache").exists()
+
+
+def test_prune_drops_stale_then_least_recently_used(tmp_path):
+    cache = LLMResponseCache(tmp_path, max_bytes=100, max_age_days=1, enabled=True)
+    now = time.time()
+    for name, age in (("stale", 2 * 86400), ("old", 60), ("new", 0)):
+        key = cache.key("m", name)
+        cache.put(key, "x" * 6)
+        os.utime(cache._path(key), (now - age, now - age))
+    cache.max_bytes = 10
+
+    assert cache.prune() == 2
+    assert cache.get(cache.key("m", "stale")) is None
+    assert cache.get(cache.key("m", "old")) is None
+    assert cache.get(cache.key("m", "new")) == "x" * 6
+
+
+def test_response_that_fails_validation_is_not_cached(monkeypatch, tmp_path):
+    tracer = _tracer(monkeypatch, tmp_path)
+    cache = LLMResponseCache(tmp_path / "cache", enabled=True)
+    replies = iter(['{"score": ', '{"score": 3}'])
+
+    class TruncatingModel:
+        def generate_content(self, prompt, **kwargs):
+            return FakeResponse(next(replies))
+
+    def run():
+        return generate_text(
+            TruncatingModel(),
+            "evaluate",
+            model_name="model-a",
+            component="curator_evaluate",
+            tracer=tracer,
+            cache=cache,
+            validate=json.loads,
+        )
+
+    try:
+        run()
+    except json.JSONDecodeError:
+        pass
+    else:
+        raise AssertionError("truncated JSON should be rejected")
+    assert json.loads(run()) == {"score": 3}
+    assert json.loads(run()) == {"score": 3}
+    assert _cache_statuses(tmp_path) == ["miss", "miss", "hit"]
+
+
+def test_cached_response_that_fails_validation_is_dropped(monkeypatch, tmp_path):
+    tracer = _tracer(monkeypatch, tmp_path)
+    cache = LLMResponseCache(tmp_path / "cache", enabled=True)
+    key = cache.key("model-a", "evaluate")
+    cache.put(key, "not json")
+    model = FakeModel()
+
+    text = generate_text(
+        model,
+        "evaluate",
+        model_name="model-a",
+        component="curator_evaluate",
+        tracer=tracer,
+        cache=cache,
+        validate=lambda text: text.startswith("reply") or json.loads(text),
+    )
+    assert text == "reply 1"
+    assert cache.get(key) == "reply 1"
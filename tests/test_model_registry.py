@@ -0,0 +1,146 @@
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from vlog_capture.infrastructure import model_registry, system
+from vlog_capture.infrastructure.model_registry import ModelRegistry
+from vlog_capture.infrastructure.settings import settings
+
+MIB = 1024 * 1024
+
+
+class TinyModel:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.released = False
+
+
+def _loader(name: str, loads: list[str]):
+    def load() -> TinyModel:
+        loads.append(name)
+        return TinyModel(name)
+
+    return load
+
+
+def test_repeated_requests_hit_the_resident_model():
+    registry = ModelRegistry({"cpu": 100 * MIB})
+    loads: list[str] = []
+
+    first = registry.get("whisper", _loader("whisper", loads), nbytes=10 * MIB)
+    second = registry.get("whisper", _loader("whisper", loads), nbytes=10 * MIB)
+
+    assert first is second
+    assert loads == ["whisper"]
+    stats = registry.stats()["whisper"]
+    assert (stats.loads, stats.hits, stats.hit_rate) == (1, 1, 0.5)
+    assert stats.load_seconds >= 0
+
+
+def test_least_recently_used_model_is_evicted_within_its_pool():
+    registry = ModelRegistry({"cpu": 100 * MIB, "cuda": 100 * MIB})
+    loads: list[str] = []
+
+    def release(model: TinyModel) -> None:
+        model.released = True
+
+    whisper = registry.get(
+        "whisper", _loader("whisper", loads), nbytes=40 * MIB, release=release
+    )
+    registry.get("tagger", _loader("tagger", loads), nbytes=40 * MIB)
+    registry.get("gpu", _loader("gpu", loads), nbytes=90 * MIB, device="cuda")
+    registry.get("whisper", _loader("whisper", loads), nbytes=40 * MIB)
+    registry.get("diffusion", _loader("diffusion", loads), nbytes=50 * MIB)
+
+    assert registry.is_resident("whisper")
+    assert not registry.is_resident("tagger")
+    assert registry.is_resident("gpu")
+    assert registry.resident_bytes("cpu") == 90 * MIB
+    assert registry.stats()["tagger"].evictions == 1
+    assert not whisper.released
+
+    registry.get("huge", _loader("huge", loads), nbytes=150 * MIB)
+
+    assert whisper.released
+    assert registry.is_resident("huge") and registry.is_resident("gpu")
+
+
+def test_transcribers_share_one_whisper_model(monkeypatch):
+    registry = ModelRegistry({"cpu": None, "cuda": None})
+    monkeypatch.setattr(system, "model_registry", registry)
+    loads: list[str] = []
+    monkeypatch.setattr(
+        system.Transcriber, "_load_model", lambda self: _loader("w", loads)()
+    )
+
+    first = system.Transcriber(device="cpu", compute_type="int8")
+    second = system.Transcriber(device="cpu", compute_type="int8")
+
+    assert first.model is second.model
+    assert second.is_loaded
+    first.unload()
+    assert not second.is_loaded
+    assert loads == ["w"]
+
+
+def test_slow_load_does_not_block_other_models():
+    registry = ModelRegistry({"cpu": 100 * MIB})
+    loads: list[str] = []
+    registry.get("whisper", _loader("whisper", loads), nbytes=10 * MIB)
+    started = threading.Event()
+    finish = threading.Event()
+
+    def slow_load() -> TinyModel:
+        started.set()
+        finish.wait(5)
+        return TinyModel("diffusion")
+
+    worker = threading.Thread(
+        target=registry.get, args=("diffusion", slow_load), kwargs={"nbytes": MIB}
+    )
+    worker.start()
+    started.wait(5)
+    try:
+        model = registry.get("whisper", _loader("whisper", loads), nbytes=10 * MIB)
+        assert model.name == "whisper"
+        assert registry.resident_bytes("cpu") == 11 * MIB
+    finally:
+        finish.set()
+        worker.join()
+
+
+def test_concurrent_misses_share_one_load():
+    registry = ModelRegistry({"cpu": 100 * MIB})
+    calls: list[str] = []
+    gate = threading.Barrier(4)
+
+    def load() -> TinyModel:
+        calls.append("diffusion")
+        time.sleep(0.1)
+        return TinyModel("diffusion")
+
+    def request() -> TinyModel:
+        gate.wait()
+        return registry.get("diffusion", load, nbytes=MIB)
+
+    with ThreadPoolExecutor(4) as pool:
+        models = list(pool.map(lambda _: request(), range(4)))
+
+    assert calls == ["diffusion"]
+    assert all(model is models[0] for model in models)
+    assert registry.stats()["diffusion"].loads == 1
+
+
+def test_vram_budget_is_probed_without_torch(monkeypatch):
+    monkeypatch.delitem(sys.modules, "torch", raising=False)
+    monkeypatch.setattr(settings, "model_vram_budget_mb", 0)
+    monkeypatch.setattr(model_registry, "_nvidia_smi_total_mib", lambda: 1000)
+    registry = ModelRegistry()
+    loads: list[str] = []
+
+    registry.get("a", _loader("a", loads), nbytes=600 * MIB, device="cuda")
+    registry.get("b", _loader("b", loads), nbytes=600 * MIB, device="cuda")
+
+    assert not registry.is_resident("a")
+    assert registry.is_resident("b")
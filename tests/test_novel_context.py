@@ -0,0 +1,121 @@
+import os
+
+from vlog_capture.infrastructure.novel_context import NovelContextBuilder
+from vlog_capture.infrastructure.settings import settings
+
+
+class SynopsisNovelizer:
+    synopsis_signature = "stub:v1"
+
+    def __init__(self) -> None:
+        self.folded: list[str] = []
+
+    def update_synopsis(self, synopsis: str, chapter: str) -> str:
+        self.folded.append(chapter)
+        return f"{synopsis}|{chapter[:4]}"
+
+
+def _write_chapters(novel_dir, days, body="本文" * 10):
+    for day in days:
+        path = novel_dir / f"202606{day:02d}.md"
+        path.write_text(
+            f"c{day:02d} {body}\n\n---\n[IMAGE_PROMPT: scenery]", encoding="utf-8"
+        )
+
+
+def _builder(monkeypatch, tmp_path, budget=10_000):
+    novel_dir = tmp_path / "novels"
+    novel_dir.mkdir()
+    monkeypatch.setattr(settings, "novel_context_chapters", 2)
+    monkeypatch.setattr(settings, "novel_context_chars", budget)
+    monkeypatch.setattr(settings, "novel_synopsis_chars", 500)
+    return novel_dir, NovelContextBuilder(novel_dir, tmp_path / "synopsis.json")
+
+
+def test_older_chapters_fold_into_synopsis_once(monkeypatch, tmp_path):
+    novel_dir, builder = _builder(monkeypatch, tmp_path)
+    novelizer = SynopsisNovelizer()
+    _write_chapters(novel_dir, range(1, 7))
+
+    context = builder.build("20260607", novelizer)
+
+    assert len(novelizer.folded) == 4
+    assert context.startswith("【これまでのあらすじ】\n|c01 |c02 |c03 |c04 ")
+    assert "【20260605】\nc05" in context and "【20260606】\nc06" in context
+    assert "IMAGE_PROMPT" not in context
+
+    _write_chapters(novel_dir, [7])
+    builder.build("20260608", novelizer)
+
+    assert len(novelizer.folded) == 5
+
+
+def test_rewritten_chapter_refolds_from_that_point(monkeypatch, tmp_path):
+    novel_dir, builder = _builder(monkeypatch, tmp_path)
+    novelizer = SynopsisNovelizer()
+    _write_chapters(novel_dir, range(1, 7))
+    builder.build("20260607", novelizer)
+
+    rewritten = novel_dir / "20260603.md"
+    rewritten.write_text("c03 rewritten", encoding="utf-8")
+    stat = rewritten.stat()
+    os.utime(rewritten, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    context = builder.build("20260607", novelizer)
+
+    assert len(novelizer.folded) == 6
+    assert "|c01 |c02 |c03 |c04 " in context
+
+
+def test_touched_chapter_with_same_content_is_not_refolded(monkeypatch, tmp_path):
+    novel_dir, builder = _builder(monkeypatch, tmp_path)
+    novelizer = SynopsisNovelizer()
+    _write_chapters(novel_dir, range(1, 7))
+    builder.build("20260607", novelizer)
+
+    touched = novel_dir / "20260602.md"
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    builder.build("20260607", novelizer)
+
+    assert len(novelizer.folded) == 4
+
+
+def test_first_build_over_an_archive_folds_only_the_latest_chapters(
+    monkeypatch, tmp_path
+):
+    novel_dir, builder = _builder(monkeypatch, tmp_path)
+    monkeypatch.setattr(settings, "novel_synopsis_seed_chapters", 3)
+    novelizer = SynopsisNovelizer()
+    _write_chapters(novel_dir, range(1, 21))
+
+    context = builder.build("20260621", novelizer)
+
+    assert [chapter[:3] for chapter in novelizer.folded] == ["c16", "c17", "c18"]
+    assert context.startswith("【これまでのあらすじ】\n|c16 |c17 |c18 ")
+
+    _write_chapters(novel_dir, [21])
+    builder.build("20260622", novelizer)
+
+    assert len(novelizer.folded) == 4
+
+
+def test_context_stays_within_budget(monkeypatch, tmp_path):
+    novel_dir, builder = _builder(monkeypatch, tmp_path, budget=300)
+    _write_chapters(novel_dir, range(1, 4), body="長い本文。" * 200)
+
+    context = builder.build("20260604", SynopsisNovelizer())
+
+    assert len(context) <= 300
+    assert context.endswith("長い本文。")
+    assert "【20260603】" in context
+
+
+def test_without_synopsis_support_only_recent_chapters_are_used(monkeypatch, tmp_path):
+    novel_dir, builder = _builder(monkeypatch, tmp_path)
+    _write_chapters(novel_dir, range(1, 5))
+
+    context = builder.build("20260605", novelizer=None)
+
+    assert "あらすじ" not in context
+    assert "c03" in context and "c04" in context and "c02" not in context
+    assert builder.build("20260601") == ""
@@ -0,0 +1,94 @@
+import time
+from pathlib import Path
+
+import pytest
+from vlog_capture.infrastructure.ai_executor import AIExecutor
+from vlog_capture.infrastructure.daily_state import DailyStateStore
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.use_cases.build_novel import BuildNovelUseCase
+from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager
+
+from tests.test_daily_artifacts import StubGraphStorage, _patch_settings
+
+DATES = [f"202606{day:02d}" for day in range(1, 7)]
+STAGE_SECONDS = 0.05
+
+
+class SlowNovelizer:
+    def generate_chapter(self, today_summary, novel_so_far="", context=""):
+        time.sleep(STAGE_SECONDS)
+        return f"chapter for {today_summary}"
+
+
+class SlowImageGenerator:
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.rendered: list[str] = []
+        self._fail_on = fail_on
+
+    def generate_from_novel(self, chapter_text: str, output_path: Path) -> None:
+        if output_path.stem == self._fail_on:
+            raise RuntimeError("out of memory")
+        time.sleep(STAGE_SECONDS)
+        output_path.write_bytes(b"png")
+        self.rendered.append(output_path.stem)
+
+
+def _use_case(monkeypatch, tmp_path, image_generator):
+    _patch_settings(monkeypatch, tmp_path)
+    for date_str in DATES:
+        (settings.summary_dir / f"{date_str}_summary.txt").write_text(
+            f"day {date_str}", encoding="utf-8"
+        )
+    state = DailyStateStore(tmp_path / "daily_state.json")
+    use_case = BuildNovelUseCase(
+        SlowNovelizer(),
+        image_generator,
+        StubGraphStorage(),
+        DailyArtifactManager(state),
+    )
+    return use_case, state
+
+
+def test_backfill_overlaps_chapters_and_images(monkeypatch, tmp_path):
+    images = SlowImageGenerator()
+    use_case, state = _use_case(monkeypatch, tmp_path, images)
+    executor = AIExecutor(concurrency=1, requests_per_minute=0, deadline_seconds=0)
+
+    started = time.perf_counter()
+    paths = use_case.execute_many(DATES, executor)
+    elapsed = time.perf_counter() - started
+
+    assert [path.stem for path in paths] == DATES
+    assert images.rendered == DATES
+    assert all(state.get(date_str)["novel_summary_hash"] for date_str in DATES)
+    assert elapsed < 2 * len(DATES) * STAGE_SECONDS * 0.8
+
+
+def test_image_failure_stops_the_backfill(monkeypatch, tmp_path):
+    images = SlowImageGenerator(fail_on=DATES[2])
+    use_case, state = _use_case(monkeypatch, tmp_path, images)
+    executor = AIExecutor(concurrency=2, requests_per_minute=0, deadline_seconds=0)
+
+    with pytest.raises(RuntimeError, match="out of memory"):
+        use_case.execute_many(DATES, executor)
+
+    assert images.rendered == DATES[:2]
+    assert not state.get(DATES[2]).get("novel_summary_hash")
+
+
+def test_backfill_context_includes_earlier_chapters_from_the_run(monkeypatch, tmp_path):
+    seen: dict[str, str] = {}
+
+    class RecordingNovelizer:
+        def generate_chapter(self, today_summary, novel_so_far="", context=""):
+            seen[today_summary] = novel_so_far
+            return f"chapter for {today_summary}"
+
+    use_case, _ = _use_case(monkeypatch, tmp_path, SlowImageGenerator())
+    use_case._novelizer = RecordingNovelizer()
+    monkeypatch.setattr(settings, "novel_context_chapters", len(DATES))
+
+    use_case.execute_many(DATES, AIExecutor(concurrency=4, requests_per_minute=0))
+
+    for earlier, later in zip(DATES, DATES[1:]):
+        assert f"chapter for day {earlier}" in seen[f"day {later}"]
@@ -0,0 +1,126 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from vlog_capture.infrastructure import parallel_transcription
+from vlog_capture.infrastructure.parallel_transcription import (
+    ParallelTranscriber,
+    resolve_worker_count,
+)
+from vlog_capture.infrastructure.settings import settings
+
+
+class SlowTranscriber:
+    created: list[dict] = []
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, **kwargs) -> None:
+        SlowTranscriber.created.append(kwargs)
+
+    def cached(self, audio_path: str) -> tuple[str, str] | None:
+        out = Path(settings.transcript_dir) / f"{Path(audio_path).stem}.txt"
+        if not out.exists():
+            return None
+        return out.read_text(encoding="utf-8").strip(), str(out)
+
+    def transcribe_and_save(self, audio_path: str) -> tuple[str, str]:
+        with SlowTranscriber.lock:
+            SlowTranscriber.active += 1
+            SlowTranscriber.peak = max(SlowTranscriber.peak, SlowTranscriber.active)
+        # Later segments finish first so ordering has to come from the merge.
+        time.sleep(0.05 if audio_path.endswith("0.flac") else 0.01)
+        with SlowTranscriber.lock:
+            SlowTranscriber.active -= 1
+        out = Path(settings.transcript_dir) / f"{Path(audio_path).stem}.txt"
+        out.write_text(f"text {Path(audio_path).stem}\n", encoding="utf-8")
+        return f"text {Path(audio_path).stem}", str(out)
+
+
+def _thread_pool(workers, initializer, initargs):
+    return ThreadPoolExecutor(workers, initializer=initializer, initargs=initargs)
+
+
+@pytest.fixture
+def transcriber(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "transcript_dir", tmp_path)
+    monkeypatch.setattr(parallel_transcription, "Transcriber", SlowTranscriber)
+    SlowTranscriber.created = []
+    SlowTranscriber.peak = 0
+    parallel = ParallelTranscriber(workers=3, executor_factory=_thread_pool)
+    yield parallel
+    parallel.close()
+
+
+def test_results_keep_segment_order(transcriber):
+    paths = [f"/rec/20260412_12000{index}.flac" for index in range(6)]
+
+    results = transcriber.transcribe_many(paths)
+
+    assert [text for text, _ in results] == [
+        f"text {Path(path).stem}" for path in paths
+    ]
+    assert SlowTranscriber.peak > 1
+    assert all(kwargs["device"] == "cpu" for kwargs in SlowTranscriber.created)
+    assert all(kwargs["compute_type"] == "int8" for kwargs in SlowTranscriber.created)
+
+
+def test_cached_transcripts_skip_the_pool(transcriber, tmp_path):
+    (tmp_path / "20260412_120000.txt").write_text("cached\n", encoding="utf-8")
+
+    results = transcriber.transcribe_many(["/rec/20260412_120000.flac"])
+
+    assert results == [("cached", str(tmp_path / "20260412_120000.txt"))]
+    assert transcriber._executor is None
+
+
+def test_unload_keeps_the_pool_until_idle(monkeypatch, transcriber):
+    monkeypatch.setattr(settings, "transcription_idle_seconds", 0.2)
+    transcriber.transcribe_and_save("/rec/20260412_120001.flac")
+    pool = transcriber._executor
+    transcriber.unload()
+    transcriber.transcribe_and_save("/rec/20260412_120002.flac")
+
+    # The next session reuses the pool, and its job cancelled the idle timer.
+    assert transcriber._executor is pool
+    transcriber.unload()
+    deadline = time.monotonic() + 5
+    while transcriber._executor is not None and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert transcriber._executor is None
+
+
+def test_idle_shutdown_waits_for_running_jobs(monkeypatch, transcriber):
+    monkeypatch.setattr(settings, "transcription_idle_seconds", 0.01)
+    transcriber.transcribe_and_save("/rec/20260412_120001.flac")
+    paths = [f"/rec/20260412_13000{index}.flac" for index in range(6)]
+    results = []
+    worker = threading.Thread(
+        target=lambda: results.extend(transcriber.transcribe_many(paths))
+    )
+    worker.start()
+    for _ in range(5):
+        transcriber.unload()
+        time.sleep(0.02)
+    worker.join(timeout=5)
+
+    assert len(results) == len(paths)
+
+
+@pytest.mark.parametrize(
+    ("cpu_count", "budget_mb", "worker_mb", "configured", "expected"),
+    [
+        (8, 64000, 1500, 0, 4),
+        (8, 3000, 1500, 0, 2),
+        (8, 1000, 1500, 0, 1),
+        (4, 64000, 1500, 16, 4),
+        (16, 64000, 0, 6, 6),
+    ],
+)
+def test_worker_count_respects_cores_and_memory(
+    cpu_count, budget_mb, worker_mb, configured, expected
+):
+    assert resolve_worker_count(cpu_count, budget_mb, worker_mb, configured) == expected
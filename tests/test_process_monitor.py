@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import pytest
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.system import ProcessMonitor
+
+
+def _add_process(
+    root: Path,
+    pid: int,
+    comm: str,
+    *,
+    start: int = 1000,
+    cmdline: str | None = None,
+    exe: str | None = None,
+) -> None:
+    proc = root / str(pid)
+    proc.mkdir(parents=True)
+    (proc / "comm").write_text(comm + "\n", encoding="utf-8")
+    fields = ["S"] + ["0"] * 18 + [str(start)] + ["0"] * 10
+    (proc / "stat").write_text(f"{pid} ({comm}) " + " ".join(fields), encoding="utf-8")
+    (proc / "cmdline").write_bytes((cmdline or comm).encode() + b"\0")
+    if exe is not None:
+        (proc / "exe").symlink_to(exe)
+
+
+@pytest.fixture(autouse=True)
+def _targets(monkeypatch):
+    monkeypatch.setattr(
+        settings, "process_names", {"VRChat", "VRChat.exe", "VRChatClient.exe"}
+    )
+
+
+def test_cached_pid_skips_full_scan(tmp_path, monkeypatch):
+    _add_process(tmp_path, 1, "systemd")
+    _add_process(tmp_path, 4242, "VRChat.exe")
+    monitor = ProcessMonitor(proc_root=tmp_path)
+    assert monitor.is_running() is True
+
+    scans = []
+    monkeypatch.setattr(monitor, "_scan_proc", lambda: scans.append(1))
+    assert ProcessMonitor(proc_root=tmp_path).is_running() is True
+    assert monitor.is_running() is True
+    assert scans == []
+
+
+def test_reused_pid_with_new_start_time_is_a_miss(tmp_path):
+    _add_process(tmp_path, 4242, "VRChat.exe", start=1000)
+    monitor = ProcessMonitor(proc_root=tmp_path)
+    assert monitor.is_running() is True
+
+    for child in (tmp_path / "4242").iterdir():
+        child.unlink()
+    (tmp_path / "4242").rmdir()
+    _add_process(tmp_path, 4242, "bash", start=2000)
+
+    assert monitor.is_running() is False
+
+
+def test_truncated_comm_uses_full_command_name(tmp_path):
+    _add_process(
+        tmp_path,
+        77,
+        "VRChatClient.ex",
+        cmdline="Z:\\games\\VRChat\\VRChatClient.exe",
+    )
+
+    assert ProcessMonitor(proc_root=tmp_path).is_running() is True
+
+
+def test_exe_link_matches_when_no_name_does(tmp_path):
+    _add_process(tmp_path, 1, "systemd")
+    _add_process(tmp_path, 88, "wine64", exe="/opt/games/VRChat.exe")
+
+    assert ProcessMonitor(proc_root=tmp_path).is_running() is True
+
+
+def test_no_match_reports_not_running(tmp_path):
+    _add_process(tmp_path, 1, "systemd")
+    _add_process(tmp_path, 2, "pipewire")
+
+    assert ProcessMonitor(proc_root=tmp_path).is_running() is False
+
+
+def test_adaptive_interval_backs_off_and_resets(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "check_interval", 5)
+    monkeypatch.setattr(settings, "max_check_interval", 30)
+    monkeypatch.setattr(settings, "adaptive_check_interval", True)
+    monitor = ProcessMonitor(proc_root=tmp_path)
+
+    intervals = []
+    for _ in range(4):
+        monitor.is_running()
+        intervals.append(monitor.next_interval())
+    _add_process(tmp_path, 4242, "VRChat.exe")
+    monitor.is_running()
+    intervals.append(monitor.next_interval())
+
+    assert intervals == [10, 20, 30, 30, 5]
+
+    monkeypatch.setattr(settings, "adaptive_check_interval", False)
+    assert monitor.next_interval() == 5
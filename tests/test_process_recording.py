@@ -4,7 +4,10 @@ from pathlib import Path
 from vlog_capture.domain.entities import RecordingSession
 from vlog_capture.infrastructure.daily_state import DailyStateStore
 from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager
-from vlog_capture.use_cases.process_recording import ProcessRecordingUseCase
+from vlog_capture.use_cases.process_recording import (
+    ProcessRecordingUseCase,
+    SegmentTranscriptionWorker,
+)
 
 TRANSCRIPT_PATH = "data/transcripts/20260412_120000.txt"
 
@@ -66,6 +69,15 @@ class StubFileRepository:
     def save_text(self, path: str, content: str) -> None:
         self.saved[path] = content
 
+    def append_text(self, path: str, content: str) -> None:
+        self.saved[path] += content
+
+    def replace(self, source: str, target: str) -> None:
+        self.saved[target] = self.saved.pop(source)
+
+    def delete(self, path: str) -> None:
+        self.saved.pop(path, None)
+
     def archive(self, path: str) -> None:
         self.archived.append(path)
 
@@ -220,3 +232,117 @@ class TestSessionTranscriptSizeGate:
 
         assert any("cleaned_" in k for k in files.saved)
         assert audio in files.archived
+
+
+class CachingTranscriber:
+    def __init__(self, fail: set[str] | None = None):
+        self.cache: dict[str, str] = {}
+        self.transcribed: list[str] = []
+        self._fail = fail or set()
+
+    def transcribe_and_save(self, audio_path: str) -> tuple[str, str]:
+        if audio_path not in self.cache:
+            if audio_path in self._fail:
+                self._fail.discard(audio_path)
+                raise RuntimeError("decoder failed")
+            self.transcribed.append(audio_path)
+            self.cache[audio_path] = f"text of {Path(audio_path).stem}"
+        return self.cache[audio_path], f"data/transcripts/{Path(audio_path).stem}.txt"
+
+    def unload(self) -> None:
+        pass
+
+
+class CapturingPreprocessor:
+    def __init__(self):
+        self.seen: list[str] = []
+
+    def process(self, text: str) -> str:
+        self.seen.append(text)
+        return text
+
+
+class TestSegmentTranscriptionWorker:
+    SEGMENTS = (
+        "data/recordings/20260412_120000.flac",
+        "data/recordings/20260412_121000.flac",
+    )
+
+    def test_closed_segments_are_reused_by_execute_session(self, tmp_path):
+        transcriber = CachingTranscriber()
+        worker = SegmentTranscriptionWorker(transcriber)
+        worker.submit(self.SEGMENTS[0])
+        worker.wait_for(self.SEGMENTS)
+
+        preprocessor = CapturingPreprocessor()
+        uc = ProcessRecordingUseCase(
+            transcriber=transcriber,
+            preprocessor=preprocessor,
+            summarizer=StubSummarizer(),
+            storage=StubStorage(),
+            file_repository=StubFileRepository(),
+            daily_artifacts=DailyArtifactManager(
+                DailyStateStore(tmp_path / "daily_state.json")
+            ),
+        )
+        uc.execute_session(
+            RecordingSession(
+                file_paths=self.SEGMENTS,
+                start_time=datetime(2026, 4, 12, 12, 0, 0),
+            )
+        )
+
+        assert transcriber.transcribed == list(self.SEGMENTS)
+        assert preprocessor.seen == ["text of 20260412_120000 text of 20260412_121000"]
+        assert worker.pending == 0
+
+    def test_failed_segment_is_released_for_session_retry(self):
+        transcriber = CachingTranscriber(fail={self.SEGMENTS[0]})
+        worker = SegmentTranscriptionWorker(transcriber)
+        worker.submit(self.SEGMENTS[0])
+        worker.submit(self.SEGMENTS[1])
+        worker.wait_for(self.SEGMENTS)
+
+        assert transcriber.transcribed == [self.SEGMENTS[1]]
+        assert worker.pending == 0
+
+
+class BatchTranscriber(CachingTranscriber):
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def transcribe_many(self, audio_paths):
+        self.batches.append(list(audio_paths))
+        return [self.transcribe_and_save(path) for path in audio_paths]
+
+
+def test_execute_session_hands_all_segments_to_batch_transcriber(tmp_path):
+    segments = (
+        "data/recordings/20260412_120000.flac",
+        "data/recordings/20260412_121000.flac",
+        "data/recordings/20260412_122000.flac",
+    )
+    transcriber = BatchTranscriber()
+    preprocessor = CapturingPreprocessor()
+    uc = ProcessRecordingUseCase(
+        transcriber=transcriber,
+        preprocessor=preprocessor,
+        summarizer=StubSummarizer(),
+        storage=StubStorage(),
+        file_repository=StubFileRepository(),
+        daily_artifacts=DailyArtifactManager(
+            DailyStateStore(tmp_path / "daily_state.json")
+        ),
+    )
+
+    uc.execute_session(
+        RecordingSession(
+            file_paths=segments, start_time=datetime(2026, 4, 12, 12, 0, 0)
+        )
+    )
+
+    assert transcriber.batches == [list(segments)]
+    assert preprocessor.seen == [
+        "text of 20260412_120000 text of 20260412_121000 text of 20260412_122000"
+    ]
@@ -0,0 +1,125 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from vlog_capture.infrastructure.segment_store import (
+    SegmentWriter,
+    TranscriptSegment,
+    index_path,
+    load_utterances,
+    read_segments,
+    segment_path,
+)
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.system import Transcriber
+from vlog_capture.infrastructure.transcript_cache import TranscriptCache
+
+EPISODE_ID = "1b4e28ba-2fa1-41d2-883f-0016d3cca427"
+
+
+def _segments(count: int, seed: int = 0) -> list[TranscriptSegment]:
+    rng = random.Random(seed)
+    segments, clock = [], 0
+    for index in range(count):
+        start = clock + rng.randint(0, 500)
+        clock = start + rng.randint(200, 4000)
+        text = "" if index % 7 == 3 else f"発話 {index} です"
+        segments.append(TranscriptSegment(start, clock, text, -0.25, 0.02))
+    return segments
+
+
+def _write(path, segments):
+    with SegmentWriter(path) as writer:
+        for segment in segments:
+            writer.append(segment)
+
+
+def test_round_trip_and_range_reads(tmp_path):
+    path = tmp_path / "20260412_120000.segments.jsonl"
+    segments = _segments(200)
+    _write(path, segments)
+
+    assert read_segments(path) == segments
+    rng = random.Random(1)
+    for _ in range(200):
+        start = rng.randint(0, segments[-1].end_ms)
+        end = start + rng.randint(1, 20000)
+        expected = [s for s in segments if s.end_ms > start and s.start_ms < end]
+        assert read_segments(path, start, end) == expected
+    assert read_segments(path, start_ms=segments[-1].end_ms) == []
+    assert read_segments(path, end_ms=segments[0].start_ms + 1) == segments[:1]
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    path = tmp_path / "20260412_120000.segments.jsonl"
+    _write(path, _segments(50, seed=2))
+    stale = index_path(path).read_bytes()
+    segments = _segments(200)
+    _write(path, segments)
+    # As if a crash had left the old index next to the new segment file.
+    index_path(path).write_bytes(stale)
+
+    start, end = segments[120].start_ms, segments[130].end_ms
+    expected = [s for s in segments if s.end_ms > start and s.start_ms < end]
+    assert read_segments(path, start, end) == expected
+    assert len(index_path(path).read_bytes()) == 200 * 16
+
+
+def test_interrupted_writer_leaves_no_store(tmp_path):
+    path = tmp_path / "20260412_120000.segments.jsonl"
+    with pytest.raises(RuntimeError):
+        with SegmentWriter(path) as writer:
+            writer.append(_segments(1)[0])
+            raise RuntimeError("decode failed")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_utterances_offsets_and_stable_ids(tmp_path):
+    path = tmp_path / "20260412_120000.segments.jsonl"
+    segments = _segments(20)
+    _write(path, segments)
+    recorded_at = datetime(2026, 4, 12, 12, tzinfo=timezone(timedelta(hours=9)))
+
+    utterances = load_utterances(path, EPISODE_ID, recorded_at)
+
+    spoken = [s for s in segments if s.text]
+    assert [u.text for u in utterances] == [s.text for s in spoken]
+    assert utterances[0].started_at == recorded_at + timedelta(
+        milliseconds=spoken[0].start_ms
+    )
+    assert utterances[-1].ended_at == recorded_at + timedelta(
+        milliseconds=spoken[-1].end_ms
+    )
+    again = load_utterances(path, EPISODE_ID, recorded_at)
+    assert [u.id for u in again] == [u.id for u in utterances]
+
+
+class FakeWhisperTranscriber(Transcriber):
+    def __init__(self, cache: TranscriptCache) -> None:
+        super().__init__(cache=cache)
+        self.calls = 0
+
+    def iter_segments(self, audio_path: str):
+        self.calls += 1
+        yield from _segments(5)
+
+
+def test_transcriber_writes_segments_next_to_transcript(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "transcript_dir", tmp_path / "transcripts")
+    audio = tmp_path / "20260412_120000.flac"
+    audio.write_bytes(b"audio")
+    transcriber = FakeWhisperTranscriber(TranscriptCache(tmp_path / "index.json"))
+
+    text, transcript = transcriber.transcribe_and_save(str(audio))
+
+    assert text == " ".join(s.text for s in _segments(5)).strip()
+    store = segment_path(tmp_path / "transcripts" / "20260412_120000.txt")
+    assert read_segments(store) == _segments(5)
+    assert index_path(store).exists()
+
+    renamed = audio.rename(audio.with_name("20260412_120500.flac"))
+    transcriber.transcribe_and_save(str(renamed))
+    moved = segment_path(tmp_path / "transcripts" / "20260412_120500.txt")
+    assert transcriber.calls == 1
+    assert read_segments(moved, 0, 10**9) == _segments(5)
@@ -0,0 +1,72 @@
+import threading
+from datetime import datetime
+
+from vlog_capture.domain.entities import RecordingSession
+from vlog_capture.infrastructure.session_queue import MAX_ATTEMPTS, SessionQueue
+
+
+def _session(*paths: str) -> RecordingSession:
+    return RecordingSession(
+        file_paths=paths,
+        start_time=datetime(2026, 4, 12, 12, 0, 0),
+        end_time=datetime(2026, 4, 12, 13, 0, 0),
+    )
+
+
+def test_sessions_are_claimed_in_order(tmp_path):
+    queue = SessionQueue(tmp_path / "queue.json")
+    queue.put(_session("a.flac"), "s1")
+    queue.put(_session("b.flac", "c.flac"), "s2")
+
+    first = queue.claim(timeout=0)
+    second = queue.claim(timeout=0)
+
+    assert first.session_id == "s1"
+    assert second.session == _session("b.flac", "c.flac")
+    assert queue.claim(timeout=0) is None
+    assert (queue.depth, queue.in_progress) == (2, 2)
+
+    queue.done(first)
+    assert (queue.depth, queue.in_progress) == (1, 1)
+
+
+def test_pending_and_in_flight_sessions_survive_restart(tmp_path):
+    path = tmp_path / "queue.json"
+    queue = SessionQueue(path)
+    queue.put(_session("a.flac"), "s1")
+    queue.put(_session("b.flac"), "s2")
+    queue.done(queue.claim(timeout=0))
+    queue.claim(timeout=0)
+
+    restarted = SessionQueue(path)
+
+    item = restarted.claim(timeout=0)
+    assert item.session_id == "s2"
+    assert item.attempts == 2
+    assert restarted.oldest_age_seconds() is not None
+
+
+def test_session_that_keeps_crashing_is_dropped(tmp_path):
+    path = tmp_path / "queue.json"
+    SessionQueue(path).put(_session("poison.flac"), "s1")
+    for _ in range(MAX_ATTEMPTS):
+        SessionQueue(path).claim(timeout=0)
+
+    assert SessionQueue(path).depth == 0
+
+
+def test_claim_blocks_until_a_session_is_queued(tmp_path):
+    queue = SessionQueue(tmp_path / "queue.json")
+    claimed = []
+    worker = threading.Thread(target=lambda: claimed.append(queue.claim(timeout=5)))
+    worker.start()
+
+    queue.put(_session("a.flac"), "s1")
+    worker.join(timeout=5)
+
+    assert claimed[0].session_id == "s1"
+    assert queue.oldest_age_seconds() is not None
+
+
+def test_empty_queue_reports_no_age(tmp_path):
+    assert SessionQueue(tmp_path / "queue.json").oldest_age_seconds() is None
@@ -0,0 +1,241 @@
+import random
+from datetime import datetime
+
+import pytest
+from vlog_capture.domain.entities import RecordingSession
+from vlog_capture.infrastructure.daily_state import DailyStateStore
+from vlog_capture.infrastructure.repositories import FileRepository
+from vlog_capture.infrastructure.segment_store import TranscriptSegment
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.system import (
+    Transcriber,
+    TranscriptPreprocessor,
+    _read_stripped,
+)
+from vlog_capture.infrastructure.transcript_cache import TranscriptCache
+from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager
+from vlog_capture.use_cases.process_recording import ProcessRecordingUseCase
+
+from tests.test_process_recording import (
+    StubFileRepository,
+    StubStorage,
+    StubSummarizer,
+)
+
+ALPHABET = ["あ", "え", "う", "ん", "は", "い", "、", "。", " ", "\n", ".", "…", "x"]
+WORDS = ["えー", "あのー", "まあ", "うん", "はい", "今日は", "楽しかった", "VRChat"]
+
+
+def _random_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 40)):
+        if rng.random() < 0.5:
+            parts.append(rng.choice(WORDS))
+        else:
+            parts.append("".join(rng.choices(ALPHABET, k=rng.randint(1, 6))))
+        if rng.random() < 0.2:
+            parts[-1] *= rng.randint(2, 8)
+    return "".join(parts)
+
+
+def _split(text: str, rng: random.Random) -> list[str]:
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text), rng.randint(0, 6))))
+    return [text[a:b] for a, b in zip([0, *cuts], [*cuts, len(text)])]
+
+
+def _stream(preprocessor: TranscriptPreprocessor, pieces: list[str]) -> str:
+    stream = preprocessor.stream()
+    return "".join(stream.feed(piece) for piece in pieces) + stream.finish()
+
+
+@pytest.mark.parametrize("max_period", [4, 16])
+def test_stream_matches_batch_for_any_split(monkeypatch, max_period):
+    monkeypatch.setattr(settings, "repetition_max_period", max_period)
+    preprocessor = TranscriptPreprocessor()
+    rng = random.Random(max_period)
+    for _ in range(3000):
+        text = _random_text(rng)
+        assert _stream(preprocessor, _split(text, rng)) == preprocessor.process(text)
+
+
+def test_stream_is_reusable_after_finish():
+    preprocessor = TranscriptPreprocessor()
+    stream = preprocessor.stream()
+    first = stream.feed("、えー 今日は") + stream.finish()
+    second = stream.feed("、えー 今日は") + stream.finish()
+    assert first == second == preprocessor.process("、えー 今日は")
+
+
+def test_stream_carry_stays_bounded():
+    preprocessor = TranscriptPreprocessor()
+    stream = preprocessor.stream()
+    rng = random.Random(1)
+    sentence = "今日は VRChat で ワールド を 巡った 。 "
+    peak = 0
+    for _ in range(5000):
+        stream.feed(sentence + rng.choice(WORDS) + " ")
+        peak = max(peak, len(stream._buffer) + len(stream._raw))
+    stream.finish()
+    # Context and lookahead of five periods each, plus the piece being fed.
+    assert peak < 10 * settings.repetition_max_period + 2 * len(sentence)
+
+
+def test_read_stripped_matches_read_text(tmp_path):
+    path = tmp_path / "transcript.txt"
+    rng = random.Random(2)
+    for _ in range(300):
+        text = "".join(rng.choices([" ", "\n", "あ", "い"], k=rng.randint(0, 20)))
+        path.write_text(text, encoding="utf-8")
+        assert "".join(_read_stripped(path, chunk_size=3)) == text.strip()
+
+
+class SegmentTranscriber(Transcriber):
+    def __init__(self, cache: TranscriptCache, segments: list[str]) -> None:
+        super().__init__(cache=cache)
+        self.segments = segments
+        self.calls = 0
+
+    def iter_segments(self, audio_path: str):
+        self.calls += 1
+        for index, text in enumerate(self.segments):
+            yield TranscriptSegment(index * 1000, index * 1000 + 900, text, -0.3, 0.1)
+
+
+def test_iter_transcript_writes_and_reuses_transcript(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "transcript_dir", tmp_path / "transcripts")
+    audio = tmp_path / "20260412_120000.flac"
+    audio.write_bytes(b"audio")
+    segments = ["", "今日は", "", "楽しかった", ""]
+    transcriber = SegmentTranscriber(TranscriptCache(tmp_path / "index.json"), segments)
+
+    streamed = "".join(transcriber.iter_transcript(str(audio)))
+    assert streamed == " ".join(segments).strip()
+    transcript = tmp_path / "transcripts" / "20260412_120000.txt"
+    assert transcript.read_text(encoding="utf-8") == streamed + "\n"
+    assert not transcript.with_name(transcript.name + ".part").exists()
+
+    assert "".join(transcriber.iter_transcript(str(audio))) == streamed
+    assert transcriber.cached(str(audio)) == (streamed, str(transcript))
+    assert transcriber.calls == 1
+
+
+class StreamingStubTranscriber:
+    def __init__(self, transcripts: dict[str, str]) -> None:
+        self._transcripts = transcripts
+        self.unloaded = False
+
+    def transcript_path(self, audio_path: str) -> str:
+        return f"data/transcripts/{audio_path.rsplit('/', 1)[-1][:-5]}.txt"
+
+    def iter_transcript(self, audio_path: str):
+        text = self._transcripts[audio_path]
+        for start in range(0, len(text), 7):
+            yield text[start : start + 7]
+
+    def transcribe_and_save(self, audio_path: str) -> tuple[str, str]:
+        raise AssertionError("streaming path expected")
+
+    def unload(self) -> None:
+        self.unloaded = True
+
+
+def _session_usecase(transcripts, tmp_path):
+    files = StubFileRepository()
+    summarizer = StubSummarizer()
+    usecase = ProcessRecordingUseCase(
+        transcriber=StreamingStubTranscriber(transcripts),
+        preprocessor=TranscriptPreprocessor(),
+        summarizer=summarizer,
+        storage=StubStorage(),
+        file_repository=files,
+        daily_artifacts=DailyArtifactManager(
+            DailyStateStore(tmp_path / "daily_state.json")
+        ),
+    )
+    session = RecordingSession(
+        file_paths=tuple(transcripts),
+        start_time=datetime(2026, 4, 12, 12),
+        end_time=datetime(2026, 4, 12, 13),
+    )
+    return usecase, session, files
+
+
+def test_execute_session_streams_cleaned_transcript(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "min_transcript_size_bytes", 20)
+    monkeypatch.setattr(settings, "summary_dir", tmp_path / "summaries")
+    monkeypatch.setattr(settings, "transcript_dir", tmp_path / "transcripts")
+    settings.transcript_dir.mkdir()
+    transcripts = {
+        "data/recordings/20260412_120000.flac": "えー 今日は VRChat で 遊んだ。" * 5,
+        "data/recordings/20260412_123000.flac": "あのー 楽しかった 楽しかった。" * 5,
+    }
+    usecase, session, files = _session_usecase(transcripts, tmp_path)
+    usecase._transcriber.transcript_path = lambda audio_path: str(
+        settings.transcript_dir / "20260412_120000.txt"
+    )
+    usecase._files = FileRepository()
+    usecase._files.archive = files.archive
+    summarized = []
+    usecase._summarizer.summarize = lambda transcript, *args, **kwargs: (
+        summarized.append(transcript) or "summary"
+    )
+
+    assert usecase.execute_session(session) is True
+
+    expected = TranscriptPreprocessor().process(" ".join(transcripts.values()))
+    cleaned = settings.transcript_dir / "cleaned_20260412_120000.txt"
+    assert cleaned.read_text(encoding="utf-8") == expected
+    # The summary reads the cleaned file rather than a copy kept in memory.
+    assert summarized == [expected]
+    assert files.archived == list(transcripts)
+
+
+def test_execute_session_streaming_skips_short_transcript(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "min_transcript_size_bytes", 200)
+    transcripts = {"data/recordings/20260412_120000.flac": "えー うん 今日は"}
+    usecase, session, files = _session_usecase(transcripts, tmp_path)
+
+    assert usecase.execute_session(session) is False
+    assert files.saved == {}
+    assert files.archived == list(transcripts)
+
+
+class FailingStreamingTranscriber(StreamingStubTranscriber):
+    def iter_transcript(self, audio_path: str):
+        yield from super().iter_transcript(audio_path)
+        if audio_path.endswith("123000.flac"):
+            raise RuntimeError("decoder crashed")
+
+
+def test_failed_stream_leaves_no_cleaned_transcript(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "min_transcript_size_bytes", 20)
+    transcripts_dir = tmp_path / "transcripts"
+    transcripts_dir.mkdir()
+    transcripts = {
+        "data/recordings/20260412_120000.flac": "えー 今日は VRChat で 遊んだ。" * 5,
+        "data/recordings/20260412_123000.flac": "あのー 楽しかった 楽しかった。" * 5,
+    }
+    transcriber = FailingStreamingTranscriber(transcripts)
+    transcriber.transcript_path = lambda audio_path: str(
+        transcripts_dir / "20260412_120000.txt"
+    )
+    usecase = ProcessRecordingUseCase(
+        transcriber=transcriber,
+        preprocessor=TranscriptPreprocessor(),
+        summarizer=StubSummarizer(),
+        storage=StubStorage(),
+        file_repository=FileRepository(),
+        daily_artifacts=DailyArtifactManager(
+            DailyStateStore(tmp_path / "daily_state.json")
+        ),
+    )
+    session = RecordingSession(
+        file_paths=tuple(transcripts),
+        start_time=datetime(2026, 4, 12, 12),
+        end_time=datetime(2026, 4, 12, 13),
+    )
+
+    with pytest.raises(RuntimeError, match="decoder crashed"):
+        usecase.execute_session(session)
+
+    assert list(transcripts_dir.iterdir()) == []
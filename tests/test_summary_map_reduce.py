@@ -0,0 +1,138 @@
+import os
+import time
+
+import pytest
+from vlog_capture.infrastructure.daily_state import DailyStateStore
+from vlog_capture.infrastructure.repositories import FileRepository
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.summary_cache import (
+    SummaryChunkCache,
+    iter_file_for_context,
+    split_for_context,
+)
+from vlog_capture.use_cases.daily_artifacts import DailyArtifactManager
+
+
+class ChunkingSummarizer:
+    chunk_signature = "stub-model:v1"
+
+    def __init__(self) -> None:
+        self.chunk_calls: list[str] = []
+        self.daily_calls: list[str] = []
+
+    def summarize_chunk(self, transcript: str) -> str:
+        self.chunk_calls.append(transcript)
+        return f"notes({transcript[:12]})"
+
+    def summarize(
+        self,
+        transcript: str,
+        session=None,
+        date_str=None,
+        start_time_str=None,
+        end_time_str=None,
+    ) -> str:
+        self.daily_calls.append(transcript)
+        return f"summary-{len(self.daily_calls)}"
+
+
+def _manager(monkeypatch, tmp_path):
+    for name, attr in (("transcripts", "transcript_dir"), ("summaries", "summary_dir")):
+        directory = tmp_path / name
+        directory.mkdir()
+        monkeypatch.setattr(settings, attr, directory)
+    monkeypatch.setattr(settings, "summary_map_reduce", True)
+    monkeypatch.setattr(settings, "summary_chunk_chars", 200)
+    return DailyArtifactManager(
+        DailyStateStore(tmp_path / "daily_state.json"),
+        SummaryChunkCache(tmp_path / "chunks"),
+    )
+
+
+def test_day_that_fits_one_prompt_is_summarized_directly(monkeypatch, tmp_path):
+    manager = _manager(monkeypatch, tmp_path)
+    summarizer = ChunkingSummarizer()
+    source = settings.transcript_dir / "cleaned_20260620_213000.txt"
+    source.write_text("first session talk", encoding="utf-8")
+
+    manager.refresh_summary(
+        "20260620", summarizer, FileRepository(), source_paths=(source,)
+    )
+
+    assert summarizer.chunk_calls == []
+    assert summarizer.daily_calls == ["first session talk"]
+
+
+def test_new_session_only_summarizes_the_new_transcript(monkeypatch, tmp_path):
+    manager = _manager(monkeypatch, tmp_path)
+    summarizer = ChunkingSummarizer()
+    talks = {clock: f"{clock} session talk " * 7 for clock in ("213000", "230500")}
+    sources = []
+    for clock, talk in talks.items():
+        source = settings.transcript_dir / f"cleaned_20260620_{clock}.txt"
+        source.write_text(talk, encoding="utf-8")
+        sources.append(source)
+    manager.refresh_summary(
+        "20260620", summarizer, FileRepository(), source_paths=tuple(sources)
+    )
+    third = settings.transcript_dir / "cleaned_20260620_235000.txt"
+    third.write_text("third session talk", encoding="utf-8")
+    manager.refresh_summary(
+        "20260620", summarizer, FileRepository(), source_paths=(*sources, third)
+    )
+
+    assert summarizer.chunk_calls == [*talks.values(), "third session talk"]
+    assert len(summarizer.daily_calls) == 2
+    assert "【21:30】" in summarizer.daily_calls[-1]
+    assert "【23:50】" in summarizer.daily_calls[-1]
+
+
+def test_chunk_cache_prunes_stale_then_least_recently_used(tmp_path):
+    cache = SummaryChunkCache(tmp_path, max_bytes=100, max_age_days=1)
+    now = time.time()
+    for name, age in (("stale", 2 * 86400), ("old", 60), ("new", 0)):
+        cache.put(name, "sig", "x" * 6)
+        os.utime(cache._path(name, "sig"), (now - age, now - age))
+    cache.max_bytes = 10
+
+    assert cache.prune() == 2
+    assert cache.get("stale", "sig") is None
+    assert cache.get("old", "sig") is None
+    assert cache.get("new", "sig") == "x" * 6
+
+
+def test_long_session_is_mapped_in_pieces_under_the_limit(monkeypatch, tmp_path):
+    manager = _manager(monkeypatch, tmp_path)
+    summarizer = ChunkingSummarizer()
+    source = settings.transcript_dir / "cleaned_20260620_120000.txt"
+    source.write_text("\n".join(f"line {i} " * 4 for i in range(60)), encoding="utf-8")
+
+    manager.refresh_summary(
+        "20260620", summarizer, FileRepository(), source_paths=(source,)
+    )
+
+    assert len(summarizer.chunk_calls) > 1
+    assert all(len(piece) <= 200 for piece in summarizer.chunk_calls)
+    assert len(summarizer.daily_calls[-1]) <= 200 + len("【12:00】\n")
+
+
+def test_split_for_context_is_lossless_and_prefers_line_breaks():
+    text = "".join(f"発言{i}です。\n" for i in range(100))
+
+    pieces = split_for_context(text, 100)
+
+    assert "".join(pieces) == text
+    assert pieces == split_for_context(text, 100)
+    assert all(len(piece) <= 100 for piece in pieces)
+    assert all(piece.endswith("\n") for piece in pieces[:-1])
+
+
+@pytest.mark.parametrize("limit", [1, 7, 100, 10_000])
+def test_file_pieces_match_split_for_context(tmp_path, limit):
+    text = "".join(
+        f"発言{i}です。" + (" " * (i % 3)) + "\n" * (i % 5 == 0) for i in range(300)
+    )
+    path = tmp_path / "cleaned_20260620_120000.txt"
+    path.write_text(text, encoding="utf-8")
+
+    assert list(iter_file_for_context(path, limit)) == split_for_context(text, limit)
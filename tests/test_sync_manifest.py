@@ -0,0 +1,153 @@
+import pytest
+from vlog_capture.infrastructure import sync_manifest
+from vlog_capture.infrastructure.repositories import SupabaseRepository
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.strict_sync import StrictSupabaseSync
+from vlog_capture.infrastructure.sync_manifest import SyncManifest
+
+
+class Response:
+    def __init__(self, data):
+        self.data = data
+
+
+class Query:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.data = []
+
+    def upsert(self, rows, on_conflict):
+        self.client.calls.append(("upsert", self.table, [r["date"] for r in rows]))
+        self.data = rows
+        return self
+
+    def update(self, values):
+        self.values = values
+        return self
+
+    def in_(self, column, keys):
+        self.client.calls.append(("hide", self.table, list(keys)))
+        return self
+
+    def eq(self, column, value):
+        self.client.calls.append(("eq", self.table, value))
+        return self
+
+    def execute(self):
+        return Response(self.data)
+
+
+class Client:
+    def __init__(self):
+        self.calls = []
+
+    def table(self, name):
+        return Query(self, name)
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    summaries = tmp_path / "summaries"
+    novels = tmp_path / "novels"
+    for directory in (summaries, novels):
+        directory.mkdir()
+    monkeypatch.setattr(settings, "summary_dir", summaries)
+    monkeypatch.setattr(settings, "novel_out_dir", novels)
+    monkeypatch.setattr(settings, "photo_dir", tmp_path / "photos")
+    blocked: set[str] = set()
+    monkeypatch.setattr(sync_manifest, "summary_sources", lambda date_str: ())
+    monkeypatch.setattr(
+        sync_manifest,
+        "is_publishable_summary",
+        lambda date_str, sources=None: date_str not in blocked,
+    )
+    for day in ("20250101", "20250102", "20250103"):
+        (summaries / f"{day}_summary.txt").write_text(f"summary {day}", "utf-8")
+        (novels / f"{day}.md").write_text(f"novel {day}", "utf-8")
+    return tmp_path, blocked
+
+
+def _strict(tmp_path, client, target="https://a.supabase.co"):
+    manifest = SyncManifest(tmp_path / "sync.json", target=target)
+    sync = StrictSupabaseSync(client=client, manifest=manifest)
+    sync._write_report = lambda report: None
+    return sync
+
+
+def test_strict_sync_pushes_only_changed_rows(archive) -> None:
+    tmp_path, _ = archive
+    client = Client()
+    first = _strict(tmp_path, client).sync()
+    assert (first.summaries, first.novels, first.unchanged) == (3, 3, 0)
+
+    client.calls.clear()
+    second = _strict(tmp_path, client).sync()
+    assert second.total == 0 and second.unchanged == 6
+    assert second.to_dict()["verified"] is True
+    assert client.calls == []
+
+    (tmp_path / "novels" / "20250102.md").write_text("revised", "utf-8")
+    third = _strict(tmp_path, client).sync()
+    assert (third.summaries, third.novels, third.unchanged) == (0, 1, 5)
+    assert client.calls == [("upsert", "novels", ["2025-01-02"])]
+
+
+def test_touched_file_with_same_content_is_not_pushed(archive) -> None:
+    tmp_path, _ = archive
+    client = Client()
+    _strict(tmp_path, client).sync()
+    client.calls.clear()
+    path = tmp_path / "summaries" / "20250101_summary.txt"
+    path.write_text(path.read_text("utf-8"), "utf-8")
+
+    report = _strict(tmp_path, client).sync()
+    assert report.unchanged == 6
+    assert client.calls == []
+
+
+def test_blocked_rows_are_hidden_in_one_update(archive) -> None:
+    tmp_path, blocked = archive
+    client = Client()
+    _strict(tmp_path, client).sync()
+    client.calls.clear()
+    blocked.update({"20250101", "20250103"})
+    (tmp_path / "summaries" / "20250101_summary.txt").write_text("x", "utf-8")
+    (tmp_path / "summaries" / "20250103_summary.txt").write_text("y", "utf-8")
+
+    report = _strict(tmp_path, client).sync()
+    [(kind, table, keys)] = client.calls
+    assert (kind, table) == ("hide", "daily_entries")
+    assert sorted(keys) == [
+        (tmp_path / "summaries" / f"{day}_summary.txt").as_posix()
+        for day in ("20250101", "20250103")
+    ]
+    assert report.summaries == 0
+
+    client.calls.clear()
+    assert _strict(tmp_path, client).sync().unchanged == 6
+    assert client.calls == []
+
+
+def test_other_supabase_project_gets_full_sync(archive) -> None:
+    tmp_path, _ = archive
+    _strict(tmp_path, Client()).sync()
+    report = _strict(tmp_path, Client(), target="https://b.supabase.co").sync()
+    assert (report.summaries, report.novels, report.unchanged) == (3, 3, 0)
+
+
+def test_repository_sync_skips_unchanged_rows(archive, monkeypatch) -> None:
+    tmp_path, _ = archive
+    monkeypatch.setattr(settings, "sync_manifest_file", tmp_path / "sync.json")
+    repository = SupabaseRepository()
+    repository.client = Client()
+    repository.sync()
+    assert [call[:2] for call in repository.client.calls] == [
+        ("upsert", "daily_entries"),
+        ("upsert", "novels"),
+    ]
+
+    repository.client.calls.clear()
+    (tmp_path / "summaries" / "20250103_summary.txt").write_text("new", "utf-8")
+    repository.sync()
+    assert repository.client.calls == [("upsert", "daily_entries", ["2025-01-03"])]
@@ -0,0 +1,61 @@
+import random
+import re
+import time
+
+import pytest
+from vlog_capture.infrastructure import text_repetition
+from vlog_capture.infrastructure.text_repetition import (
+    collapse_repetitions,
+    dedupe_adjacent_words,
+)
+
+_ALPHABET = ["a", "b", "あ", "い", " ", "\n", "。", "_", "1", "ab", "ありがとう"]
+
+
+def _random_texts(seed: int, count: int, alphabet=_ALPHABET, max_parts: int = 40):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_parts)))
+
+
+@pytest.mark.parametrize("max_period", [1, 2, 4, 7])
+def test_collapse_matches_backtracking_regex(max_period):
+    pattern = re.compile(rf"(.{{1,{max_period}}}?)\1{{4,}}")
+    for text in _random_texts(max_period, 3000):
+        expected = pattern.sub(r"\1", text)
+        result = collapse_repetitions(text, max_period)
+        assert result.text == expected, text
+        assert result.removed_chars == len(text) - len(expected)
+
+
+def test_long_hallucination_loop_collapses_with_wider_period():
+    phrase = "ありがとうございます"
+    text = "今日は" + phrase * 300 + "。"
+
+    assert collapse_repetitions(text, 4).removed_chars == 0
+    result = collapse_repetitions(text, 16)
+    assert result.text == "今日は" + phrase + "。"
+    assert result.removed_chars == len(phrase) * 299
+
+
+def test_dedupe_matches_backtracking_regex():
+    pattern = re.compile(r"(\S+)\s+\1\b")
+    for text in _random_texts(11, 5000):
+        assert dedupe_adjacent_words(text) == pattern.sub(r"\1", text), text
+
+
+def test_dedupe_border_search_fallback_matches_regex(monkeypatch):
+    monkeypatch.setattr(text_repetition, "_DIRECT_PROBES", 0)
+    pattern = re.compile(r"(\S+)\s+\1\b")
+    alphabet = ["a", "b", "a", "a", " ", "。", "_", "ab", "aab"]
+    for text in _random_texts(12, 5000, alphabet, 60):
+        assert dedupe_adjacent_words(text) == pattern.sub(r"\1", text), text
+
+
+def test_worst_case_inputs_stay_fast():
+    size = 200_000
+    started = time.perf_counter()
+    dedupe_adjacent_words("a" * size + " " + "a" * size + "b")
+    collapse_repetitions(("abcd" * 3 + "x") * (size // 13), 16)
+    # The backtracking regexes need minutes for the first input alone.
+    assert time.perf_counter() - started < 5
@@ -0,0 +1,194 @@
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+from vlog_capture.infrastructure import system
+from vlog_capture.infrastructure.model_registry import ModelRegistry
+from vlog_capture.infrastructure.segment_store import TranscriptSegment
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.system import Transcriber, whisper_signature
+from vlog_capture.infrastructure.transcript_cache import (
+    UNRECORDED_SIGNATURE,
+    TranscriptCache,
+)
+
+MIB = 1024 * 1024
+
+
+class CountingTranscriber(Transcriber):
+    def __init__(self, cache: TranscriptCache) -> None:
+        super().__init__(cache=cache)
+        self.calls: list[str] = []
+
+    def iter_segments(self, audio_path: str):
+        self.calls.append(audio_path)
+        yield TranscriptSegment(0, 1000, f"text {len(self.calls)}", -0.2, 0.01)
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "transcript_dir", tmp_path / "transcripts")
+    monkeypatch.setattr(settings, "whisper_model_size", "large-v3-turbo")
+    monkeypatch.setattr(settings, "whisper_compute_type", "float16")
+    return TranscriptCache(tmp_path / "transcript_index.json")
+
+
+def _audio(tmp_path, name: str, payload: bytes = b"flac-bytes"):
+    path = tmp_path / "recordings" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    return path
+
+
+def test_renamed_and_archived_recordings_reuse_the_transcript(cache, tmp_path):
+    transcriber = CountingTranscriber(cache)
+    audio = _audio(tmp_path, "20260412_120000.flac")
+    text, _ = transcriber.transcribe_and_save(str(audio))
+
+    renamed = audio.rename(audio.with_name("20260412_120500.flac"))
+    archived_dir = tmp_path / "archive"
+    archived_dir.mkdir()
+    archived = renamed.rename(archived_dir / renamed.name)
+    again, path = transcriber.transcribe_and_save(str(archived))
+
+    assert transcriber.calls == [str(audio)]
+    assert again == text
+    assert path.endswith("20260412_120500.txt")
+
+
+def test_model_change_invalidates_and_reports_stale(cache, tmp_path, monkeypatch):
+    audio = _audio(tmp_path, "20260412_120000.flac")
+    CountingTranscriber(cache).transcribe_and_save(str(audio))
+
+    monkeypatch.setattr(settings, "whisper_model_size", "large-v4")
+    upgraded = CountingTranscriber(cache)
+    assert [entry.audio for entry in cache.stale(upgraded.signature)] == [str(audio)]
+
+    text, _ = upgraded.transcribe_and_save(str(audio))
+
+    assert upgraded.calls == [str(audio)]
+    assert text == "text 1"
+    assert cache.stale(upgraded.signature) == []
+
+
+def test_transcripts_from_before_the_index_are_adopted(cache, tmp_path):
+    audio = _audio(tmp_path, "20260412_120000.flac")
+    transcript = settings.transcript_dir / "20260412_120000.txt"
+    transcript.parent.mkdir(parents=True)
+    transcript.write_text("old text\n", encoding="utf-8")
+    transcriber = CountingTranscriber(cache)
+
+    text, _ = transcriber.transcribe_and_save(str(audio))
+
+    assert (text, transcriber.calls) == ("old text", [])
+    stale = cache.stale(transcriber.signature)
+    assert [entry.signature for entry in stale] == [UNRECORDED_SIGNATURE]
+
+
+def test_same_stem_with_new_audio_is_not_confused(cache, tmp_path):
+    transcriber = CountingTranscriber(cache)
+    first = _audio(tmp_path, "20260412_120000.flac", b"first")
+    transcriber.transcribe_and_save(str(first))
+    first.unlink()
+    second = _audio(tmp_path, "20260412_120000.flac", b"second take")
+
+    transcriber.transcribe_and_save(str(second))
+
+    assert transcriber.calls == [str(first), str(second)]
+
+
+def _record_many(args) -> None:
+    index_path, worker = args
+    cache = TranscriptCache(index_path)
+    for item in range(20):
+        cache.record(f"{worker}-{item}", Path(f"{worker}-{item}.txt"), "sig", "a")
+
+
+def test_concurrent_processes_keep_every_entry(tmp_path):
+    index_path = tmp_path / "transcript_index.sqlite3"
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(4, mp_context=context) as pool:
+        list(pool.map(_record_many, [(index_path, worker) for worker in range(4)]))
+
+    assert len(TranscriptCache(index_path).stale("other")) == 80
+
+
+def test_json_index_is_imported_once(tmp_path):
+    (tmp_path / "transcript_index.json").write_text(
+        json.dumps(
+            {
+                "entries": {
+                    "abc": {
+                        "transcript": "t.txt",
+                        "signature": "old",
+                        "audio": "a.flac",
+                    }
+                },
+                "files": {"1:2:3:4": "abc"},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    cache = TranscriptCache(tmp_path / "transcript_index.json")
+
+    assert cache.entry("abc").signature == "old"
+    assert cache.is_indexed(Path("t.txt"))
+    assert (tmp_path / "transcript_index.sqlite3").exists()
+
+
+def test_cpu_reader_accepts_the_configured_signature(cache, tmp_path):
+    audio = _audio(tmp_path, "20260412_120000.flac")
+    CountingTranscriber(cache).transcribe_and_save(str(audio))
+
+    int8_only = Transcriber(device="cpu", compute_type="int8", cache=cache)
+    reader = Transcriber(
+        device="cpu",
+        compute_type="int8",
+        cache=cache,
+        also_current=(whisper_signature(),),
+    )
+
+    assert int8_only.cached(str(audio)) is None
+    assert reader.cached(str(audio)) == (
+        "text 1",
+        str(reader.transcript_path(str(audio))),
+    )
+
+
+def test_cuda_load_failure_records_the_cpu_fallback(cache, tmp_path, monkeypatch):
+    registry = ModelRegistry({"cpu": None, "cuda": None})
+    monkeypatch.setattr(system, "model_registry", registry)
+    monkeypatch.setattr(system, "_cuda_device_count", lambda: 1)
+    monkeypatch.setattr(system, "_cuda_load_failures", set())
+    monkeypatch.setattr(settings, "whisper_device", "cuda")
+    loaded: list[tuple[str, str]] = []
+
+    def load_model(self):
+        setup = self._setup()
+        if setup[0] == "cuda":
+            raise RuntimeError("libcudnn_ops.so not found")
+        loaded.append(setup)
+        return object()
+
+    class LoadingTranscriber(CountingTranscriber):
+        def iter_segments(self, audio_path: str):
+            self.model
+            yield from super().iter_segments(audio_path)
+
+    monkeypatch.setattr(system.Transcriber, "_load_model", load_model)
+    audio = _audio(tmp_path, "20260412_120000.flac")
+    transcriber = LoadingTranscriber(cache)
+    transcriber.transcribe_and_save(str(audio))
+
+    assert loaded == [("cpu", "int8")]
+    assert registry.resident_bytes("cuda") == 0
+    assert registry.resident_bytes("cpu") == settings.whisper_worker_memory_mb * MIB
+    assert transcriber.signature == whisper_signature("int8")
+    # The int8 transcript is stale for a machine that decodes at float16 ...
+    assert [entry.audio for entry in cache.stale(whisper_signature())] == [str(audio)]
+    # ... but this process keeps reusing it instead of decoding again.
+    transcriber.transcribe_and_save(str(audio))
+    assert transcriber.calls == [str(audio)]
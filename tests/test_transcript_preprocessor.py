@@ -0,0 +1,87 @@
+import random
+import re
+
+import pytest
+from vlog_capture.infrastructure.system import TranscriptPreprocessor
+
+
+def _reference_remove_fillers(txt: str) -> str:
+    """The iterative implementation the compiled engine replaced."""
+    fillers = sorted(TranscriptPreprocessor.FILLERS, key=len, reverse=True)
+    pattern = f"(^|[\\s、。?!])({'|'.join(fillers)})(?=[\\s、。?!]|$)"
+
+    def repl(match: re.Match[str]) -> str:
+        leading = match.group(1)
+        return (leading if leading != "^" else "") + " "
+
+    for _ in range(20):
+        previous = txt
+        txt = re.sub(pattern, repl, txt)
+        if txt == previous:
+            break
+    txt = re.sub(r"\s+", " ", txt).strip()
+    txt = re.sub(r"([、。])\1+", r"\1", txt)
+    txt = re.sub(r"^[、。]+", "", txt).strip()
+    txt = re.sub(r"\s+[、。]+", "", txt)
+    return re.sub(r"\s+", " ", txt).strip()
+
+
+GOLDEN = [
+    "えー、今日はVRChatでワールド巡りをした。",
+    "あのー えっと まあ そうですね、楽しかった",
+    "うんうんうん、はいはいはいはい。そっかぁ!",
+    "あ、あ、あ、え。お?ん",
+    "えーと あの人 なんかすごい",
+    "  、、。。あ  え\nうん\tそうか  ",
+    "ふんふんふんふん ははは はは は",
+    "まあまあ まあ、まあ。",
+    "",
+    "。",
+]
+
+_WORDS = TranscriptPreprocessor.FILLERS + [
+    "今日",
+    "VRChat",
+    "ワールド",
+    "あのー人",
+    "えー と",
+    "はいはい!",
+    "まあね",
+    "ん?",
+]
+_SEPARATORS = [
+    " ",
+    "、",
+    "。",
+    "?",
+    "!",
+    "\n",
+    "  ",
+    "、、",
+    "。 ",
+    " 、",
+    "\t",
+    "\u3000",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", GOLDEN)
+def test_golden_outputs_match_reference(text):
+    assert TranscriptPreprocessor()._remove_fillers(text) == _reference_remove_fillers(
+        text
+    )
+
+
+def test_random_transcripts_match_reference():
+    rng = random.Random(20260412)
+    preprocessor = TranscriptPreprocessor()
+    for _ in range(2000):
+        parts = []
+        for _ in range(rng.randint(0, 12)):
+            parts.append(rng.choice(_WORDS))
+            parts.append(rng.choice(_SEPARATORS))
+        text = "".join(parts)
+        assert preprocessor._remove_fillers(text) == _reference_remove_fillers(text), (
+            text
+        )
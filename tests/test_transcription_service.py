@@ -0,0 +1,146 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from vlog_capture.infrastructure import transcription_service
+from vlog_capture.infrastructure.settings import settings
+from vlog_capture.infrastructure.transcription_service import (
+    TranscriptionClient,
+    TranscriptionServer,
+)
+
+
+class StubTranscriber:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.unloads = 0
+
+    def transcribe_and_save(self, audio_path: str) -> tuple[str, str]:
+        if audio_path.endswith("broken.flac"):
+            raise ValueError("cannot decode")
+        self.calls.append(audio_path)
+        return (
+            f"text:{Path(audio_path).name}",
+            f"/transcripts/{Path(audio_path).stem}.txt",
+        )
+
+    def unload(self) -> None:
+        self.unloads += 1
+
+
+@pytest.fixture
+def server(tmp_path):
+    transcriber = StubTranscriber()
+    service = TranscriptionServer(
+        transcriber, socket_path=tmp_path / "t.sock", idle_seconds=0.2
+    )
+    thread = threading.Thread(target=service.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not service.socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    yield service, transcriber
+    service.shutdown()
+    thread.join(timeout=5)
+
+
+def test_client_round_trips_jobs_through_resident_service(server, tmp_path):
+    service, transcriber = server
+    client = TranscriptionClient(socket_path=service.socket_path)
+
+    first = client.transcribe_and_save(str(tmp_path / "20260412_120000.flac"))
+    second = client.transcribe_and_save(str(tmp_path / "20260412_121000.flac"))
+    client.unload()
+
+    assert first == ("text:20260412_120000.flac", "/transcripts/20260412_120000.txt")
+    assert second[0] == "text:20260412_121000.flac"
+    assert len(transcriber.calls) == 2
+    assert client.request({"op": "status"}) == {"ok": True, "loaded": True, "jobs": 2}
+    assert transcriber.unloads == 0
+
+
+def test_service_reports_job_errors_without_dying(server, tmp_path):
+    service, _ = server
+    client = TranscriptionClient(socket_path=service.socket_path)
+
+    with pytest.raises(RuntimeError, match="cannot decode"):
+        client.transcribe_and_save(str(tmp_path / "broken.flac"))
+    assert client.request({"op": "status"})["ok"] is True
+
+
+def test_service_unloads_model_after_idle_timeout(server, tmp_path):
+    service, transcriber = server
+    client = TranscriptionClient(socket_path=service.socket_path)
+    client.transcribe_and_save(str(tmp_path / "20260412_120000.flac"))
+
+    deadline = time.monotonic() + 5
+    while transcriber.unloads == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert transcriber.unloads == 1
+    assert client.request({"op": "status"})["loaded"] is False
+
+
+def test_client_falls_back_to_local_transcriber_without_service(tmp_path):
+    fallback = StubTranscriber()
+    client = TranscriptionClient(
+        socket_path=tmp_path / "missing.sock", fallback=fallback
+    )
+
+    text, _ = client.transcribe_and_save(str(tmp_path / "20260412_120000.flac"))
+    client.unload()
+
+    assert text == "text:20260412_120000.flac"
+    assert fallback.unloads == 1
+
+
+def test_make_transcriber_prefers_running_service(monkeypatch, tmp_path):
+    socket_path = tmp_path / "t.sock"
+    monkeypatch.setattr(settings, "transcription_socket", socket_path)
+    monkeypatch.setattr(settings, "transcription_service", True)
+    assert not isinstance(transcription_service.make_transcriber(), TranscriptionClient)
+
+    socket_path.touch()
+    assert isinstance(transcription_service.make_transcriber(), TranscriptionClient)
+
+
+def test_service_is_opt_in(monkeypatch, tmp_path):
+    socket_path = tmp_path / "t.sock"
+    socket_path.touch()
+    monkeypatch.setattr(settings, "transcription_socket", socket_path)
+
+    assert type(settings).model_fields["transcription_service"].default is False
+    monkeypatch.setattr(settings, "transcription_service", False)
+    assert not isinstance(transcription_service.make_transcriber(), TranscriptionClient)
+
+
+def test_client_raises_when_service_hangs(monkeypatch, tmp_path):
+    release = threading.Event()
+
+    class HungTranscriber(StubTranscriber):
+        def transcribe_and_save(self, audio_path: str) -> tuple[str, str]:
+            release.wait(5)
+            return super().transcribe_and_save(audio_path)
+
+    monkeypatch.setattr(settings, "transcription_timeout_seconds", 0.2)
+    monkeypatch.setattr(settings, "transcription_timeout_factor", 0.0)
+    service = TranscriptionServer(HungTranscriber(), socket_path=tmp_path / "t.sock")
+    thread = threading.Thread(target=service.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not service.socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    fallback = StubTranscriber()
+    client = TranscriptionClient(socket_path=service.socket_path, fallback=fallback)
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError, match="may still be running"):
+        client.transcribe_and_save(str(tmp_path / "20260412_120000.flac"))
+
+    # The service still owns the job, so no second model is loaded locally.
+    assert fallback.calls == []
+    assert time.monotonic() - started < 2
+    release.set()
+    service.shutdown()
+    thread.join(timeout=5)